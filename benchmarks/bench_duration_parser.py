@@ -0,0 +1,83 @@
+# benchmarks/bench_duration_parser.py
+
+"""
+Micro-benchmark of DurationParser.
+
+Compares the former multi-pass validation (token search, re-joining and comparing the matches,
+then a per-token loop) with the single-pass scan of DurationParser, on durations in the format
+of the data generator. The memo cache is disabled for the comparison and measured separately.
+The durations are drawn from a pool of distinct values, as real test statistics repeat them.
+The parse timings include emitting the 'unusual value' warnings through the Logger.
+
+Usage:
+    python benchmarks/bench_duration_parser.py [number of durations] [number of distinct durations]
+"""
+
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "sample_data")))
+
+from test_statistic_read_write._parser import DurationParser
+from generator import generate_duration
+
+PATTERN = re.compile(r'(-?\d+(\.\d+)?)\s+([a-zA-Z]+)', re.IGNORECASE)
+
+
+def multi_pass_parse(parser: DurationParser, value: str):
+    """The former DurationParser.parse, without logging."""
+    matches = list(PATTERN.finditer(value.lower()))
+    if not matches:
+        return None
+
+    matched_substrings = ''.join(m.group(0).replace(' ', '') for m in matches)
+    stripped_input = value.lower().replace(' ', '')
+    if matched_substrings != stripped_input:
+        return None
+
+    total_seconds = 0.0
+    used_units = set()
+    for match in matches:
+        numeric_value = float(match.group(1))
+        unit = match.group(3)
+        if numeric_value < 0 or unit not in parser.time_units or unit in used_units:
+            return None
+        used_units.add(unit)
+        total_seconds += numeric_value * parser.time_units[unit]
+
+    return total_seconds if total_seconds != 0.0 else None
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    random.seed(0)
+    pool = list(dict.fromkeys(generate_duration() for _ in range(distinct * 2)))[:distinct]
+    values = [random.choice(pool) for _ in range(count)]
+
+    uncached = DurationParser(cache_size=0)
+    cached = DurationParser()
+
+    for value in values:
+        assert multi_pass_parse(uncached, value) == uncached._parse_uncached(value)[0], value
+
+    timings = {
+        "multi-pass": min(timeit.repeat(lambda: [multi_pass_parse(uncached, v) for v in values], number=1, repeat=7)),
+        "single-pass": min(timeit.repeat(lambda: [uncached._parse_uncached(v) for v in values], number=1, repeat=7)),
+        "parse (cache off)": min(timeit.repeat(lambda: [uncached.parse(v) for v in values], number=1, repeat=7)),
+        "parse (cache on)": min(timeit.repeat(lambda: [cached.parse(v) for v in values], number=1, repeat=7)),
+    }
+
+    print(f"{count} durations, {len(set(values))} distinct")
+    baseline = timings["multi-pass"]
+    for name, seconds in timings.items():
+        print(f"  {name:<18} {seconds * 1e3:8.1f} ms   {baseline / seconds:5.2f}x")
+    print(f"  cache hit rate     {cached.cache_info()['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
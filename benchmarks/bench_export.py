@@ -0,0 +1,85 @@
+# benchmarks/bench_export.py
+
+"""
+Benchmark of CSVHandler.export_csv.
+
+Compares the former row-by-row export (one write call and one duration formatting per row) with
+the batched export, for Data and ColumnarData, sorted by Duration. The entries are generated
+in the format of the data generator, with durations drawn from a pool of distinct values as real
+test statistics repeat them. Both exports must produce the same bytes.
+
+Usage:
+    python benchmarks/bench_export.py [number of rows] [number of distinct durations]
+"""
+
+import builtins
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "sample_data")))
+
+from test_statistic_read_write._csv_handler import CSVHandler
+from test_statistic_read_write._data import Data, ColumnarData
+from test_statistic_read_write._parser import DurationParser
+from generator import generate_requirement, generate_test_case_name, generate_duration, generate_status
+
+
+def row_by_row_export(data: Data, export_file: str):
+    """The former CSVHandler.export_csv, sorted by Duration."""
+    with open(export_file, mode='w', encoding='utf-8') as f:
+        f.write("Requirement;Test Case;Duration;Status\n")
+        for cid in data.sorted_ids["Duration"]:
+            entry = data.data[cid]
+            duration = entry['Duration']
+            if duration < 1e-6:
+                formatted_duration = f"{duration:.9f}".rstrip("0").rstrip(".")
+            elif duration < 60:
+                formatted_duration = f"{duration:.6f}".rstrip("0").rstrip(".")
+            else:
+                formatted_duration = f"{duration:.3f}".rstrip("0").rstrip(".")
+            line = (f"{entry['Requirement']};"
+                    f"{entry['Test Case']};"
+                    f"{formatted_duration};"
+                    f"{entry['Status']}\n")
+            f.write(line)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    random.seed(0)
+    parser = DurationParser(cache_size=0)
+    pool = [parser.parse(generate_duration()) for _ in range(distinct)]
+
+    storages = {"Data": Data(), "ColumnarData": ColumnarData()}
+    for cid in range(1, count + 1):
+        entry = {"Requirement": generate_requirement(), "Test Case": generate_test_case_name(),
+                 "Duration": random.choice(pool), "Status": generate_status()}
+        for data in storages.values():
+            data.append_entry(cid, dict(entry))
+
+    print(f"{count} rows, {distinct} distinct durations")
+    print_ = builtins.print
+    with tempfile.TemporaryDirectory() as folder:
+        handler = CSVHandler(os.path.join(folder, "bench.csv"))
+        former = os.path.join(folder, "former.csv")
+        batched = os.path.join(folder, handler._generate_output_filename("Duration"))
+        for name, data in storages.items():
+            data.build_index("Duration")
+            row_by_row = min(timeit.repeat(lambda: row_by_row_export(data, former), number=1, repeat=5))
+            builtins.print = lambda *args, **kwargs: None
+            try:
+                batch = min(timeit.repeat(lambda: handler.export_csv(data, folder, "Duration"), number=1, repeat=5))
+            finally:
+                builtins.print = print_
+            with open(former, "rb") as f, open(batched, "rb") as g:
+                assert f.read() == g.read()
+            print(f"  {name:<13} row-by-row {row_by_row * 1e3:8.1f} ms   batched {batch * 1e3:8.1f} ms   {row_by_row / batch:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,75 @@
 tests_info = {
+    # Aggregators
+    "D-T-AGG-TOP-001": {
+        "Test Name": "Aggregators - Streaming Top X Matches Heap Selection",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Top X",
+        "Test Code": "test_aggregators.py::test_top_x_matches_select_top_x"
+    },
+    "D-T-AGG-STR-001": {
+        "Test Name": "Aggregators - Streaming Analysis Matches Analyser",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Streaming Analysis",
+        "Test Code": "test_aggregators.py::test_streaming_analysis_matches_analyze"
+    },
+    "D-T-AGG-SKE-001": {
+        "Test Name": "Aggregators - Duration Sketch Accuracy",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Duration Sketch",
+        "Test Code": "test_aggregators.py::test_duration_sketch_accuracy"
+    },
+    "D-T-AGG-SKE-002": {
+        "Test Name": "Aggregators - Duration Sketch Merge",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Duration Sketch",
+        "Test Code": "test_aggregators.py::test_duration_sketch_merge"
+    },
+    "D-T-AGG-SKE-003": {
+        "Test Name": "Aggregators - Duration Sketch Edge Cases",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Duration Sketch",
+        "Test Code": "test_aggregators.py::test_duration_sketch_edge_cases"
+    },
+    "D-T-AGG-STR-002": {
+        "Test Name": "Aggregators - Streaming Analysis Percentiles",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Streaming Analysis",
+        "Test Code": "test_aggregators.py::test_streaming_analysis_percentiles"
+    },
+    "D-T-AGG-GRP-001": {
+        "Test Name": "Aggregators - Group By",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Group By",
+        "Test Code": "test_aggregators.py::test_group_by"
+    },
+    "D-T-AGG-STR-003": {
+        "Test Name": "Aggregators - Streaming Analysis Group By",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Streaming Analysis",
+        "Test Code": "test_aggregators.py::test_streaming_analysis_group_by"
+    },
+    "D-T-AGG-INC-001": {
+        "Test Name": "Aggregators - Incremental Analysis",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Incremental Analysis",
+        "Test Code": "test_aggregators.py::test_incremental_analysis_matches_analyze"
+    },
+    "D-T-AGG-SUM-001": {
+        "Test Name": "Aggregators - Exact Total Duration",
+        "Source": "Developer",
+        "Module": "Aggregators",
+        "Category": "Total Duration",
+        "Test Code": "test_aggregators.py::test_exact_sum"
+    },
     # Analyser
     "D-T-AN-AN-001": {
         "Test Name": "Analyser - Analyze",
@@ -49,9 +120,81 @@ tests_info = {
         "Category": "Get Top X",
         "Test Code": "test_analyser.py::test_analyser.py::test_get_zero_top_x_entries"
     },
+    "D-T-AN-GTX-005": {
+        "Test Name": "Analyser - Top X Entries Without Duration Index",
+        "Source": "Developer",
+        "Module": "Analyser",
+        "Category": "Get Top X",
+        "Test Code": "test_analyser.py::test_get_top_x_entries_without_duration_index"
+    },
+    "D-T-AN-GDU-002": {
+        "Test Name": "Analyser - Analyze Without Sorting",
+        "Source": "Developer",
+        "Module": "Analyser",
+        "Category": "Get Duration",
+        "Test Code": "test_analyser.py::test_analyze_does_not_sort"
+    },
+    "D-T-AN-PCT-001": {
+        "Test Name": "Analyser - Analyze With Percentiles",
+        "Source": "Developer",
+        "Module": "Analyser",
+        "Category": "Percentiles",
+        "Test Code": "test_analyser.py::test_analyze_percentiles"
+    },
+    "D-T-AN-GRP-001": {
+        "Test Name": "Analyser - Analyze With Group By",
+        "Source": "Developer",
+        "Module": "Analyser",
+        "Category": "Group By",
+        "Test Code": "test_analyser.py::test_analyze_group_by"
+    },
+    "D-T-AN-INC-001": {
+        "Test Name": "Analyser - Create Incremental",
+        "Source": "Developer",
+        "Module": "Analyser",
+        "Category": "Incremental Analysis",
+        "Test Code": "test_analyser.py::test_create_incremental"
+    },
+    "D-T-AN-PCT-002": {
+        "Test Name": "Analyser - Percentiles With Status 'All'",
+        "Source": "Developer",
+        "Module": "Analyser",
+        "Category": "Percentiles",
+        "Test Code": "test_analyser.py::test_analyze_percentiles_status_all"
+    },
     
 
 
+    # Cache
+    "D-T-CAC-ENT-001": {
+        "Test Name": "Cache - Entries",
+        "Source": "Developer",
+        "Module": "Cache",
+        "Category": "Cache Entries",
+        "Test Code": "test_cache.py::test_cache_entries"
+    },
+    "D-T-CAC-LRU-001": {
+        "Test Name": "Cache - LRU Eviction And Clearing",
+        "Source": "Developer",
+        "Module": "Cache",
+        "Category": "Eviction",
+        "Test Code": "test_cache.py::test_cache_eviction"
+    },
+    # Checkpoint
+    "D-T-CKP-SEG-001": {
+        "Test Name": "Checkpoint - Segments",
+        "Source": "Developer",
+        "Module": "Checkpoint",
+        "Category": "Segments",
+        "Test Code": "test_checkpoint.py::test_checkpoint_segments"
+    },
+    "D-T-CKP-INV-001": {
+        "Test Name": "Checkpoint - Rejected Checkpoints",
+        "Source": "Developer",
+        "Module": "Checkpoint",
+        "Category": "Validation",
+        "Test Code": "test_checkpoint.py::test_checkpoint_rejected"
+    },
     # CLI
     "D-T-CLI-ACX-001": {
         "Test Name": "CLI - Accepts Custom X",
@@ -130,6 +273,104 @@ tests_info = {
         "Category": "Unexpected Exception",
         "Test Code": "test_cli.py::test_unexpected_exception"
     },
+    "D-T-CLI-JOB-001": {
+        "Test Name": "CLI - Jobs Argument",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Argument Parsing",
+        "Test Code": "test_cli.py::test_cli_jobs"
+    },
+    "D-T-CLI-MAP-001": {
+        "Test Name": "CLI - Mmap Argument",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Argument Parsing",
+        "Test Code": "test_cli.py::test_cli_mmap"
+    },
+    "D-T-CLI-ASY-001": {
+        "Test Name": "CLI - Async Log Argument",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Argument Parsing",
+        "Test Code": "test_cli.py::test_cli_async_log"
+    },
+    "D-T-CLI-SKP-001": {
+        "Test Name": "CLI - Skip Reporting Arguments",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Argument Parsing",
+        "Test Code": "test_cli.py::test_cli_skip_reporting"
+    },
+    "D-T-CLI-REP-001": {
+        "Test Name": "CLI - Report-Only Argument",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Argument Parsing",
+        "Test Code": "test_cli.py::test_cli_report_only"
+    },
+    "D-T-CLI-PCT-001": {
+        "Test Name": "CLI - Percentiles Argument",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Argument Parsing",
+        "Test Code": "test_cli.py::test_cli_percentiles"
+    },
+    "D-T-CLI-GRP-001": {
+        "Test Name": "CLI - Group By Arguments",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Argument Parsing",
+        "Test Code": "test_cli.py::test_cli_group_by"
+    },
+    "D-T-CLI-SNP-001": {
+        "Test Name": "CLI - Snapshot Argument",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Snapshot",
+        "Test Code": "test_cli.py::test_cli_snapshot"
+    },
+    "D-T-CLI-CAC-001": {
+        "Test Name": "CLI - Cache Arguments",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Cache",
+        "Test Code": "test_cli.py::test_cli_cache"
+    },
+    "D-T-CLI-MSK-001": {
+        "Test Name": "CLI - Multiple Sort Keys",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Sort Key",
+        "Test Code": "test_cli.py::test_cli_multiple_sort_keys"
+    },
+    "D-T-CLI-CMP-001": {
+        "Test Name": "CLI - Compression Options",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Compression",
+        "Test Code": "test_cli.py::test_cli_compression"
+    },
+    "D-T-CLI-MUL-001": {
+        "Test Name": "CLI - Multiple Inputs",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Input Paths",
+        "Test Code": "test_cli.py::test_cli_multiple_inputs"
+    },
+    "D-T-CLI-FOL-001": {
+        "Test Name": "CLI - Follow Mode",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Follow Mode",
+        "Test Code": "test_cli.py::test_cli_follow"
+    },
+    "D-T-CLI-CKP-001": {
+        "Test Name": "CLI - Checkpoint",
+        "Source": "Developer",
+        "Module": "CLI",
+        "Category": "Checkpoint",
+        "Test Code": "test_cli.py::test_cli_checkpoint"
+    },
 
 
     # CSV Handler
@@ -231,6 +472,146 @@ tests_info = {
         "Category": "Read CSV",
         "Test Code": "test_csv_handler.py::test_read_csv_status_parser_returns_none"
     },
+    "D-T-CSV-RDC-012": {
+        "Test Name": "CSV Handler - Read CSV Columnar",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Read CSV",
+        "Test Code": "test_csv_handler.py::test_read_csv_columnar"
+    },
+    "D-T-CSV-RDC-013": {
+        "Test Name": "CSV Handler - Read CSV Streams In Chunks",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Read CSV",
+        "Test Code": "test_csv_handler.py::test_read_csv_streams_in_chunks"
+    },
+    "D-T-CSV-RDC-014": {
+        "Test Name": "CSV Handler - Read CSV Undecodable File",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Read CSV",
+        "Test Code": "test_csv_handler.py::test_read_csv_undecodable_file"
+    },
+    "D-T-CSV-PAR-001": {
+        "Test Name": "CSV Handler - Parallel Read Matches Serial",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Parallel Read",
+        "Test Code": "test_csv_handler.py::test_read_csv_parallel_matches_serial"
+    },
+    "D-T-CSV-PAR-002": {
+        "Test Name": "CSV Handler - Parallel Read Errors",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Parallel Read",
+        "Test Code": "test_csv_handler.py::test_read_csv_parallel_errors"
+    },
+    "D-T-CSV-MAP-001": {
+        "Test Name": "CSV Handler - Memory-Mapped Read Matches Streaming",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Memory-Mapped Read",
+        "Test Code": "test_csv_handler.py::test_read_csv_mmap_matches_serial"
+    },
+    "D-T-CSV-MAP-002": {
+        "Test Name": "CSV Handler - Memory-Mapped Read Errors",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Memory-Mapped Read",
+        "Test Code": "test_csv_handler.py::test_read_csv_mmap_errors"
+    },
+    "D-T-CSV-SKP-001": {
+        "Test Name": "CSV Handler - Aggregated Skip Reporting",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Skipped Line Reporting",
+        "Test Code": "test_csv_handler.py::test_read_csv_aggregate_skips"
+    },
+    "D-T-CSV-SKP-002": {
+        "Test Name": "CSV Handler - Quarantine File",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Skipped Line Reporting",
+        "Test Code": "test_csv_handler.py::test_read_csv_quarantine"
+    },
+    "D-T-CSV-SKP-003": {
+        "Test Name": "CSV Handler - Quarantine File Write Error",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Skipped Line Reporting",
+        "Test Code": "test_csv_handler.py::test_read_csv_quarantine_write_error"
+    },
+    "D-T-CSV-STR-001": {
+        "Test Name": "CSV Handler - Read Into Streaming Target",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Streaming Analysis",
+        "Test Code": "test_csv_handler.py::test_read_csv_streaming_target"
+    },
+    "D-T-CSV-SNP-001": {
+        "Test Name": "CSV Handler - Read CSV With Snapshot",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Snapshot",
+        "Test Code": "test_csv_handler.py::test_read_csv_snapshot"
+    },
+    "D-T-CSV-GLD-001": {
+        "Test Name": "CSV Handler - Export Golden Files",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Export CSV",
+        "Test Code": "test_csv_handler.py::test_export_csv_golden"
+    },
+    "D-T-CSV-MUL-001": {
+        "Test Name": "CSV Handler - Export Multiple Sort Keys",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Export CSV",
+        "Test Code": "test_csv_handler.py::test_export_csv_multiple_sort_keys"
+    },
+    "D-T-CSV-CMP-001": {
+        "Test Name": "CSV Handler - Compressed Input and Export",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Compression",
+        "Test Code": "test_csv_handler.py::test_compressed_input_and_export"
+    },
+    "D-T-CSV-CMP-002": {
+        "Test Name": "CSV Handler - Compression Errors",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Compression",
+        "Test Code": "test_csv_handler.py::test_compression_errors"
+    },
+    "D-T-CSV-CKP-001": {
+        "Test Name": "CSV Handler - Resume From Checkpoint",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Checkpoint",
+        "Test Code": "test_csv_handler.py::test_read_csv_resume_from_checkpoint"
+    },
+    "D-T-CSV-CKP-002": {
+        "Test Name": "CSV Handler - Checkpoint Fallbacks",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Checkpoint",
+        "Test Code": "test_csv_handler.py::test_read_csv_checkpoint_fallbacks"
+    },
+    "D-T-CSV-PAR-003": {
+        "Test Name": "CSV Handler - Parallel Lone Carriage Returns",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Parallel Ingest",
+        "Test Code": "test_csv_handler.py::test_read_csv_parallel_lone_carriage_returns"
+    },
+    "D-T-CSV-CRL-001": {
+        "Test Name": "CSV Handler - CR-Only Line Endings",
+        "Source": "Developer",
+        "Module": "CSV Handler",
+        "Category": "Line Endings",
+        "Test Code": "test_csv_handler.py::test_read_csv_cr_only_line_endings"
+    },
 
     # Data
     "D-T-DAT-AEW-001": {
@@ -254,6 +635,13 @@ tests_info = {
         "Category": "Add Single Entry",
         "Test Code": "test_data.py::test_add_single_entry"
     },
+    "D-T-DAT-BLK-001": {
+        "Test Name": "Data - Bulk Build Matches Incremental Insertion",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Bulk Load",
+        "Test Code": "test_data.py::test_bulk_build_matches_incremental_insertion"
+    },
     "D-T-DAT-CSC-001": {
         "Test Name": "Data - Count Statuses",
         "Source": "Developer",
@@ -268,7 +656,92 @@ tests_info = {
         "Category": "Initial State",
         "Test Code": "test_data.py::test_initial_state"
     },
+    "D-T-DAT-COL-001": {
+        "Test Name": "Data - Columnar Data Matches Data",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Columnar Storage",
+        "Test Code": "test_data.py::test_columnar_data_matches_data"
+    },
+    "D-T-DAT-COL-002": {
+        "Test Name": "Data - Columnar Data Non-Consecutive IDs",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Columnar Storage",
+        "Test Code": "test_data.py::test_columnar_data_non_consecutive_ids"
+    },
+    "D-T-DAT-LZY-001": {
+        "Test Name": "Data - Indexes Are Built Lazily",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Lazy Indexes",
+        "Test Code": "test_data.py::test_indexes_are_built_lazily"
+    },
+    "D-T-DAT-LZY-002": {
+        "Test Name": "Data - Lazy Indexes With Incremental Insertion",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Lazy Indexes",
+        "Test Code": "test_data.py::test_lazy_indexes_with_incremental_insertion"
+    },
+    "D-T-DAT-RCC-001": {
+        "Test Name": "Data - Requirement Sort Key Cache",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Requirement Cache",
+        "Test Code": "test_data.py::test_requirement_sort_key_cache"
+    },
+    "D-T-DAT-COL-003": {
+        "Test Name": "Data - Columns Of Entries",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Columnar Storage",
+        "Test Code": "test_data.py::test_columns_of"
+    },
+    "D-T-DAT-MRG-001": {
+        "Test Name": "Data - Merge Parts",
+        "Source": "Developer",
+        "Module": "Data",
+        "Category": "Merge",
+        "Test Code": "test_data.py::test_merged"
+    },
 
+    # Follower
+    "D-T-FOL-INC-001": {
+        "Test Name": "Follower - Parse Appended Lines",
+        "Source": "Developer",
+        "Module": "Follower",
+        "Category": "Incremental Read",
+        "Test Code": "test_follower.py::test_follow_appended_lines"
+    },
+    "D-T-FOL-ERR-001": {
+        "Test Name": "Follower - Stream Target and Errors",
+        "Source": "Developer",
+        "Module": "Follower",
+        "Category": "Error Handling",
+        "Test Code": "test_follower.py::test_follow_into_stream_and_errors"
+    },
+    "D-T-FOL-INT-001": {
+        "Test Name": "Follower - Interrupted Poll",
+        "Source": "Developer",
+        "Module": "Follower",
+        "Category": "Incremental Read",
+        "Test Code": "test_follower.py::test_follow_interrupted_poll"
+    },
+    "D-T-FOL-FIN-001": {
+        "Test Name": "Follower - Final Poll",
+        "Source": "Developer",
+        "Module": "Follower",
+        "Category": "Incremental Read",
+        "Test Code": "test_follower.py::test_follow_final_poll"
+    },
+    "D-T-FOL-CRL-001": {
+        "Test Name": "Follower - CR-Only Line Endings",
+        "Source": "Developer",
+        "Module": "Follower",
+        "Category": "Incremental Read",
+        "Test Code": "test_follower.py::test_follow_cr_only_line_endings"
+    },
     # Logger
     "D-T-LOG-EMS-001": {
         "Test Name": "Logger - Log Empty String",
@@ -340,7 +813,78 @@ tests_info = {
         "Category": "Log Warning",
         "Test Code": "test_logger.py::test_log_warning"
     },
+    "D-T-LOG-ENA-001": {
+        "Test Name": "Logger - Level Check",
+        "Source": "Developer",
+        "Module": "Logger",
+        "Category": "Level Check",
+        "Test Code": "test_logger.py::test_is_enabled_for"
+    },
+    "D-T-LOG-ENA-002": {
+        "Test Name": "Logger - Level Check With Other Handlers",
+        "Source": "Developer",
+        "Module": "Logger",
+        "Category": "Level Check",
+        "Test Code": "test_logger.py::test_is_enabled_for_other_handlers"
+    },
+    "D-T-LOG-ARG-001": {
+        "Test Name": "Logger - Deferred Message Arguments",
+        "Source": "Developer",
+        "Module": "Logger",
+        "Category": "Logging",
+        "Test Code": "test_logger.py::test_log_deferred_arguments"
+    },
+    "D-T-LOG-ASY-001": {
+        "Test Name": "Logger - Asynchronous Mode",
+        "Source": "Developer",
+        "Module": "Logger",
+        "Category": "Asynchronous Logging",
+        "Test Code": "test_logger.py::test_async_logging"
+    },
+    "D-T-LOG-ASY-002": {
+        "Test Name": "Logger - Asynchronous Mode Log Folder Change",
+        "Source": "Developer",
+        "Module": "Logger",
+        "Category": "Asynchronous Logging",
+        "Test Code": "test_logger.py::test_async_logging_change_log_folder"
+    },
+    "D-T-LOG-ASY-003": {
+        "Test Name": "Logger - Asynchronous Mode In Forked Child",
+        "Source": "Developer",
+        "Module": "Logger",
+        "Category": "Asynchronous Logging",
+        "Test Code": "test_logger.py::test_async_logging_forked_child"
+    },
+    "D-T-LOG-ENA-003": {
+        "Test Name": "Logger - Level Check With caplog",
+        "Source": "Developer",
+        "Module": "Logger",
+        "Category": "Level Check",
+        "Test Code": "test_logger.py::test_is_enabled_for_caplog"
+    },
 
+    # Multi CSV Handler
+    "D-T-MCS-EXP-001": {
+        "Test Name": "Multi CSV Handler - Expand Input Paths",
+        "Source": "Developer",
+        "Module": "Multi CSV Handler",
+        "Category": "Input Paths",
+        "Test Code": "test_multi_csv_handler.py::test_expand_input_paths"
+    },
+    "D-T-MCS-RDC-001": {
+        "Test Name": "Multi CSV Handler - Read Multiple Files",
+        "Source": "Developer",
+        "Module": "Multi CSV Handler",
+        "Category": "Read CSV",
+        "Test Code": "test_multi_csv_handler.py::test_read_multiple_files"
+    },
+    "D-T-MCS-STR-001": {
+        "Test Name": "Multi CSV Handler - Read Into Target",
+        "Source": "Developer",
+        "Module": "Multi CSV Handler",
+        "Category": "Streaming",
+        "Test Code": "test_multi_csv_handler.py::test_read_multiple_files_into_target"
+    },
     # tsrw, orchestrator
     "D-T-ORC-LFC-001": {
         "Test Name": "Orchestrator - Log Folder Creation Failure",
@@ -384,6 +928,97 @@ tests_info = {
         "Category": "Set Sort Key",
         "Test Code": "test_test_statistic_read_write.py::test_set_sort_key"
     },
+    "D-T-ORC-JOB-001": {
+        "Test Name": "Orchestrator - Set Invalid Jobs",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Jobs",
+        "Test Code": "test_test_statistic_read_write.py::test_set_invalid_jobs"
+    },
+    "D-T-ORC-ASY-001": {
+        "Test Name": "Orchestrator - Set Async Log",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Logging",
+        "Test Code": "test_test_statistic_read_write.py::test_set_async_log"
+    },
+    "D-T-ORC-REP-001": {
+        "Test Name": "Orchestrator - Report-Only Run",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Run",
+        "Test Code": "test_test_statistic_read_write.py::test_run_report_only"
+    },
+    "D-T-ORC-PCT-001": {
+        "Test Name": "Orchestrator - Run With Percentiles",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Run",
+        "Test Code": "test_test_statistic_read_write.py::test_run_percentiles"
+    },
+    "D-T-ORC-GRP-001": {
+        "Test Name": "Orchestrator - Run With Group By",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Run",
+        "Test Code": "test_test_statistic_read_write.py::test_run_group_by"
+    },
+    "D-T-ORC-SNP-001": {
+        "Test Name": "Orchestrator - Snapshot Option",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Snapshot",
+        "Test Code": "test_test_statistic_read_write.py::test_snapshot_option"
+    },
+    "D-T-ORC-CAC-001": {
+        "Test Name": "Orchestrator - Run With Cache",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Cache",
+        "Test Code": "test_test_statistic_read_write.py::test_run_with_cache"
+    },
+    "D-T-ORC-MSK-001": {
+        "Test Name": "Orchestrator - Multiple Sort Keys",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Sort Key",
+        "Test Code": "test_test_statistic_read_write.py::test_multiple_sort_keys"
+    },
+    "D-T-ORC-CMP-001": {
+        "Test Name": "Orchestrator - Compressed Run",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Compression",
+        "Test Code": "test_test_statistic_read_write.py::test_run_compressed"
+    },
+    "D-T-ORC-MUL-001": {
+        "Test Name": "Orchestrator - Multiple Input Files",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Input Paths",
+        "Test Code": "test_test_statistic_read_write.py::test_run_multiple_files"
+    },
+    "D-T-ORC-FOL-001": {
+        "Test Name": "Orchestrator - Follow Mode",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Follow Mode",
+        "Test Code": "test_test_statistic_read_write.py::test_run_follow"
+    },
+    "D-T-ORC-CKP-001": {
+        "Test Name": "Orchestrator - Checkpointed Run",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Checkpoint",
+        "Test Code": "test_test_statistic_read_write.py::test_run_checkpoint"
+    },
+    "D-T-ORC-FOL-002": {
+        "Test Name": "Orchestrator - Follow Mode Interrupted While Reading",
+        "Source": "Developer",
+        "Module": "Orchestrator",
+        "Category": "Follow Mode",
+        "Test Code": "test_test_statistic_read_write.py::test_run_follow_interrupted_while_reading"
+    },
 
 
     # Parser
@@ -450,6 +1085,41 @@ tests_info = {
         "Category": "Test Case Valid",
         "Test Code": "test_parser.py::test_test_case_parser_valid_spaces"
     },
+    "D-T-PAR-DPC-001": {
+        "Test Name": "Parser - Duration Cache Hit",
+        "Source": "Developer",
+        "Module": "Parser",
+        "Category": "Duration Cache",
+        "Test Code": "test_parser.py::test_duration_parser_cache_hit"
+    },
+    "D-T-PAR-DPC-002": {
+        "Test Name": "Parser - Duration Cache Eviction",
+        "Source": "Developer",
+        "Module": "Parser",
+        "Category": "Duration Cache",
+        "Test Code": "test_parser.py::test_duration_parser_cache_eviction"
+    },
+    "D-T-PAR-DPC-003": {
+        "Test Name": "Parser - Duration Cache Disabled",
+        "Source": "Developer",
+        "Module": "Parser",
+        "Category": "Duration Cache",
+        "Test Code": "test_parser.py::test_duration_parser_cache_disabled"
+    },
+    "D-T-PAR-DPV-003": {
+        "Test Name": "Parser - Duration Single-Pass Check Order",
+        "Source": "Developer",
+        "Module": "Parser",
+        "Category": "Duration Parsing",
+        "Test Code": "test_parser.py::test_duration_parser_single_pass_order"
+    },
+    "D-T-PAR-DFM-001": {
+        "Test Name": "Parser - Duration Formatter",
+        "Source": "Developer",
+        "Module": "Parser",
+        "Category": "Duration Formatter",
+        "Test Code": "test_parser.py::test_duration_formatter"
+    },
 
 
     # Printer
@@ -509,6 +1179,35 @@ tests_info = {
         "Category": "Get Width Longer values",
         "Test Code": "test_printer.py::test_get_width_with_longer_data_values"
     },
+    "D-T-PRI-DDO-001": {
+        "Test Name": "Printer - Display Duration Distribution",
+        "Source": "Developer",
+        "Module": "Printer",
+        "Category": "Display Results Distribution",
+        "Test Code": "test_printer.py::test_display_results_distribution"
+    },
+    "D-T-PRI-DGO-001": {
+        "Test Name": "Printer - Display Groups",
+        "Source": "Developer",
+        "Module": "Printer",
+        "Category": "Display Results Groups",
+        "Test Code": "test_printer.py::test_display_results_groups"
+    },
+    # Snapshot
+    "D-T-SNP-RTR-001": {
+        "Test Name": "Snapshot - Round Trip",
+        "Source": "Developer",
+        "Module": "Snapshot",
+        "Category": "Round Trip",
+        "Test Code": "test_snapshot.py::test_snapshot_round_trip"
+    },
+    "D-T-SNP-INV-001": {
+        "Test Name": "Snapshot - Rejected Snapshots",
+        "Source": "Developer",
+        "Module": "Snapshot",
+        "Category": "Invalid Snapshot",
+        "Test Code": "test_snapshot.py::test_snapshot_rejected"
+    },
 }
 
 import os
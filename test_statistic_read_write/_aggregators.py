@@ -0,0 +1,602 @@
+# test_statistic_read_write/_aggregators.py
+
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+def select_top_x(ids: Sequence[int], durations: Sequence[float], top_x: int) -> List[int]:
+    """
+    Selects the IDs of the X entries with the longest durations with a bounded heap.
+
+    Needs O(X) additional memory and O(N log X) time. Entries with equal durations keep their
+    insertion order, which is the order the Duration index returns them in.
+
+    Args:
+        ids (Sequence[int]): The IDs of all entries in insertion order.
+        durations (Sequence[float]): The durations of all entries in insertion order.
+        top_x (int): The number of IDs to select.
+
+    Returns:
+        List[int]: The selected IDs, longest duration first.
+    """
+    if top_x <= 0:
+        return []
+    positions = heapq.nlargest(top_x, range(len(durations)), key=durations.__getitem__)
+    return [ids[pos] for pos in positions]
+
+class TopX:
+    """
+    Streaming selection of the X entries with the longest durations.
+
+    Keeps a bounded min-heap of at most X candidates, so the top X of N offered entries are
+    selected in O(X) memory and O(N log X) time. The result is identical to `select_top_x`:
+    longest duration first, entries with equal durations in the order they were offered.
+    """
+
+    def __init__(self, top_x: int):
+        """
+        Args:
+            top_x (int): The number of entries to keep. 0 keeps none.
+        """
+        self.top_x = top_x
+        # Min-heap of (duration, -sequence number, ID, entry). The negated sequence number makes a
+        # later entry compare lower than an earlier one with the same duration, so the earlier one is kept.
+        self._heap: List[Tuple[float, int, int, Dict[str, Any]]] = []
+        self._sequence = 0
+
+    def add(self, key: int, entry: Dict[str, Any]):
+        """
+        Offers an entry to the selection.
+
+        Args:
+            key (int): The ID of the entry.
+            entry (Dict[str, Any]): The entry's data, with at least the key "Duration".
+        """
+        if self.top_x <= 0:
+            return
+        self._sequence -= 1
+        heap = self._heap
+        if len(heap) < self.top_x:
+            heapq.heappush(heap, (entry["Duration"], self._sequence, key, entry))
+        elif (entry["Duration"], self._sequence) > heap[0][:2]:
+            heapq.heapreplace(heap, (entry["Duration"], self._sequence, key, entry))
+
+    def result(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Returns the selected entries.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: (ID, entry) tuples, longest duration first.
+        """
+        ordered = sorted(self._heap, key=lambda item: item[:2], reverse=True)
+        return [(key, entry) for _, _, key, entry in ordered]
+
+
+class ExactSum:
+    """
+    Running float sum without rounding errors (Shewchuk's algorithm, as used by `math.fsum`).
+
+    The sum is kept as a short list of non-overlapping partial sums, so `value()` equals `math.fsum`
+    over all added values, independent of their order and of how often the value is taken.
+    """
+
+    def __init__(self):
+        self._partials: List[float] = []
+
+    def add(self, value: float):
+        """
+        Adds a value to the sum.
+
+        Args:
+            value (float): The value to add.
+        """
+        partials = self._partials
+        i = 0
+        for partial in partials:
+            if abs(value) < abs(partial):
+                value, partial = partial, value
+            high = value + partial
+            low = partial - (high - value)
+            if low:
+                partials[i] = low
+                i += 1
+            value = high
+        partials[i:] = [value]
+
+    def value(self) -> float:
+        """
+        Returns:
+            float: The correctly rounded sum of all added values.
+        """
+        return math.fsum(self._partials)
+
+
+class DurationSketch:
+    """
+    Mergeable sketch of a duration distribution (DDSketch-style log-bucket histogram).
+
+    A duration v > 0 is counted in the bucket i with gamma^(i-1) < v <= gamma^i, where
+    gamma = (1 + alpha) / (1 - alpha). Any quantile is answered with a relative error of at most
+    `alpha`, from a number of buckets that grows with the logarithm of the value range only, not
+    with the number of durations. Two sketches with the same `alpha` are merged by adding their
+    bucket counts, so sketches of shards or files can be combined without the raw durations.
+
+    In addition, the exact counts per decade ([0.1, 1), [1, 10), ... seconds) are kept for a
+    coarse log-scale histogram.
+    """
+
+    # Default relative accuracy of the quantiles
+    RELATIVE_ACCURACY = 0.01
+
+    def __init__(self, alpha: float = RELATIVE_ACCURACY):
+        """
+        Args:
+            alpha (float, optional): Relative accuracy of the quantiles, between 0 and 1 (exclusive).
+                                     Defaults to RELATIVE_ACCURACY.
+
+        Raises:
+            ValueError: If alpha is not between 0 and 1.
+        """
+        if not 0 < alpha < 1:
+            raise ValueError(f"Invalid relative accuracy {alpha}. Must be between 0 and 1.")
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.decades: Dict[int, int] = {}
+        # Durations <= 0 cannot be placed in a log bucket
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1):
+        """
+        Adds a duration to the sketch.
+
+        Args:
+            value (float): The duration in seconds.
+            count (int, optional): How many times the duration occurred. Defaults to 1.
+        """
+        self.count += count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero_count += count
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        decade = math.floor(math.log10(value))
+        self.decades[decade] = self.decades.get(decade, 0) + count
+
+    def merge(self, other: "DurationSketch"):
+        """
+        Adds the counts of another sketch to this one.
+
+        Args:
+            other (DurationSketch): A sketch with the same relative accuracy.
+
+        Raises:
+            ValueError: If the relative accuracies differ.
+        """
+        if other.alpha != self.alpha:
+            raise ValueError(f"Cannot merge sketches with relative accuracy {other.alpha} and {self.alpha}.")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        for decade, count in other.decades.items():
+            self.decades[decade] = self.decades.get(decade, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DurationSketch):
+            return NotImplemented
+        return (self.alpha, self.buckets, self.decades, self.zero_count, self.count, self.min, self.max) == \
+               (other.alpha, other.buckets, other.decades, other.zero_count, other.count, other.min, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the approximate q-quantile of the added durations.
+
+        Args:
+            q (float): The quantile, between 0 and 1 (e.g. 0.99 for p99).
+
+        Returns:
+            Optional[float]: A value within `alpha` relative error of the exact quantile
+            (lower quantile, rank q * (count - 1)), or None if the sketch is empty. The
+            minimum (q = 0) and maximum (q = 1) are exact.
+
+        Raises:
+            ValueError: If q is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Invalid quantile {q}. Must be between 0 and 1.")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        # The extremes are known exactly
+        if rank == 0:
+            return self.min
+        if rank >= self.count - 1:
+            return self.max
+
+        cumulative = self.zero_count
+        if cumulative > rank:
+            return max(self.min, 0.0)
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            if cumulative > rank:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the state of the sketch as JSON serializable dictionary, see `from_dict`."""
+        return {"alpha": self.alpha, "buckets": list(self.buckets.items()), "decades": list(self.decades.items()),
+                "zero_count": self.zero_count, "count": self.count, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "DurationSketch":
+        """
+        Restores a sketch from the dictionary returned by `to_dict`.
+
+        Raises:
+            ValueError, KeyError, TypeError: If the dictionary is not a valid sketch state.
+        """
+        sketch = cls(state["alpha"])
+        sketch.buckets = {int(index): int(count) for index, count in state["buckets"]}
+        sketch.decades = {int(decade): int(count) for decade, count in state["decades"]}
+        sketch.zero_count, sketch.count = int(state["zero_count"]), int(state["count"])
+        sketch.min, sketch.max = float(state["min"]), float(state["max"])
+        return sketch
+
+    def histogram(self) -> List[Tuple[float, int]]:
+        """
+        Returns the log-scale histogram of the durations.
+
+        Returns:
+            List[Tuple[float, int]]: (lower bound in seconds, count) per decade [10^k, 10^(k+1)), ascending,
+            only for decades with at least one duration. Durations <= 0 are not included.
+        """
+        return [(10.0 ** decade, self.decades[decade]) for decade in sorted(self.decades)]
+
+
+class GroupStats:
+    """
+    Running duration statistics of one group (e.g. one requirement): count, sum, min, max, mean
+    and the number of entries per status. Two GroupStats are merged by combining their fields.
+    """
+    __slots__ = ("count", "total", "min", "max", "status_counts")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.status_counts: Dict[str, int] = {}
+
+    def add(self, duration: float, status: str):
+        """
+        Adds one entry to the group.
+
+        Args:
+            duration (float): The duration of the entry in seconds.
+            status (str): The status of the entry.
+        """
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def merge(self, other: "GroupStats"):
+        """
+        Adds the statistics of another group to this one.
+
+        Args:
+            other (GroupStats): The statistics to add.
+        """
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for status, count in other.status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+
+    @property
+    def mean(self) -> float:
+        """The mean duration of the group, 0.0 for an empty group."""
+        return self.total / self.count if self.count else 0.0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GroupStats):
+            return NotImplemented
+        return (self.count, self.total, self.min, self.max, self.status_counts) == \
+               (other.count, other.total, other.min, other.max, other.status_counts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as JSON serializable dictionary, see `from_dict`."""
+        return {"count": self.count, "total": self.total, "min": self.min, "max": self.max,
+                "status_counts": dict(self.status_counts)}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "GroupStats":
+        """
+        Restores statistics from the dictionary returned by `to_dict`.
+
+        Raises:
+            KeyError, TypeError, ValueError: If the dictionary is not valid group statistics.
+        """
+        stats = cls()
+        stats.count, stats.total = int(state["count"]), state["total"]
+        stats.min, stats.max = state["min"], state["max"]
+        stats.status_counts = {str(status): int(count) for status, count in state["status_counts"].items()}
+        return stats
+
+    def __repr__(self) -> str:
+        return (f"GroupStats(count={self.count}, total={self.total}, min={self.min}, max={self.max}, "
+                f"status_counts={self.status_counts})")
+
+
+class GroupBy:
+    """
+    Hash-based group-by over one key field ("Requirement" or "Test Case").
+
+    Every entry updates the GroupStats of its group in a dictionary, so all groups are aggregated
+    in a single pass. Memory grows with the number of distinct groups, not with the number of entries.
+    """
+
+    KEYS = ("Requirement", "Test Case")
+
+    def __init__(self, key: str):
+        """
+        Args:
+            key (str): The field to group by, one of KEYS.
+
+        Raises:
+            ValueError: If the key is not one of KEYS.
+        """
+        if key not in self.KEYS:
+            raise ValueError(f"Invalid group key '{key}'. Must be one of {self.KEYS}.")
+        self.key = key
+        self.groups: Dict[str, GroupStats] = {}
+
+    def add(self, group: str, duration: float, status: str):
+        """
+        Adds one entry to its group.
+
+        Args:
+            group (str): The value of the key field of the entry.
+            duration (float): The duration of the entry in seconds.
+            status (str): The status of the entry.
+        """
+        stats = self.groups.get(group)
+        if stats is None:
+            stats = self.groups[group] = GroupStats()
+        stats.add(duration, status)
+
+    def add_all(self, groups: Iterable[str], durations: Iterable[float], statuses: Iterable[str]):
+        """
+        Adds the entries given as parallel columns, in one pass.
+
+        Args:
+            groups (Iterable[str]): The key field values.
+            durations (Iterable[float]): The durations in seconds.
+            statuses (Iterable[str]): The statuses.
+        """
+        # Same as calling add() per entry, with the GroupStats update inlined (this is the hot loop)
+        all_groups = self.groups
+        for group, duration, status in zip(groups, durations, statuses):
+            stats = all_groups.get(group)
+            if stats is None:
+                stats = all_groups[group] = GroupStats()
+            stats.count += 1
+            stats.total += duration
+            if duration < stats.min:
+                stats.min = duration
+            if duration > stats.max:
+                stats.max = duration
+            status_counts = stats.status_counts
+            status_counts[status] = status_counts.get(status, 0) + 1
+
+    def merge(self, other: "GroupBy"):
+        """
+        Adds the groups of another GroupBy over the same key to this one.
+
+        Args:
+            other (GroupBy): The groups to add.
+
+        Raises:
+            ValueError: If the other GroupBy groups by a different key.
+        """
+        if other.key != self.key:
+            raise ValueError(f"Cannot merge groups by '{other.key}' into groups by '{self.key}'.")
+        for group, other_stats in other.groups.items():
+            stats = self.groups.get(group)
+            if stats is None:
+                stats = self.groups[group] = GroupStats()
+            stats.merge(other_stats)
+
+    def top(self, n: int) -> List[Tuple[str, GroupStats]]:
+        """
+        Returns the n groups with the largest total duration (ties in order of first occurrence).
+
+        Args:
+            n (int): The number of groups to return.
+
+        Returns:
+            List[Tuple[str, GroupStats]]: (group, statistics) tuples, largest total duration first.
+        """
+        if n <= 0:
+            return []
+        return heapq.nlargest(n, self.groups.items(), key=lambda item: item[1].total)
+
+    def result(self, n: int) -> Dict[str, Any]:
+        """
+        Returns the top n groups in the format of the "groups" entry of `Analyser.analyze`.
+
+        Args:
+            n (int): The number of groups to return.
+
+        Returns:
+            Dict[str, Any]: {"key": str, "group_count": int, "top_groups": List[Tuple[str, GroupStats]]}
+        """
+        return {"key": self.key, "group_count": len(self.groups), "top_groups": self.top(n)}
+
+
+class StreamingAnalysis:
+    """
+    Computes the analysis results of `Analyser.analyze` incrementally, while the CSVHandler parses the rows.
+
+    Implements the part of the Data interface the CSVHandler writes to (`append_entry`, `review_lines`,
+    `get_size`), so it can be passed to `CSVHandler.read_csv` instead of a Data object. No entry is
+    stored except the top X candidates, so memory does not grow with the number of valid rows.
+    Skipped lines are still recorded in `review_lines` for reporting.
+
+    With percentiles, the durations are first counted per status in a pending buffer of at most
+    PENDING_LIMIT distinct durations, which is folded into the sketches when it is full and before
+    the result is taken. Repeated durations thus cost a dictionary increment instead of a sketch update.
+    """
+
+    # Maximum number of distinct (status, duration) pairs counted before they are added to the sketches
+    PENDING_LIMIT = 65536
+
+    def __init__(self, top_x: int, percentiles: bool = False, group_by: Optional[str] = None, top_groups: int = 10):
+        """
+        Args:
+            top_x (int): The number of top entries to retrieve based on duration.
+            percentiles (bool, optional): If True, the durations are summarized in DurationSketch objects,
+                                          overall and per status. Defaults to False.
+            group_by (str, optional): If set, the entries are aggregated per value of this field
+                                      ("Requirement" or "Test Case"). Defaults to None.
+            top_groups (int, optional): The number of groups in the result. Defaults to 10.
+        """
+        self._total_duration = ExactSum()
+        self.status_counts: Dict[str, int] = {}
+        self.review_lines: List[Tuple[int, str]] = []
+        self.duration_sketch_overall: Optional[DurationSketch] = DurationSketch() if percentiles else None
+        self.duration_sketches: Optional[Dict[str, DurationSketch]] = {} if percentiles else None
+        self.groups: Optional[GroupBy] = GroupBy(group_by) if group_by else None
+        self.top_groups = top_groups
+        self._top_x = TopX(top_x)
+        self._size = 0
+        # status -> duration -> count, not yet added to the sketches
+        self._pending: Dict[str, Dict[float, int]] = {}
+        self._pending_size = 0
+
+    def append_entry(self, key: int, entry: Dict[str, Any]):
+        """
+        Adds one parsed entry to the running results.
+
+        Args:
+            key (int): The unique ID of the entry.
+            entry (Dict[str, Any]): The dictionary containing the entry's data, with keys "Requirement", "Test Case", "Duration", and "Status".
+        """
+        self._size += 1
+        self._total_duration.add(entry["Duration"])
+        status = entry["Status"]
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self._top_x.add(key, entry)
+        if self.groups is not None:
+            self.groups.add(entry[self.groups.key], entry["Duration"], status)
+        if self.duration_sketches is not None:
+            counts = self._pending.get(status)
+            if counts is None:
+                counts = self._pending[status] = {}
+            duration = entry["Duration"]
+            count = counts.get(duration)
+            if count is None:
+                counts[duration] = 1
+                self._pending_size += 1
+                if self._pending_size >= self.PENDING_LIMIT:
+                    self._flush_pending()
+            else:
+                counts[duration] = count + 1
+
+    def _flush_pending(self):
+        """Adds the pending duration counts to the sketches and empties the buffer."""
+        overall = self.duration_sketch_overall
+        for status, counts in self._pending.items():
+            sketch = self.duration_sketches.get(status)
+            if sketch is None:
+                sketch = self.duration_sketches[status] = DurationSketch()
+            for duration, count in counts.items():
+                sketch.add(duration, count)
+                overall.add(duration, count)
+        self._pending = {}
+        self._pending_size = 0
+
+    def get_size(self) -> int:
+        return self._size
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Returns the analysis results in the format of `Analyser.analyze`.
+
+        Returns:
+            Dict[str, Any]: {"total_duration", "top_x_entries", "test_case_counts", "status_counts"},
+            "duration_sketch_overall" and "duration_sketches" if percentiles are computed and "groups" if the
+            entries are grouped.
+        """
+        skipped_lines = len(self.review_lines)
+        result = {
+            "total_duration": self._total_duration.value(),
+            "top_x_entries": self._top_x.result(),
+            "test_case_counts": (self._size + skipped_lines, self._size, skipped_lines),
+            "status_counts": dict(self.status_counts)
+        }
+        if self.duration_sketches is not None:
+            self._flush_pending()
+            result["duration_sketch_overall"] = self.duration_sketch_overall
+            result["duration_sketches"] = self.duration_sketches
+        if self.groups is not None:
+            result["groups"] = self.groups.result(self.top_groups)
+        return result
+
+
+class IncrementalAnalysis(StreamingAnalysis):
+    """
+    Keeps the analysis results of a Data object up to date while entries are added to it, e.g. in follow mode.
+
+    The entries already in the Data object are folded in once on creation. Afterwards, every entry added with
+    `add_entry` is inserted into the Data object and updates the running total, the status counts, the top X
+    heap (O(log X)) and the optional sketches and groups, so `result()` takes O(X log X) for ordering the top X
+    entries instead of rescanning all N entries like `Analyser.analyze`. The review lines are those of the Data
+    object, skipped lines recorded there are counted as well.
+
+    Entries added to the Data object directly (not through this object) are not part of the results.
+    """
+
+    def __init__(self, data, top_x: int, percentiles: bool = False, group_by: Optional[str] = None,
+                 top_groups: int = 10):
+        """
+        Args:
+            data (Data): The data object to analyze and to add the entries to.
+            top_x (int): The number of top entries to retrieve based on duration.
+            percentiles (bool, optional): If True, duration sketches are computed as well. Defaults to False.
+            group_by (str, optional): If set, the entries are grouped by this field. Defaults to None.
+            top_groups (int, optional): The number of groups in the result. Defaults to 10.
+        """
+        super().__init__(top_x, percentiles=percentiles, group_by=group_by, top_groups=top_groups)
+        self.data = data
+        self.review_lines = data.review_lines
+        for key, entry in data.data.items():
+            self.append_entry(key, entry)
+
+    def add_entry(self, key: int, entry: Dict[str, Any]):
+        """
+        Adds an entry to the Data object (keeping its built sorted indexes up to date) and to the running results.
+
+        Args:
+            key (int): The unique ID of the entry.
+            entry (Dict[str, Any]): The dictionary containing the entry's data, with keys "Requirement", "Test Case", "Duration", and "Status".
+        """
+        self.data.add_entry(key, entry)
+        self.append_entry(key, entry)
@@ -1,19 +1,28 @@
 # test_statistic_read_write/_analyser.py
 
-from typing import Dict, Any, List, Tuple
+import math
+from collections import Counter
+from itertools import compress
+from typing import Dict, Any, List, Optional, Tuple
+from ._aggregators import select_top_x, DurationSketch, GroupBy, StreamingAnalysis, IncrementalAnalysis
 from ._data import Data
-from ._exceptions import InvalidTopX
+from ._exceptions import InvalidTopX, InvalidGroupKey
 from ._logger import Logger
 
 class Analyser:
     """
     Performs analysis of Data. The results are passed to Printer.
+
+    For report-only runs, `create_stream` provides a StreamingAnalysis that computes the same
+    results while the CSV is parsed, without building a Data object. For a Data object that keeps
+    growing, `create_incremental` provides an IncrementalAnalysis that updates the results per added entry.
     """
 
     def __init__(self):
         self.logger = Logger()
 
-    def analyze(self, data: Data, top_x: int) -> Dict[str, Any]:
+    def analyze(self, data: Data, top_x: int, percentiles: bool = False, group_by: Optional[str] = None,
+                top_groups: int = 10) -> Dict[str, Any]:
         """
         Access point called from outside. It orchestrates the analysis by calling
         private sub-methods and aggregates their results into a dictionary.
@@ -21,6 +30,13 @@ class Analyser:
         Args:
             data (Data): The data object containing the information to be analyzed.
             top_x (int): The number of top entries to retrieve based on duration.
+            percentiles (bool, optional): If True, the duration distribution is summarized in
+                                          mergeable sketches (approximate percentiles, log-scale
+                                          histogram). Defaults to False.
+            group_by (str, optional): If set, the entries are aggregated per value of this field ("Requirement"
+                                      or "Test Case"): count, sum, min, max, mean duration and status
+                                      breakdown. Defaults to None.
+            top_groups (int, optional): The number of groups with the largest total duration to return. Defaults to 10.
 
         Returns:
             Dict[str, Any]: A dictionary with analysis results:
@@ -32,28 +48,100 @@ class Analyser:
                 "test_case_counts": Tuple[int, int, int],                       # (total_test_cases, valid_test_cases, skipped_lines)
                 "status_counts": Dict[str, int]                                 # A dictionary where keys are statuses and values
                                                                                 # are the corresponding counts.
+                "duration_sketch_overall": DurationSketch                       # Only if percentiles is True. The sketch of all
+                                                                                # durations.
+                "duration_sketches": Dict[str, DurationSketch]                  # Only if percentiles is True. One sketch per status.
+                "groups": Dict[str, Any]                                        # Only if group_by is set. {"key": str,
+                                                                                # "group_count": int, "top_groups":
+                                                                                # List[Tuple[str, GroupStats]]}
             }
         """
 
-        if not isinstance(top_x, int) or top_x < 0:
-            self.logger.log_error(f"Analyser: Invalid top_x value: {top_x}. Must be a non-negative integer.")
-            raise InvalidTopX(f"Invalid top_x value: {top_x}. Must be a non-negative integer.")
+        self._validate_top_x(top_x)
+        self._validate_groups(group_by, top_groups)
 
         total_duration = self._get_total_duration(data)
         top_x_entries = self._get_top_x_entries(data, top_x)
         test_case_counts = self._get_test_case_counts(data)
         status_counts = self._get_status_counts(data)
 
-        return {
+        result = {
             "total_duration": total_duration,
             "top_x_entries": top_x_entries,
             "test_case_counts": test_case_counts,
             "status_counts": status_counts
         }
+        if percentiles:
+            result["duration_sketch_overall"], result["duration_sketches"] = self._get_duration_sketches(data)
+        if group_by:
+            result["groups"] = self._get_groups(data, group_by).result(top_groups)
+        return result
+
+    def create_stream(self, top_x: int, percentiles: bool = False, group_by: Optional[str] = None,
+                      top_groups: int = 10) -> StreamingAnalysis:
+        """
+        Creates a streaming analysis, to be passed to `CSVHandler.read_csv` instead of a Data object.
+        Its `result()` has the format of `analyze`.
+
+        Args:
+            top_x (int): The number of top entries to retrieve based on duration.
+            percentiles (bool, optional): If True, duration sketches are computed as well. Defaults to False.
+            group_by (str, optional): If set, the entries are grouped by this field. Defaults to None.
+            top_groups (int, optional): The number of groups to return. Defaults to 10.
+
+        Returns:
+            StreamingAnalysis: The empty streaming analysis.
+        """
+        self._validate_top_x(top_x)
+        self._validate_groups(group_by, top_groups)
+        return StreamingAnalysis(top_x, percentiles=percentiles, group_by=group_by, top_groups=top_groups)
+
+    def create_incremental(self, data: Data, top_x: int, percentiles: bool = False, group_by: Optional[str] = None,
+                           top_groups: int = 10) -> IncrementalAnalysis:
+        """
+        Creates an incremental analysis of a Data object. New entries are added through its `add_entry`,
+        its `result()` has the format of `analyze` without rescanning the data.
+
+        Args:
+            data (Data): The data object to analyze, its current entries are analyzed once.
+            top_x (int): The number of top entries to retrieve based on duration.
+            percentiles (bool, optional): If True, duration sketches are computed as well. Defaults to False.
+            group_by (str, optional): If set, the entries are grouped by this field. Defaults to None.
+            top_groups (int, optional): The number of groups to return. Defaults to 10.
+
+        Returns:
+            IncrementalAnalysis: The analysis of the current entries.
+        """
+        self._validate_top_x(top_x)
+        self._validate_groups(group_by, top_groups)
+        return IncrementalAnalysis(data, top_x, percentiles=percentiles, group_by=group_by, top_groups=top_groups)
+
+    def _validate_top_x(self, top_x: int):
+        """
+        Raises:
+            InvalidTopX: If top_x is not a non-negative integer.
+        """
+        if not isinstance(top_x, int) or top_x < 0:
+            self.logger.log_error(f"Analyser: Invalid top_x value: {top_x}. Must be a non-negative integer.")
+            raise InvalidTopX(f"Invalid top_x value: {top_x}. Must be a non-negative integer.")
+
+    def _validate_groups(self, group_by: Optional[str], top_groups: int):
+        """
+        Raises:
+            InvalidGroupKey: If group_by is set and not a valid group key.
+            InvalidTopX: If top_groups is not a non-negative integer.
+        """
+        if group_by and group_by not in GroupBy.KEYS:
+            self.logger.log_error(f"Analyser: Invalid group key '{group_by}'. Must be in {list(GroupBy.KEYS)}.")
+            raise InvalidGroupKey(f"Invalid group key '{group_by}'. Must be one of {list(GroupBy.KEYS)}.")
+        if not isinstance(top_groups, int) or top_groups < 0:
+            self.logger.log_error(f"Analyser: Invalid top_groups value: {top_groups}. Must be a non-negative integer.")
+            raise InvalidTopX(f"Invalid top_groups value: {top_groups}. Must be a non-negative integer.")
 
     def _get_total_duration(self, data: Data) -> float:
         """
-        Calculates the total duration from the data.
+        Calculates the total duration from the data, in insertion order (no sorted index needed).
+        `math.fsum` avoids the rounding errors a plain float sum accumulates over many entries.
         
         Args:
             data (Data): The data object containing duration values.
@@ -61,14 +149,17 @@ class Analyser:
         Returns:
             float: The sum of all duration values.
         """
-        return sum(data.sorted_values.get("Duration"))
+        return math.fsum(data.column("Duration"))
 
     def _get_top_x_entries(self, data: Data, top_x: int) -> List[Tuple[int, Dict[str, Any]]]:
         """
         Retrieves the top X entries with the longest durations.
 
+        If the Duration index is already built, its tail is used. Otherwise the entries are selected
+        with a bounded heap, so the durations are not sorted just for the analysis.
+
         Args:
-            data (Data): The data object containing sorted duration indices.
+            data (Data): The data object containing the entries.
             top_x (int): The number of top entries to retrieve.
 
         Returns:
@@ -77,15 +168,17 @@ class Analyser:
             []                                                                  # if top_x <= 0
         """
 
-        if top_x <= 0 or not data.sorted_ids.get("Duration"):
+        if top_x <= 0 or not data.get_size():
             return []
-        else:
+        elif data.is_indexed("Duration"):
             slice_part = data.sorted_ids.get("Duration")[-top_x:]
             top_sorted_ids = list(reversed(slice_part))
+        else:
+            top_sorted_ids = select_top_x(data.row_ids(), data.column("Duration"), top_x)
 
-            top_entries = [(cid, data.data[cid]) for cid in top_sorted_ids]
+        top_entries = [(cid, data.data[cid]) for cid in top_sorted_ids]
 
-            return top_entries
+        return top_entries
 
     def _get_test_case_counts(self, data: Data) -> Tuple[int, int, int]:
         """
@@ -117,3 +210,45 @@ class Analyser:
             Dict[str, int]: A dictionary where keys are statuses and values are their counts.
         """
         return {status: len(ids) for status, ids in data.status_collections.items()}
+
+    def _get_duration_sketches(self, data: Data) -> Tuple[DurationSketch, Dict[str, DurationSketch]]:
+        """
+        Summarizes the durations of all entries and of each status.
+
+        Test durations repeat a lot, so the durations of each status are counted first (with C-level
+        iteration) and every distinct duration is added to the sketch once, with its count. The sketch
+        of all durations is the merge of the per-status sketches.
+
+        Args:
+            data (Data): The data object.
+
+        Returns:
+            Tuple[DurationSketch, Dict[str, DurationSketch]]: The sketch of all durations, and one sketch per status
+                                                              (in the order of `status_collections`).
+        """
+        durations = data.column("Duration")
+        statuses = data.column("Status")
+
+        overall = DurationSketch()
+        sketches = {}
+        for status in data.status_collections:
+            sketch = sketches[status] = DurationSketch()
+            for duration, count in Counter(compress(durations, map(status.__eq__, statuses))).items():
+                sketch.add(duration, count)
+            overall.merge(sketch)
+        return overall, sketches
+
+    def _get_groups(self, data: Data, group_by: str) -> GroupBy:
+        """
+        Aggregates the entries per value of the group_by field in one pass over the columns.
+
+        Args:
+            data (Data): The data object.
+            group_by (str): "Requirement" or "Test Case".
+
+        Returns:
+            GroupBy: The statistics of all groups.
+        """
+        groups = GroupBy(group_by)
+        groups.add_all(data.column(group_by), data.column("Duration"), data.column("Status"))
+        return groups
@@ -0,0 +1,212 @@
+# test_statistic_read_write/_cache.py
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from typing import Any, Dict, Optional
+from ._aggregators import DurationSketch, GroupStats
+from ._logger import Logger
+
+
+def default_cache_dir() -> str:
+    """Returns the cache directory used by the CLI: $TSRW_CACHE_DIR, or ~/.cache/tsrw."""
+    return os.environ.get("TSRW_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "tsrw")
+
+
+def _encode_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts an Analyser result into JSON serializable values (sketches and group statistics as dictionaries)."""
+    encoded = dict(result)
+    if "duration_sketches" in result:
+        encoded["duration_sketch_overall"] = result["duration_sketch_overall"].to_dict()
+        encoded["duration_sketches"] = {status: sketch.to_dict() for status, sketch in result["duration_sketches"].items()}
+    if "groups" in result:
+        encoded["groups"] = dict(result["groups"], top_groups=[
+            (group, stats.to_dict()) for group, stats in result["groups"]["top_groups"]
+        ])
+    return encoded
+
+
+def _decode_result(encoded: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Restores an Analyser result from the values written by `_encode_result`.
+
+    Raises:
+        ValueError, KeyError, TypeError: If the values are not a valid result.
+    """
+    result = dict(encoded)
+    result["top_x_entries"] = [(int(cid), dict(entry)) for cid, entry in encoded["top_x_entries"]]
+    result["test_case_counts"] = tuple(int(count) for count in encoded["test_case_counts"])
+    result["status_counts"] = {str(status): int(count) for status, count in encoded["status_counts"].items()}
+    if "duration_sketches" in encoded:
+        result["duration_sketch_overall"] = DurationSketch.from_dict(encoded["duration_sketch_overall"])
+        result["duration_sketches"] = {status: DurationSketch.from_dict(state)
+                                       for status, state in encoded["duration_sketches"].items()}
+    if "groups" in encoded:
+        result["groups"] = dict(encoded["groups"], top_groups=[
+            (group, GroupStats.from_dict(state)) for group, state in encoded["groups"]["top_groups"]
+        ])
+    return result
+
+
+class CacheEntry:
+    """
+    The cached files of one input CSV (one version of its content):
+    - the snapshot of the parsed data (see `_snapshot`), written and loaded by the CSVHandler.
+    - one Analyser result per set of analysis options, stored as JSON (see `_encode_result`), so loading
+      a result from the cache folder never executes code from it.
+    """
+
+    SNAPSHOT_NAME = "data.snapshot"
+
+    def __init__(self, path: str):
+        self.logger = Logger()
+        self.path = path
+        self.snapshot_path = os.path.join(path, self.SNAPSHOT_NAME)
+
+    def _result_path(self, options: Dict[str, Any]) -> str:
+        key = hashlib.blake2b(json.dumps(options, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.path, f"result-{key}.json")
+
+    def load_result(self, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached Analyser result for the given analysis options, or None if there is none.
+
+        Args:
+            options (Dict[str, Any]): The arguments of `Analyser.analyze` besides the data (JSON serializable).
+        """
+        try:
+            with open(self._result_path(options), "r", encoding="utf-8") as f:
+                return _decode_result(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.log_warning(f"ParseCache: Ignoring unreadable cached result in '{self.path}': {e}")
+            return None
+
+    def store_result(self, options: Dict[str, Any], result: Dict[str, Any]):
+        """
+        Stores an Analyser result for the given analysis options (written under a temporary name and renamed).
+
+        Raises:
+            OSError: If the result cannot be written.
+        """
+        path = self._result_path(options)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_encode_result(result), f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class ParseCache:
+    """
+    Directory of parsed inputs and analysis results, so repeated runs on an unchanged CSV skip parsing.
+
+    Every entry is a subdirectory named after the key of the input: a hash of its size, modification time
+    and content (BLAKE2b, which hashes far faster than the CSV can be parsed). A changed file therefore gets
+    a new entry, the old one is evicted eventually.
+
+    The total size of the entries is limited. When it is exceeded, the least recently used entries
+    (by modification time of the entry directory, updated on every use) are removed.
+    """
+
+    DEFAULT_MAX_BYTES = 512 << 20
+    HASH_CHUNK_SIZE = 1 << 20
+    _ENTRY_NAME = re.compile(r"^[0-9a-f]{32}$")
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir (str): The cache directory. It is created on first use.
+            max_bytes (int, optional): The size limit of all entries in bytes. Defaults to DEFAULT_MAX_BYTES.
+        """
+        self.logger = Logger()
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, csv_path: str) -> str:
+        """
+        Returns the cache key of the current content of a CSV file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        stat = os.stat(csv_path)
+        digest = hashlib.blake2b(f"{stat.st_size}:{stat.st_mtime_ns}:".encode("ascii"), digest_size=16)
+        with open(csv_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def entry(self, csv_path: str) -> CacheEntry:
+        """
+        Returns the cache entry of a CSV file, creating it if needed, and marks it as recently used.
+
+        Raises:
+            OSError: If the file cannot be read or the entry cannot be created.
+        """
+        path = os.path.join(self.cache_dir, self.key(csv_path))
+        os.makedirs(path, exist_ok=True)
+        os.utime(path)
+        return CacheEntry(path)
+
+    def _entries(self):
+        """Returns the paths of all entries (other files in the cache directory are never touched)."""
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.cache_dir, name) for name in names
+                if self._ENTRY_NAME.match(name) and os.path.isdir(os.path.join(self.cache_dir, name))]
+
+    @staticmethod
+    def _entry_size(path: str) -> int:
+        size = 0
+        for name in os.listdir(path):
+            try:
+                size += os.path.getsize(os.path.join(path, name))
+            except OSError:
+                pass
+        return size
+
+    def size(self) -> int:
+        """Returns the total size of all entries in bytes."""
+        return sum(self._entry_size(path) for path in self._entries())
+
+    def evict(self) -> int:
+        """
+        Removes the least recently used entries until the total size is within the limit.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = sorted(((os.path.getmtime(path), path, self._entry_size(path)) for path in self._entries()))
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed += 1
+        if removed:
+            self.logger.log_info(f"ParseCache: Evicted {removed} least recently used entries from '{self.cache_dir}'.")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Removes all entries.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        entries = self._entries()
+        for path in entries:
+            shutil.rmtree(path, ignore_errors=True)
+        self.logger.log_info(f"ParseCache: Cleared {len(entries)} entries from '{self.cache_dir}'.")
+        return len(entries)
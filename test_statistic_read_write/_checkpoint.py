@@ -0,0 +1,234 @@
+# test_statistic_read_write/_checkpoint.py
+
+"""
+Checkpoints of a running CSV ingest, so an interrupted read can be resumed.
+
+Layout:
+    MAGIC (8 bytes) | header length (uint32, little endian) | JSON header | segments
+
+The header records the format version, the byte order and item sizes of the machine that wrote
+the checkpoint and the size and modification time of the source CSV. Every checkpoint appends one
+segment with the entries parsed since the previous one, so the file grows with the parsed data and
+is never rewritten:
+
+    payload length (uint32) | CRC32 of the payload (uint32) | payload
+    payload = meta length (uint32) | JSON meta | durations ('d') | string codes ('I') per coded field
+
+The JSON meta holds the position after the segment (byte offset, line number, next ID), the number
+of entries, the strings first used in the segment and its review lines. String codes refer to the
+strings of all segments up to and including their own. A segment cut short by a kill fails its
+length or CRC check; it is dropped together with everything after it.
+"""
+
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+from ._data import Data, ColumnarData, _StringTable
+
+
+MAGIC = b"TSRWCKPT"
+VERSION = 1
+_LENGTH = struct.Struct("<I")
+_SEGMENT_HEADER = struct.Struct("<II")
+_TYPECODES = ("q", "d", "I")
+_FIELDS = tuple(ColumnarData._CODED_FIELDS)
+
+
+def checkpoint_path_for(csv_path: str) -> str:
+    """Returns the path of the checkpoint belonging to a CSV file (stored next to it)."""
+    return csv_path + ".checkpoint"
+
+
+class Checkpoint:
+    """
+    The state of an interrupted ingest, restored by `load_checkpoint`.
+
+    Attributes:
+        data (ColumnarData): The entries parsed before the interruption, with the IDs 1..next_id-1.
+        offset (int): Byte offset of the first line not parsed yet.
+        lineno (int): Number of lines parsed (including the header).
+        next_id (int): ID of the next entry.
+        tables (Dict[str, List[str]]): The strings of all segments per coded field, in code order.
+        length (int): Size of the valid part of the file, where the next segment is written.
+    """
+
+    def __init__(self, data: ColumnarData, offset: int, lineno: int, next_id: int,
+                 tables: Dict[str, List[str]], length: int):
+        self.data = data
+        self.offset = offset
+        self.lineno = lineno
+        self.next_id = next_id
+        self.tables = tables
+        self.length = length
+
+
+def _layout() -> Dict[str, object]:
+    return {"byteorder": sys.byteorder, "itemsizes": {code: array(code).itemsize for code in _TYPECODES}}
+
+
+def load_checkpoint(path: str, source: Dict[str, int]) -> Checkpoint:
+    """
+    Loads a checkpoint written by a CheckpointWriter.
+
+    Args:
+        path (str): Path of the checkpoint file.
+        source (Dict[str, int]): The current `source_signature` of the CSV. The checkpoint is only
+                                 used if it was written while parsing the same file content.
+
+    Returns:
+        Checkpoint: The restored state. Without any complete segment, it is the state before the first line.
+
+    Raises:
+        OSError: If the checkpoint cannot be read.
+        ValueError: If the file is not a checkpoint, was written by another format version or machine
+                    layout, or belongs to another version of the source CSV.
+    """
+    with open(path, "rb") as f:
+        buf = f.read()
+
+    start = len(MAGIC) + _LENGTH.size
+    if len(buf) < start or buf[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a checkpoint file")
+    (header_length,) = _LENGTH.unpack_from(buf, len(MAGIC))
+    try:
+        header = json.loads(buf[start:start + header_length])
+    except ValueError:
+        raise ValueError("corrupt checkpoint header")
+    if not isinstance(header, dict):
+        raise ValueError("corrupt checkpoint header")
+    if header.get("version") != VERSION:
+        raise ValueError(f"unsupported checkpoint version {header.get('version')}")
+    if {"byteorder": header["byteorder"], "itemsizes": header["itemsizes"]} != _layout():
+        raise ValueError("checkpoint was written on a machine with another data layout")
+    if header["source"] != source:
+        raise ValueError("checkpoint is stale, the CSV has changed")
+
+    durations = array('d')
+    codes = {field: array('I') for field in _FIELDS}
+    tables: Dict[str, List[str]] = {field: [] for field in _FIELDS}
+    review_lines: List[Tuple[int, str]] = []
+    offset, lineno, next_id = header["offset"], 1, 1
+
+    pos = start + header_length
+    while pos + _SEGMENT_HEADER.size <= len(buf):
+        length, crc = _SEGMENT_HEADER.unpack_from(buf, pos)
+        payload = buf[pos + _SEGMENT_HEADER.size:pos + _SEGMENT_HEADER.size + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            break
+        (meta_length,) = _LENGTH.unpack_from(payload)
+        meta = json.loads(payload[_LENGTH.size:_LENGTH.size + meta_length])
+        rows = meta["rows"]
+        column_start = _LENGTH.size + meta_length
+        durations.frombytes(payload[column_start:column_start + rows * durations.itemsize])
+        column_start += rows * durations.itemsize
+        for field in _FIELDS:
+            column = codes[field]
+            column.frombytes(payload[column_start:column_start + rows * column.itemsize])
+            column_start += rows * column.itemsize
+            tables[field].extend(meta["strings"][field])
+        review_lines.extend((line_no, reason) for line_no, reason in meta["review_lines"])
+        offset, lineno, next_id = meta["offset"], meta["lineno"], meta["next_id"]
+        pos += _SEGMENT_HEADER.size + length
+
+    ids = array('q', range(1, next_id))
+    if not len(ids) == len(durations) == len(codes["Status"]):
+        raise ValueError("inconsistent checkpoint columns")
+    statuses = tables["Status"]
+    status_collections: Dict[str, array] = {}
+    for cid, code in zip(ids, codes["Status"]):
+        status = statuses[code]
+        if status not in status_collections:
+            status_collections[status] = array('q')
+        status_collections[status].append(cid)
+
+    data = ColumnarData.from_columns(ids, durations, codes, tables, status_collections, {})
+    data.review_lines = review_lines
+    return Checkpoint(data, offset, lineno, next_id, tables, pos)
+
+
+class CheckpointWriter:
+    """
+    Appends the segments of a checkpoint file while a CSV is parsed, see the module description.
+
+    Every segment is flushed to disk before `write` returns, so a killed run loses at most the
+    entries parsed since the last checkpoint.
+    """
+
+    def __init__(self, path: str, source: Dict[str, int], data_start: int, resume: Optional[Checkpoint] = None):
+        """
+        Creates a new checkpoint file, or continues the one `resume` was loaded from.
+
+        Args:
+            path (str): Path of the checkpoint file.
+            source (Dict[str, int]): The `source_signature` of the parsed CSV.
+            data_start (int): Byte offset of the first data line (the state before any segment).
+            resume (Checkpoint, optional): The loaded checkpoint, its invalid tail is cut off. Defaults to None.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        self.path = path
+        self.tables = {field: _StringTable.from_values(resume.tables[field] if resume else []) for field in _FIELDS}
+        if resume is not None:
+            self._file = open(path, "r+b")
+            self._file.truncate(resume.length)
+            self._file.seek(resume.length)
+            return
+
+        header = json.dumps({"version": VERSION, **_layout(), "source": source, "offset": data_start}).encode("utf-8")
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + _LENGTH.pack(len(header)) + header)
+        self._sync()
+
+    def write(self, data: Data, ids: range, offset: int, lineno: int, review_lines: Sequence[Tuple[int, str]]):
+        """
+        Appends a segment with the given entries of `data` and the position after them.
+
+        Args:
+            data (Data): The data being populated.
+            ids (range): The IDs of the entries parsed since the last checkpoint, `ids.stop` is the next ID.
+            offset (int): Byte offset of the first line not parsed yet.
+            lineno (int): Number of lines parsed (including the header).
+            review_lines (Sequence[Tuple[int, str]]): The lines skipped since the last checkpoint.
+
+        Raises:
+            OSError: If the segment cannot be written.
+        """
+        columns = data.columns_of(ids, ("Duration",) + _FIELDS)
+        strings = {}
+        coded = []
+        for field, values in zip(_FIELDS, columns[1:]):
+            table = self.tables[field]
+            known = len(table)
+            # New strings are added in order of first use, then all values are coded by dictionary lookups
+            for value in dict.fromkeys(values):
+                if value not in table.codes:
+                    table.code(value)
+            coded.append(array('I', map(table.codes.__getitem__, values)))
+            strings[field] = table.values[known:]
+
+        meta = json.dumps({
+            "offset": offset,
+            "lineno": lineno,
+            "next_id": ids.stop,
+            "rows": len(ids),
+            "strings": strings,
+            "review_lines": list(review_lines),
+        }).encode("utf-8")
+        payload = b"".join([_LENGTH.pack(len(meta)), meta, array('d', columns[0]).tobytes()] +
+                           [column.tobytes() for column in coded])
+        self._file.write(_SEGMENT_HEADER.pack(len(payload), zlib.crc32(payload)))
+        self._file.write(payload)
+        self._sync()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Closes the checkpoint file."""
+        self._file.close()
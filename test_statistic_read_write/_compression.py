@@ -0,0 +1,117 @@
+# test_statistic_read_write/_compression.py
+
+"""
+Transparent compression of input and exported CSVs, with the standard library codecs only.
+
+Compressed inputs are detected by their magic bytes, not by their file name, and decompressed
+while they are streamed. The supported formats are gzip, bz2 and xz.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO, Optional
+
+# Magic bytes at the start of a compressed file
+MAGIC_BYTES = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+# File name suffix of the exported files per compression
+SUFFIXES = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "xz": ".xz",
+}
+# Valid and default compression levels (the defaults of gzip and xz favour speed over the last few percent)
+LEVELS = {
+    "gzip": range(0, 10),
+    "bz2": range(1, 10),
+    "xz": range(0, 10),
+}
+DEFAULT_LEVELS = {
+    "gzip": 6,
+    "bz2": 9,
+    "xz": 6,
+}
+# Errors raised while reading a corrupt or truncated compressed file (besides UnicodeDecodeError)
+DECOMPRESSION_ERRORS = (OSError, EOFError, lzma.LZMAError)
+
+
+def detect_compression(path: str) -> Optional[str]:
+    """
+    Returns the compression of a file by its magic bytes ('gzip', 'bz2' or 'xz'), or None for plain text.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    # Unbuffered, only the first few bytes are read
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        head = os.read(fd, max(len(magic) for magic in MAGIC_BYTES.values()))
+    finally:
+        os.close(fd)
+    for compression, magic in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def validate(compression: Optional[str], level: Optional[int] = None):
+    """
+    Checks an output compression and level.
+
+    Raises:
+        ValueError: If the compression is not supported or the level is out of its range.
+    """
+    if compression is None:
+        if level is not None:
+            raise ValueError("A compression level requires a compression")
+        return
+    if compression not in SUFFIXES:
+        raise ValueError(f"Unsupported compression '{compression}'. Must be one of {list(SUFFIXES)}")
+    if level is not None and level not in LEVELS[compression]:
+        levels = LEVELS[compression]
+        raise ValueError(f"Invalid {compression} compression level {level}. Must be in {levels.start}..{levels.stop - 1}")
+
+
+def open_text(path: str, mode: str = "r", compression: Optional[str] = None, level: Optional[int] = None) -> IO[str]:
+    """
+    Opens a file in UTF-8 text mode, (de)compressing it on the fly.
+
+    Args:
+        path (str): The file path.
+        mode (str, optional): 'r' or 'w'. Defaults to 'r'.
+        compression (str, optional): 'gzip', 'bz2', 'xz' or None for plain text. Defaults to None.
+        level (int, optional): Compression level when writing. Defaults to DEFAULT_LEVELS.
+
+    Raises:
+        ValueError: If the compression or level is not supported.
+        OSError: If the file cannot be opened.
+    """
+    validate(compression, level)
+    if compression is None:
+        return open(path, mode=mode, encoding="utf-8")
+
+    text_mode = mode + "t"
+    if mode == "r":
+        level = None
+    elif level is None:
+        level = DEFAULT_LEVELS[compression]
+
+    if compression == "gzip":
+        return gzip.open(path, text_mode, encoding="utf-8") if level is None else \
+            gzip.open(path, text_mode, compresslevel=level, encoding="utf-8")
+    if compression == "bz2":
+        return bz2.open(path, text_mode, encoding="utf-8") if level is None else \
+            bz2.open(path, text_mode, compresslevel=level, encoding="utf-8")
+    return lzma.open(path, text_mode, encoding="utf-8") if level is None else \
+        lzma.open(path, text_mode, preset=level, encoding="utf-8")
+
+
+def strip_suffix(path: str) -> str:
+    """Returns the path without a compression suffix ('.gz', '.bz2', '.xz'), e.g. 'runs.csv.gz' -> 'runs.csv'."""
+    base, ext = os.path.splitext(path)
+    return base if ext.lower() in SUFFIXES.values() else path
@@ -1,13 +1,148 @@
 # test_statistic_read_write/_csv_handler.py
 
+import logging
+import mmap
 import os
 import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from ._logger import Logger
-from ._parser import TestCaseParser, DurationParser, StatusParser
-from ._data import Data
+from ._parser import TestCaseParser, DurationParser, StatusParser, DurationFormatter
+from ._data import Data, ColumnarData
+from ._snapshot import load_snapshot, save_snapshot, source_signature
+from ._checkpoint import Checkpoint, CheckpointWriter, load_checkpoint
+from ._compression import DECOMPRESSION_ERRORS, SUFFIXES, detect_compression, open_text, strip_suffix
 from ._exceptions import *
 import uuid
 
+
+def _split_lines(text: str) -> List[str]:
+    """
+    Splits decoded CSV text into lines with the rule of the text reader of `_read_serial` (universal newlines):
+    '\n', '\r\n' and a lone '\r' end a line. All reading methods number the lines with this rule.
+
+    Returns:
+        List[str]: The lines without line endings. A last line without line ending is included, nothing is
+                   returned for the end of the text after a final line ending.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _count_line_endings(buf: bytes) -> int:
+    """Counts the line endings in `buf` with the rule of `_split_lines` ('\r\n' is one line ending)."""
+    return buf.count(b"\n") + buf.count(b"\r") - buf.count(b"\r\n")
+
+
+def _line_spans(buf, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Finds the lines in the byte range [start, end) of a bytes-like buffer with the rule of `_split_lines`.
+
+    Yields:
+        Tuple[int, int, int]: Per line: its start offset, the offset of its line ending (or `end`) and the start
+                              offset of the next line.
+    """
+    find = buf.find
+    pos = start
+    while pos < end:
+        newline = find(b"\n", pos, end)
+        line_end = end if newline == -1 else newline
+        next_pos = end if newline == -1 else newline + 1
+        carriage_return = find(b"\r", pos, line_end)
+        if carriage_return != -1:
+            if carriage_return < line_end - 1:
+                # A lone '\r' ends the line
+                next_pos = carriage_return + 1
+            line_end = carriage_return
+        yield pos, line_end, next_pos
+        pos = next_pos
+
+
+def _complete_lines_end(buf) -> int:
+    """
+    Returns the offset after the last line ending in `buf` (see `_split_lines`) that surely ends its line, 0 if
+    there is none. A '\r' at the end of `buf` is not counted, it may be the first half of a '\r\n'.
+    """
+    return max(buf.rfind(b"\n"), buf.rfind(b"\r", 0, len(buf) - 1)) + 1
+
+
+def _read_line(f, block_size: int = 8192) -> bytes:
+    """
+    Reads one line of a binary file with the rule of `_split_lines`, like `f.readline()` reads up to a '\n',
+    and leaves the file at the start of the next line.
+
+    Returns:
+        bytes: The line with its line ending. A last line without line ending is returned as is, b"" at the
+               end of the file.
+    """
+    start = f.tell()
+    buf = b""
+    while True:
+        block = f.read(block_size)
+        buf += block
+        _, _, next_pos = next(_line_spans(buf, 0, len(buf)), (0, 0, 0))
+        # The line is complete at the end of the file, or once its line ending is followed by more bytes
+        # or is a '\n' (a '\r' at the end of buf may be the first half of a '\r\n')
+        if not block or next_pos < len(buf) or buf.endswith(b"\n"):
+            f.seek(start + next_pos)
+            return buf[:next_pos]
+
+
+def _parse_byte_range(csv_path: str, start: int, end: int, first_lineno: int, use_mmap: bool = False,
+                      aggregate_skips: bool = False) -> Tuple[List[str], List[str], array, List[str], List[Tuple[int, str]]]:
+    """
+    Worker function of the parallel ingest. Parses the lines in the byte range [start, end) of the CSV.
+
+    Module-level so it can be pickled into a worker process.
+
+    Args:
+        csv_path (str): Path to the input CSV file.
+        start (int): Byte offset of the first line of the range.
+        end (int): Byte offset after the last line of the range.
+        first_lineno (int): The 1-based line number of the first line of the range.
+        use_mmap (bool, optional): If True, the range is scanned on a memory map of the file. Defaults to False.
+        aggregate_skips (bool, optional): If True, per-line warnings are rate-limited within the range. Defaults to False.
+
+    Returns:
+        Tuple: Compact columns of the valid lines (requirements, test cases, durations, statuses)
+               and the review lines of the range.
+    """
+    handler = CSVHandler(csv_path, aggregate_skips=aggregate_skips)
+    requirements, test_cases, statuses = [], [], []
+    durations = array('d')
+    review_lines: List[Tuple[int, str]] = []
+
+    def collect(entries):
+        for entry in entries:
+            if entry is None:
+                continue
+            requirements.append(entry["Requirement"])
+            test_cases.append(entry["Test Case"])
+            durations.append(entry["Duration"])
+            statuses.append(entry["Status"])
+
+    if use_mmap:
+        with open(csv_path, mode='rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            collect(handler._scan_buffer(mm, start, end, first_lineno, review_lines))
+    else:
+        with open(csv_path, mode='rb') as f:
+            f.seek(start)
+            raw = f.read(end - start)
+
+        # The range ends after a line ending, so it is split exactly like the serial text reader splits the file
+        collect(
+            handler._parse_row(lineno, row, review_lines)
+            for lineno, row in enumerate(_split_lines(raw.decode('utf-8')), start=first_lineno)
+        )
+
+    return requirements, test_cases, durations, statuses, review_lines
+
+
 class CSVHandler:
     """
     Responsible for:
@@ -17,9 +152,68 @@ class CSVHandler:
     No analysis or display logic here.
     """
 
-    def __init__(self, csv_path: str):
+    # Size hint (in characters) for the chunks of lines read at once while streaming the input
+    READ_CHUNK_SIZE = 1 << 20
+    # Target size (in bytes) of the byte ranges parsed by one worker process in the parallel ingest
+    PARALLEL_CHUNK_SIZE = 8 << 20
+    # Default number of example line numbers (and per-line warnings) per skip category in aggregation mode
+    SKIP_EXAMPLES = 5
+    # Number of rows formatted and written at once by the CSV export
+    EXPORT_BATCH_SIZE = 65536
+    EXPORT_FIELDS = ("Requirement", "Test Case", "Duration", "Status")
+    # Maximum number of threads writing exported files concurrently
+    EXPORT_WORKERS = 4
+    # Default number of input bytes parsed between two checkpoints
+    CHECKPOINT_INTERVAL = 256 << 20
+
+    def __init__(self, csv_path: str, columnar: bool = False, jobs: int = 1, use_mmap: bool = False,
+                 aggregate_skips: bool = False, skip_examples: Optional[int] = None, quarantine_path: Optional[str] = None,
+                 snapshot_path: Optional[str] = None, write_snapshot: bool = False, checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: Optional[int] = None, snapshot_indexes: Optional[Sequence[str]] = None):
+        """
+        Args:
+            csv_path (str): Path to the input CSV file.
+            columnar (bool, optional): If True, read_csv stores the entries in a memory-efficient
+                                       ColumnarData object instead of a Data object. Defaults to False.
+            jobs (int, optional): Number of worker processes used to parse the CSV. 1 parses in the
+                                  current process, 0 uses one process per CPU. Defaults to 1.
+            use_mmap (bool, optional): If True, the input is memory-mapped and scanned for field and line
+                                       boundaries in place, only the fields that are needed are decoded.
+                                       Defaults to False.
+            aggregate_skips (bool, optional): If True, skipped lines are reported as a bounded summary per
+                                              reason category, and per-line warnings are limited to the first
+                                              `skip_examples` lines of each category. Defaults to False.
+            skip_examples (int, optional): Number of example lines per category in aggregation mode.
+                                           Defaults to SKIP_EXAMPLES.
+            quarantine_path (str, optional): If set, the skipped lines with their line number and reason
+                                             are written to this file. Defaults to None.
+            snapshot_path (str, optional): Path of a binary snapshot of the parsed data. If a snapshot of the current
+                                           CSV exists there, read_csv loads it instead of parsing. Defaults to None.
+            write_snapshot (bool, optional): If True, read_csv writes the snapshot (with the sorted indexes of
+                                             `snapshot_indexes` built) after parsing. Defaults to False.
+            checkpoint_path (str, optional): If set, read_csv resumes from the checkpoint there (if it belongs to the
+                                             current CSV) and checkpoints its progress to it while parsing.
+                                             Defaults to None.
+            checkpoint_interval (int, optional): Number of input bytes parsed between two checkpoints.
+                                                 Defaults to CHECKPOINT_INTERVAL.
+            snapshot_indexes (Sequence[str], optional): The sorted indexes built before the snapshot is written, e.g.
+                                                        only those the run needs anyway. Defaults to None (all indexes).
+        """
         self.logger = Logger()
         self.csv_path = csv_path
+        self.columnar = columnar
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.use_mmap = use_mmap
+        self.aggregate_skips = aggregate_skips
+        self.skip_examples = self.SKIP_EXAMPLES if skip_examples is None else skip_examples
+        self.quarantine_path = quarantine_path
+        self.snapshot_path = snapshot_path
+        self.write_snapshot = write_snapshot
+        self.snapshot_indexes = Data.INDEX_KEYS if snapshot_indexes is None else tuple(snapshot_indexes)
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = self.CHECKPOINT_INTERVAL if checkpoint_interval is None else checkpoint_interval
+        # Per-line warnings emitted per skip category (aggregation mode only)
+        self._skip_warnings: Dict[str, int] = {}
 
         self.parsers = {
             "Test Case": TestCaseParser(),
@@ -28,16 +222,38 @@ class CSVHandler:
         }
 
 
-    def read_csv(self):
+    def read_csv(self, target=None):
         """
         Reads and validates CSV line by line, populating a new Data object.
 
+        The file is streamed: the header is read and validated first, the remaining lines are
+        read lazily in buffered chunks, so peak memory does not depend on the file size.
+
         The method returns the populated Data object after processing the CSV file.
         It performs several validation checks on the input CSV, including file existence,
         format, and content, raising appropriate exceptions if issues are found.
 
         Parsed data is stored in a Data object, and lines that fail validation are
-        recorded for review.
+        recorded for review. Entries are bulk-loaded into the Data object, its sorted
+        indexes are built lazily on first access.
+
+        Instead of a new Data object, the entries can be passed to a `target` implementing
+        `append_entry`, `review_lines` and `get_size`, e.g. a StreamingAnalysis that only keeps
+        running results.
+
+        If the handler has a `snapshot_path` and the snapshot there was written from the current
+        content of the CSV, the data is loaded from it (as ColumnarData, with its prebuilt sorted
+        indexes) and the CSV is not parsed. A missing, stale or unreadable snapshot falls back to
+        parsing. With `write_snapshot`, the `snapshot_indexes` of the parsed data are built and it is saved as snapshot.
+
+        A gzip, bz2 or xz compressed CSV (detected by its magic bytes) is decompressed while it is
+        streamed. It is always parsed in the current process, as the parallel and memory-mapped
+        reading need random access to the uncompressed bytes.
+
+        With a `checkpoint_path`, the progress of the parsing (position, entries and skipped lines so far)
+        is appended to a checkpoint file every `checkpoint_interval` bytes. If the read is interrupted,
+        the next read of the unchanged CSV restores the checkpointed entries and continues after them.
+        The checkpoint is removed once the CSV is read completely. See `_read_checkpointed`.
 
         Note: 
             The parsers used (TestCaseParser, DurationParser, StatusParser) are
@@ -52,28 +268,607 @@ class CSVHandler:
             InvalidHeaderFormat: If the header does not match 'Test case;Duration;Status'.
             NoDataLinesError: If no data lines are found after the header.
             NoValidLinesError: If no valid data lines are found in the CSV.
+            CSVExportError: If the quarantine file cannot be written.
+
+        Args:
+            target (optional): The object receiving the entries. Defaults to a new Data object
+                               (a ColumnarData object if the handler was created with columnar=True).
 
         Returns:
-            Data: The populated Data object containing the parsed and validated CSV data.
+            Data: The populated Data object containing the parsed and validated CSV data,
+                  or `target` if it was given.
+        """
+        data = target
+        if data is None and self.snapshot_path:
+            data = self._load_snapshot()
+        parsed = data is None or data is target
+        if parsed:
+            if data is None:
+                data = ColumnarData() if self.columnar else Data()
+            self._read_into(data)
+
+        self._complete_read(data)
+
+        if parsed and target is None and self.snapshot_path and self.write_snapshot:
+            self._save_snapshot(data)
+
+        return data
+
+    def _read_into(self, data: Data):
+        """
+        Parses the CSV with the reading method selected by the options and appends the entries to `data`.
+
+        Raises:
+            InputFileNotFound, EmptyFileError, InvalidHeaderColumns, InvalidHeaderFormat, NoDataLinesError:
+            See `read_csv`.
+        """
+        compression = self._detect_compression()
+        if compression is not None:
+            if self.jobs > 1 or self.use_mmap or self.checkpoint_path:
+                self.logger.log_info(
+                    f"CSVHandler: Input is {compression} compressed, it is streamed in the current process "
+                    "without checkpoints."
+                )
+            self._read_serial(data, compression)
+        elif self.checkpoint_path and isinstance(data, Data):
+            self._read_checkpointed(data)
+        elif self.jobs > 1:
+            self._read_parallel(data)
+        elif self.use_mmap:
+            self._read_mmap(data)
+        else:
+            self._read_serial(data)
+
+    def _complete_read(self, data: Data):
+        """
+        Writes the quarantine file, checks that there are valid entries and reports the skipped lines.
+
+        Raises:
+            NoValidLinesError, CSVExportError: See `read_csv`.
         """
-        data = Data()
+        if self.quarantine_path and data.review_lines:
+            self._write_quarantine(data.review_lines)
 
+        # Step 8: check if we have any data lines (possible if the file contained a valid header but invalid data lines)
+        if data.get_size() == 0:
+            self.logger.log_error("CSVHandler: No valid data lines found.")
+            raise NoValidLinesError("No valid lines in CSV")
+
+        cache_info = self.parsers["Duration"].cache_info()
+        if cache_info["hits"] or cache_info["misses"]:
+            self.logger.log_info(
+                f"CSVHandler: Duration cache hit rate {cache_info['hit_rate']:.1%} "
+                f"({cache_info['hits']} hits, {cache_info['misses']} misses)."
+            )
+
+        # Finally, log and notify about skipped lines
+        self._log_review_lines(data)
+
+    def _detect_compression(self) -> Optional[str]:
+        """
+        Returns the compression of the input CSV, or None for plain text. An unreadable file counts as plain
+        text, the reading method reports the error.
+        """
+        try:
+            return detect_compression(self.csv_path)
+        except OSError:
+            return None
+
+    def _load_snapshot(self) -> Optional[ColumnarData]:
+        """
+        Loads the snapshot of the CSV, if there is a valid one.
+
+        Returns:
+            ColumnarData: The restored data, or None if the CSV has to be parsed.
+        """
+        if not os.path.isfile(self.snapshot_path):
+            return None
         try:
-            with open(self.csv_path, mode='r', encoding='utf-8') as f:
-                lines = f.readlines()
+            data = load_snapshot(self.snapshot_path, source_signature(self.csv_path))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.log_warning(f"CSVHandler: Ignoring snapshot '{self.snapshot_path}': {e}")
+            return None
+        self.logger.log_info(f"CSVHandler: Loaded {data.get_size()} entries from snapshot '{self.snapshot_path}'.")
+        return data
+
+    def _save_snapshot(self, data: Data):
+        """
+        Builds the `snapshot_indexes` of `data` and writes its snapshot. A failure only costs the speed-up
+        of the next run, so it is logged and not raised.
+
+        Args:
+            data (Data): The parsed data.
+        """
+        for index_key in self.snapshot_indexes:
+            data.build_index(index_key)
+        try:
+            save_snapshot(data, self.snapshot_path, source_signature(self.csv_path))
+        except OSError as e:
+            self.logger.log_warning(f"CSVHandler: Failed writing snapshot '{self.snapshot_path}': {e}")
+            return
+        self.logger.log_info(f"CSVHandler: Wrote snapshot of {data.get_size()} entries to '{self.snapshot_path}'.")
+
+    def _read_serial(self, data: Data, compression: Optional[str] = None):
+        """
+        Streams the CSV in the current process and appends the parsed entries to `data`.
+
+        Args:
+            data (Data): The Data object to populate.
+            compression (str, optional): The compression of the CSV ('gzip', 'bz2' or 'xz'), which is
+                                         decompressed on the fly. Defaults to None (plain text).
+
+        Raises:
+            InputFileNotFound, EmptyFileError, InvalidHeaderColumns, InvalidHeaderFormat, NoDataLinesError:
+            See `read_csv`.
+        """
+        try:
+            f = open_text(self.csv_path, 'r', compression)
+        except Exception as e:
+            self.logger.log_error(f"CSVHandler: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot open file: {e}")
+
+        try:
+            with f:
+                # Step 2: check if the file is empty
+                first_line = f.readline()
+                if not first_line:
+                    self.logger.log_error("CSVHandler: File is empty.")
+                    raise EmptyFileError("Input CSV is empty")
+
+                # Step 3: validate header
+                self._validate_header(first_line)
+
+                # The loop. Streams the lines after the header in chunks of about READ_CHUNK_SIZE characters,
+                # so the file is never held in memory as a whole. Exceptions are not thrown inside the loop,
+                # as invalid lines are handled.
+                current_id = 1
+                lineno = 1
+                for chunk in iter(lambda: f.readlines(self.READ_CHUNK_SIZE), []):
+                    for row in chunk:
+                        lineno += 1
+                        entry = self._parse_row(lineno, row.rstrip("\n"), data.review_lines)
+                        if entry is not None:
+                            data.append_entry(current_id, entry)
+                            current_id += 1
+        except (UnicodeDecodeError, *DECOMPRESSION_ERRORS) as e:
+            self.logger.log_error(f"CSVHandler: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot read file: {e}")
+
+        # Step 4: check at least one data line
+        if lineno == 1:
+            self.logger.log_error("CSVHandler: No data lines found after header.")
+            raise NoDataLinesError("No data lines found after header.")
+
+    def _read_mmap(self, data: Data):
+        """
+        Memory-maps the CSV in the current process and appends the parsed entries to `data`.
+
+        The mapped buffer is scanned for ';' and newline bytes directly, a field is only decoded
+        once its line has the expected number of columns. Lines skipped for their column count
+        never become a Python string, and repeated runs over the same file are served from the
+        OS page cache without copying. Lines are numbered like in `_read_serial`.
+
+        Args:
+            data (Data): The Data object to populate.
+
+        Raises:
+            InputFileNotFound, EmptyFileError, InvalidHeaderColumns, InvalidHeaderFormat, NoDataLinesError:
+            See `read_csv`.
+        """
+        try:
+            f = open(self.csv_path, mode='rb')
         except Exception as e:
             self.logger.log_error(f"CSVHandler: Error reading file '{self.csv_path}': {e}")
             raise InputFileNotFound(f"Cannot open file: {e}")
 
+        try:
+            with f:
+                # Step 2: check if the file is empty (an empty file cannot be mapped)
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    self.logger.log_error("CSVHandler: File is empty.")
+                    raise EmptyFileError("Input CSV is empty")
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Step 3: validate header (the first line, split like the data lines)
+                    _, header_end, data_start = next(_line_spans(mm, 0, size))
+                    self._validate_header(mm[:header_end].decode('utf-8'))
+
+                    # Step 4: check at least one data line
+                    if data_start >= size:
+                        self.logger.log_error("CSVHandler: No data lines found after header.")
+                        raise NoDataLinesError("No data lines found after header.")
+
+                    current_id = 1
+                    for entry in self._scan_buffer(mm, data_start, size, 2, data.review_lines):
+                        data.append_entry(current_id, entry)
+                        current_id += 1
+        except (OSError, ValueError) as e:
+            # UnicodeDecodeError is a ValueError
+            self.logger.log_error(f"CSVHandler: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot read file: {e}")
+
+    def _read_checkpointed(self, data: Data):
+        """
+        Parses the CSV in blocks (see `_parse_blocks_into`, or in `self.jobs` processes like `_read_parallel` with
+        more than one job) and checkpoints the progress to `checkpoint_path`. The lines are split and numbered like
+        in `_read_serial`, so a resumed read reports the same line numbers as an uninterrupted one.
+
+        If the checkpoint file belongs to the current CSV, its entries and skipped lines are restored into `data`
+        first, and the parsing continues at the checkpointed byte offset: the bytes parsed before are never read
+        again. A new checkpoint (the entries and skipped lines parsed since the previous one, and the position)
+        is appended whenever `checkpoint_interval` more bytes have been parsed, so it costs a fraction of the
+        parsing. When the CSV is read completely, the checkpoint is removed.
+
+        A missing, stale or unreadable checkpoint starts the read from the beginning, a checkpoint that cannot
+        be written is logged and the read continues without checkpoints.
+
+        Args:
+            data (Data): The Data object to populate.
+
+        Raises:
+            InputFileNotFound, EmptyFileError, InvalidHeaderColumns, InvalidHeaderFormat, NoDataLinesError:
+            See `read_csv`.
+        """
+        checkpoint = self._load_checkpoint()
+        try:
+            f = open(self.csv_path, mode='rb')
+        except Exception as e:
+            self.logger.log_error(f"CSVHandler: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot open file: {e}")
+
+        writer = None
+        try:
+            with f:
+                size = os.fstat(f.fileno()).st_size
+                if checkpoint is None:
+                    offset, lineno, next_id = self._read_header(f, size), 1, 1
+                else:
+                    data._append_rows(checkpoint.data, range(1, checkpoint.next_id))
+                    data.review_lines.extend(checkpoint.data.review_lines)
+                    offset, lineno, next_id = checkpoint.offset, checkpoint.lineno, checkpoint.next_id
+                    self.logger.log_info(
+                        f"CSVHandler: Resuming from checkpoint '{self.checkpoint_path}' at line {lineno + 1} "
+                        f"with {next_id - 1} entries ({offset} of {size} bytes parsed)."
+                    )
+
+                try:
+                    writer = CheckpointWriter(self.checkpoint_path, source_signature(self.csv_path), offset, checkpoint)
+                except OSError as e:
+                    self.logger.log_warning(f"CSVHandler: Failed writing checkpoint '{self.checkpoint_path}': {e}")
+
+                if self.jobs > 1:
+                    progress = self._parse_ranges_into(data, self._split_byte_ranges(f, offset, size, lineno + 1), next_id)
+                else:
+                    progress = self._parse_blocks_into(data, f, offset, size, lineno, next_id)
+
+                # Position, first ID and first review line of the entries after the last checkpoint
+                checkpointed, first_id, first_review_line = offset, next_id, len(data.review_lines)
+                for offset, lineno, next_id in progress:
+                    if writer is None or offset - checkpointed < self.checkpoint_interval or offset >= size:
+                        continue
+                    try:
+                        writer.write(data, range(first_id, next_id), offset, lineno, data.review_lines[first_review_line:])
+                    except OSError as e:
+                        self.logger.log_warning(f"CSVHandler: Failed writing checkpoint '{self.checkpoint_path}': {e}")
+                        writer.close()
+                        writer = None
+                        continue
+                    checkpointed, first_id, first_review_line = offset, next_id, len(data.review_lines)
+                    self.logger.log_info(f"CSVHandler: Checkpoint at line {lineno} ({offset} of {size} bytes parsed).")
+        except (OSError, ValueError) as e:
+            # UnicodeDecodeError is a ValueError
+            self.logger.log_error(f"CSVHandler: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot read file: {e}")
+        finally:
+            if writer is not None:
+                writer.close()
+
+        try:
+            os.remove(self.checkpoint_path)
+        except OSError:
+            pass
+
+    def _load_checkpoint(self) -> Optional[Checkpoint]:
+        """
+        Loads the checkpoint of the CSV, if there is a valid one.
+
+        Returns:
+            Checkpoint: The restored state, or None if the CSV has to be parsed from the beginning.
+        """
+        if not os.path.isfile(self.checkpoint_path):
+            return None
+        try:
+            return load_checkpoint(self.checkpoint_path, source_signature(self.csv_path))
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.log_warning(f"CSVHandler: Ignoring checkpoint '{self.checkpoint_path}': {e}")
+            return None
+
+    def _read_header(self, f, size: int) -> int:
+        """
+        Reads and validates the header of the CSV (steps 2 to 4 of the reading methods).
+
+        Args:
+            f: The CSV file, opened in binary mode at its start.
+            size (int): Size of the file.
+
+        Returns:
+            int: Byte offset of the first data line.
+
+        Raises:
+            EmptyFileError, InvalidHeaderColumns, InvalidHeaderFormat, NoDataLinesError: See `read_csv`.
+        """
         # Step 2: check if the file is empty
-        if not lines:
+        first_line = _read_line(f)
+        if not first_line:
             self.logger.log_error("CSVHandler: File is empty.")
             raise EmptyFileError("Input CSV is empty")
 
         # Step 3: validate header
-        first_line = lines[0].strip()
+        self._validate_header(first_line.decode('utf-8'))
+
+        # Step 4: check at least one data line
+        data_start = f.tell()
+        if data_start >= size:
+            self.logger.log_error("CSVHandler: No data lines found after header.")
+            raise NoDataLinesError("No data lines found after header.")
+        return data_start
+
+    def _parse_blocks_into(self, data: Data, f, offset: int, size: int, lineno: int,
+                           next_id: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        Parses the CSV from `offset` in blocks of about PARALLEL_CHUNK_SIZE bytes, cut after the last complete
+        line of the block, and appends the entries to `data`. A block is decoded at once and split into lines
+        with `_split_lines`, like the text reader of `_read_serial` splits the file.
+
+        Args:
+            data (Data): The Data object to populate.
+            f: The CSV file, opened in binary mode.
+            offset (int): Byte offset of the first line to parse.
+            size (int): Size of the file.
+            lineno (int): Number of lines before `offset`.
+            next_id (int): ID of the first entry.
+
+        Yields:
+            Tuple[int, int, int]: After every block: the byte offset and the number of lines parsed, and the next ID.
+        """
+        f.seek(offset)
+        pending = b""
+        while offset < size:
+            block = f.read(self.PARALLEL_CHUNK_SIZE)
+            buf = pending + block
+            if not block or offset + len(buf) >= size:
+                # The last block (also if the file shrank while it was read)
+                end = len(buf)
+                size = offset + end
+            else:
+                end = _complete_lines_end(buf)
+            for row in _split_lines(buf[:end].decode('utf-8')):
+                lineno += 1
+                entry = self._parse_row(lineno, row, data.review_lines)
+                if entry is not None:
+                    data.append_entry(next_id, entry)
+                    next_id += 1
+            offset += end
+            pending = buf[end:]
+            if end:
+                yield offset, lineno, next_id
+
+    def _parse_ranges_into(self, data: Data, byte_ranges: List[Tuple[int, int, int]],
+                           next_id: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        Parses byte ranges of the CSV in worker processes and appends the entries to `data`, in file order.
+
+        Args:
+            data (Data): The Data object to populate.
+            byte_ranges (List[Tuple[int, int, int]]): The ranges, see `_split_byte_ranges`.
+            next_id (int): ID of the first entry.
+
+        Yields:
+            Tuple[int, int, int]: After every range: the byte offset and the number of lines parsed (None after the
+                                  last range), and the next ID.
+        """
+        for i, result in enumerate(self._parse_ranges(byte_ranges)):
+            next_id = self._append_range(data, result, next_id)
+            lineno = byte_ranges[i + 1][2] - 1 if i + 1 < len(byte_ranges) else None
+            yield byte_ranges[i][1], lineno, next_id
+
+    def _scan_buffer(self, buf, start: int, end: int, first_lineno: int, review_lines: List[Tuple[int, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Parses the lines in the byte range [start, end) of a bytes-like buffer (e.g. a memory map).
+
+        Field and line boundaries are found with `buf.find`, so only the three fields of a line
+        with the expected column count are sliced and decoded. Lines are split like in `_read_serial`,
+        see `_line_spans`.
+
+        Args:
+            buf: The buffer holding the raw CSV bytes (bytes or mmap.mmap).
+            start (int): Byte offset of the first line.
+            end (int): Byte offset after the last line.
+            first_lineno (int): The 1-based line number of the first line.
+            review_lines (List[Tuple[int, str]]): Skipped lines are appended here with their reason.
+
+        Yields:
+            Dict[str, Any]: The parsed entries, in file order.
+
+        Raises:
+            UnicodeDecodeError: If a field is not valid UTF-8.
+        """
+        find = buf.find
+        lineno = first_lineno
+        for pos, line_end, _ in _line_spans(buf, start, end):
+            # Step 5: check columns on the raw bytes
+            first = find(b";", pos, line_end)
+            second = -1 if first == -1 else find(b";", first + 1, line_end)
+            if second == -1 or find(b";", second + 1, line_end) != -1:
+                column_count = buf[pos:line_end].count(b";") + 1
+                self._skip(review_lines, lineno, f"{column_count} columns instead of 3",
+                           "CSVHandler: Line %d has %d columns, skipping.", lineno, column_count)
+            else:
+                entry = self._parse_fields(
+                    lineno,
+                    buf[pos:first].decode('utf-8'),
+                    buf[first + 1:second].decode('utf-8'),
+                    buf[second + 1:line_end].decode('utf-8'),
+                    review_lines
+                )
+                if entry is not None:
+                    yield entry
+
+            lineno += 1
+
+    def _read_parallel(self, data: Data):
+        """
+        Parses the CSV in `self.jobs` worker processes and appends the parsed entries to `data`.
+
+        The data section is split at newline boundaries into byte ranges, which are parsed
+        independently by `_parse_byte_range`. The results are merged in file order, so IDs,
+        line numbers, review lines and index order are the same as for the serial path.
+
+        Args:
+            data (Data): The Data object to populate.
+
+        Raises:
+            InputFileNotFound, EmptyFileError, InvalidHeaderColumns, InvalidHeaderFormat, NoDataLinesError:
+            See `read_csv`.
+        """
+        try:
+            with open(self.csv_path, mode='rb') as f:
+                # Step 2: check if the file is empty
+                first_line = _read_line(f)
+                if not first_line:
+                    self.logger.log_error("CSVHandler: File is empty.")
+                    raise EmptyFileError("Input CSV is empty")
+
+                # Step 3: validate header
+                self._validate_header(first_line.decode('utf-8'))
+
+                data_start = f.tell()
+                data_end = os.fstat(f.fileno()).st_size
+
+                # Step 4: check at least one data line
+                if data_start >= data_end:
+                    self.logger.log_error("CSVHandler: No data lines found after header.")
+                    raise NoDataLinesError("No data lines found after header.")
+
+                byte_ranges = self._split_byte_ranges(f, data_start, data_end)
+
+            # Merge in file order, the IDs continue across the ranges
+            current_id = 1
+            for result in self._parse_ranges(byte_ranges):
+                current_id = self._append_range(data, result, current_id)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.log_error(f"CSVHandler: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot read file: {e}")
+
+    def _parse_ranges(self, byte_ranges: List[Tuple[int, int, int]]) -> Iterator[Tuple]:
+        """
+        Parses byte ranges of the CSV in `self.jobs` worker processes (see `_parse_byte_range`).
+
+        Yields:
+            Tuple: The result of `_parse_byte_range` per range, in file order.
+        """
+        self.logger.log_info(
+            f"CSVHandler: Parsing {len(byte_ranges)} byte ranges in {self.jobs} processes."
+        )
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            futures = [
+                executor.submit(
+                    _parse_byte_range, self.csv_path, start, end, first_lineno, self.use_mmap, self.aggregate_skips
+                )
+                for start, end, first_lineno in byte_ranges
+            ]
+            for future in futures:
+                yield future.result()
+
+    @staticmethod
+    def _append_range(data: Data, result: Tuple, current_id: int) -> int:
+        """
+        Appends the entries and review lines of a parsed byte range to `data`.
+
+        Args:
+            data (Data): The Data object to populate.
+            result (Tuple): The result of `_parse_byte_range`.
+            current_id (int): The ID of the first entry of the range.
+
+        Returns:
+            int: The ID of the entry following the range.
+        """
+        requirements, test_cases, durations, statuses, review_lines = result
+        for requirement, test_case, duration, status in zip(requirements, test_cases, durations, statuses):
+            data.append_entry(current_id, {
+                "Requirement": requirement,
+                "Test Case": test_case,
+                "Duration": duration,
+                "Status": status
+            })
+            current_id += 1
+        data.review_lines.extend(review_lines)
+        return current_id
+
+    def _split_byte_ranges(self, f, start: int, end: int, first_lineno: int = 2) -> List[Tuple[int, int, int]]:
+        """
+        Splits the byte range [start, end) of a binary file at newline boundaries. The line numbers of the
+        ranges count the line endings of `_split_lines`, like the serial reading.
+
+        Args:
+            f: The CSV file, opened in binary mode.
+            start (int): Byte offset of the first data line.
+            end (int): Size of the file.
+            first_lineno (int, optional): The line number of the line at `start`. Defaults to 2 (after the header).
+
+        Returns:
+            List[Tuple[int, int, int]]: (start offset, end offset, line number of the first line) per range.
+        """
+        count = max(self.jobs, -(-(end - start) // self.PARALLEL_CHUNK_SIZE))
+        step = max(1, (end - start) // count)
+
+        byte_ranges = []
+        lineno = first_lineno
+        pos = start
+        while pos < end:
+            # Move the boundary to the start of the line following the target offset
+            f.seek(min(pos + step, end))
+            _read_line(f)
+            boundary = min(f.tell(), end)
+
+            byte_ranges.append((pos, boundary, lineno))
+            lineno += self._count_line_endings(f, pos, boundary)
+            pos = boundary
+
+        return byte_ranges
+
+    def _count_line_endings(self, f, start: int, end: int) -> int:
+        """Counts the line endings (see `_split_lines`) in the byte range [start, end) of a binary file."""
+        f.seek(start)
+        count = 0
+        carriage_return = False
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(remaining, self.READ_CHUNK_SIZE))
+            if not block:
+                break
+            count += _count_line_endings(block)
+            if carriage_return and block.startswith(b"\n"):
+                # A '\r\n' split across two blocks was counted twice
+                count -= 1
+            carriage_return = block.endswith(b"\r")
+            remaining -= len(block)
+        return count
+
+    def _validate_header(self, first_line: str):
+        """
+        Validates the header line of the CSV.
+
+        Args:
+            first_line (str): The first line of the CSV file.
+
+        Raises:
+            InvalidHeaderColumns: If the header does not have exactly 3 columns.
+            InvalidHeaderFormat: If the header does not match 'Test case;Duration;Status'.
+        """
         expected_header = ["Test case", "Duration", "Status"]
-        header_parts = first_line.split(";")
+        header_parts = first_line.strip().split(";")
 
         # 3-1: check if exactly 3 columns
         if len(header_parts) != 3:
@@ -89,165 +884,321 @@ class CSVHandler:
             )
             raise InvalidHeaderFormat("Header does not match 'Test case;Duration;Status'")
 
-        # Step 4: check at least one data line
-        if len(lines) == 1:
-            self.logger.log_error("CSVHandler: No data lines found after header.")
-            raise NoDataLinesError("No data lines found after header.")
+    def _parse_row(self, lineno: int, row_str: str, review_lines: List[Tuple[int, str]]) -> Optional[Dict[str, Any]]:
+        """
+        Validates and parses one data line.
 
-        # The loop. Processes each line after the header. Exceptions are not thrown inside the loop, as invalid lines are handled.
-        current_id = 1
-        for lineno in range(1, len(lines)):
-            row_str = lines[lineno].rstrip("\n")
-            columns = row_str.split(";")
+        Args:
+            lineno (int): The 1-based line number of the row in the file.
+            row_str (str): The line without the trailing newline.
+            review_lines (List[Tuple[int, str]]): Skipped lines are appended here with their reason.
 
-            # Step 5: check columns
-            if len(columns) != 3:
-                self.logger.log_warning(
-                    f"CSVHandler: Line {lineno+1} has {len(columns)} columns, skipping."
-                )
-                data.review_lines.append((lineno+1, f"{len(columns)} columns instead of 3"))
-                continue
+        Returns:
+            Optional[Dict[str, Any]]: The parsed entry, or None if the line was skipped.
+        """
+        columns = row_str.split(";")
 
-            test_case_str, duration_str, status_str = columns
+        # Step 5: check columns
+        if len(columns) != 3:
+            self._skip(review_lines, lineno, f"{len(columns)} columns instead of 3",
+                       "CSVHandler: Line %d has %d columns, skipping.", lineno, len(columns))
+            return None
 
-            # Step 6: check empty fields
-            if not test_case_str.strip() or not duration_str.strip() or not status_str.strip():
-                self.logger.log_warning(
-                    f"CSVHandler: Empty field at line {lineno+1}, skipping."
-                )
-                data.review_lines.append((lineno+1, "Empty field"))
-                continue
+        return self._parse_fields(lineno, *columns, review_lines)
 
-            # Step 7a) TestCase
-            parsed_tc = self.parsers.get("Test Case").parse(test_case_str)
-            if parsed_tc is None:
-                self.logger.log_warning(
-                    f"CSVHandler: Test Case parsing error at line {lineno+1}, skipping."
-                )
-                data.review_lines.append((lineno+1, f"Test case parse error. Invalid value: '{test_case_str}'"))
-                continue
+    def _parse_fields(self, lineno: int, test_case_str: str, duration_str: str, status_str: str,
+                      review_lines: List[Tuple[int, str]]) -> Optional[Dict[str, Any]]:
+        """
+        Validates and parses the three fields of a data line.
 
-            # Step 7b) Duration
-            parsed_duration = self.parsers.get("Duration").parse(duration_str)
-            if parsed_duration is None:
-                self.logger.log_warning(
-                    f"CSVHandler: Duration parsing error at line {lineno+1}, skipping."
-                )
-                data.review_lines.append((lineno+1, f"Duration parse error. Invalid value: '{duration_str}'"))
-                continue
+        Args:
+            lineno (int): The 1-based line number of the row in the file.
+            test_case_str (str): The raw test case field.
+            duration_str (str): The raw duration field.
+            status_str (str): The raw status field.
+            review_lines (List[Tuple[int, str]]): Skipped lines are appended here with their reason.
 
-            # Step 7c) Status
-            parsed_status = self.parsers.get("Status").parse(status_str)
-            if parsed_status is None: # now not possible, as the Parser performs no validity checks
-                self.logger.log_warning(
-                    f"CSVHandler: Status parsing error at line {lineno+1}, skipping."
-                )
-                data.review_lines.append((lineno+1, f"Status parse error. Invalid value: '{status_str}'"))
-                continue
+        Returns:
+            Optional[Dict[str, Any]]: The parsed entry, or None if the line was skipped.
+        """
+        # Step 6: check empty fields
+        if not test_case_str.strip() or not duration_str.strip() or not status_str.strip():
+            self._skip(review_lines, lineno, "Empty field",
+                       "CSVHandler: Empty field at line %d, skipping.", lineno)
+            return None
 
-            # Build the final entry
-            entry = {
-                "Requirement": parsed_tc["Requirement"],
-                "Test Case": parsed_tc["Test Case"],
-                "Duration": parsed_duration,
-                "Status": parsed_status
-            }
-            data.add_entry(current_id, entry)
-            current_id += 1
+        # Step 7a) TestCase
+        parsed_tc = self.parsers.get("Test Case").parse(test_case_str)
+        if parsed_tc is None:
+            self._skip(review_lines, lineno, f"Test case parse error. Invalid value: '{test_case_str}'",
+                       "CSVHandler: Test Case parsing error at line %d, skipping.", lineno)
+            return None
 
-        # Step 8: check if we have any data lines (possible if the file contained a valid header but invalid data lines)
-        if data.get_size() == 0:
-            self.logger.log_error("CSVHandler: No valid data lines found.")
-            raise NoValidLinesError("No valid lines in CSV")
+        # Step 7b) Duration
+        parsed_duration = self.parsers.get("Duration").parse(duration_str)
+        if parsed_duration is None:
+            self._skip(review_lines, lineno, f"Duration parse error. Invalid value: '{duration_str}'",
+                       "CSVHandler: Duration parsing error at line %d, skipping.", lineno)
+            return None
 
-        # Finally, log and notify about skipped lines
-        self._log_review_lines(data)
+        # Step 7c) Status
+        parsed_status = self.parsers.get("Status").parse(status_str)
+        if parsed_status is None: # now not possible, as the Parser performs no validity checks
+            self._skip(review_lines, lineno, f"Status parse error. Invalid value: '{status_str}'",
+                       "CSVHandler: Status parsing error at line %d, skipping.", lineno)
+            return None
 
-        return data
+        # Build the final entry
+        return {
+            "Requirement": parsed_tc["Requirement"],
+            "Test Case": parsed_tc["Test Case"],
+            "Duration": parsed_duration,
+            "Status": parsed_status
+        }
+
+    def _skip(self, review_lines: List[Tuple[int, str]], lineno: int, reason: str, message: str, *args):
+        """
+        Records a skipped line and logs the per-line warning `message % args`.
+
+        In aggregation mode, only the first `skip_examples` warnings of each reason category are logged.
+
+        Args:
+            review_lines (List[Tuple[int, str]]): The skipped line is appended here with its reason.
+            lineno (int): The 1-based line number of the skipped line.
+            reason (str): The reason stored in review_lines.
+            message (str): The %-style warning message.
+            *args: The arguments of the warning message.
+        """
+        review_lines.append((lineno, reason))
+        if not self.logger.is_enabled_for(logging.WARNING):
+            return
+        if self.aggregate_skips:
+            category = self._skip_category(reason)
+            emitted = self._skip_warnings.get(category, 0)
+            self._skip_warnings[category] = emitted + 1
+            if emitted >= self.skip_examples:
+                return
+        self.logger.log_warning(message, *args)
+
+    @staticmethod
+    def _skip_category(reason: str) -> str:
+        """
+        Returns the category of a skip reason, i.e. the reason without the offending value.
+
+        Example: "Duration parse error. Invalid value: '5 days'" -> "Duration parse error"
+        """
+        return reason.split(". Invalid value:", 1)[0]
+
+    def summarize_review_lines(self, review_lines: List[Tuple[int, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregates skipped lines by reason category.
+
+        Args:
+            review_lines (List[Tuple[int, str]]): The skipped lines with their reasons.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per category (in order of first occurrence), the number of
+            skipped lines ("count") and the first `skip_examples` line numbers ("examples").
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for line_no, reason in review_lines:
+            category = self._skip_category(reason)
+            entry = summary.get(category)
+            if entry is None:
+                entry = summary[category] = {"count": 0, "examples": []}
+            entry["count"] += 1
+            if len(entry["examples"]) < self.skip_examples:
+                entry["examples"].append(line_no)
+        return summary
+
+    def _write_quarantine(self, review_lines: List[Tuple[int, str]]):
+        """
+        Writes the skipped lines to the quarantine file in bulk: 'Line;Reason;Content' per skipped line.
+
+        The content of the skipped lines is taken from a second sequential read of the input,
+        so the parse loop does not have to keep the raw lines.
+
+        Args:
+            review_lines (List[Tuple[int, str]]): The skipped lines with their reasons.
+
+        Raises:
+            CSVExportError: If the quarantine file cannot be written.
+        """
+        out = ["Line;Reason;Content\n"]
+        try:
+            out.extend(self._quarantine_rows(self.csv_path, review_lines))
+
+            with open(self.quarantine_path, mode='w', encoding='utf-8') as f:
+                f.write("".join(out))
+        except (UnicodeDecodeError, *DECOMPRESSION_ERRORS) as e:
+            self.logger.log_error(f"CSVHandler: Failed writing quarantine file '{self.quarantine_path}': {e}")
+            raise CSVExportError(f"Failed to write quarantine file: {e}")
+
+        self.logger.log_info(f"CSVHandler: Wrote {len(out) - 1} skipped lines to '{self.quarantine_path}'.")
+
+    @staticmethod
+    def _quarantine_rows(csv_path: str, review_lines: List[Tuple[int, str]], label: str = "") -> List[str]:
+        """
+        Returns the quarantine rows 'Line;Reason;Content' of the skipped lines of one CSV file.
+
+        Args:
+            csv_path (str): The CSV file, which is read again (decompressed if needed) up to the last skipped line.
+            review_lines (List[Tuple[int, str]]): The skipped lines of this file with their reasons.
+            label (str, optional): Prefix of the line numbers, e.g. 'station1.csv:'. Defaults to "".
+
+        Raises:
+            OSError, UnicodeDecodeError: If the file cannot be read.
+        """
+        reasons = dict(review_lines)
+        last_line = max(reasons)
+        rows = []
+        with open_text(csv_path, 'r', detect_compression(csv_path)) as f:
+            for lineno, row in enumerate(f, start=1):
+                if lineno in reasons:
+                    content = row.rstrip("\n")
+                    rows.append(f"{label}{lineno};{reasons[lineno]};{content}\n")
+                if lineno >= last_line:
+                    break
+        return rows
 
     def _log_review_lines(self, data):
         """
         Logs a warning message with the number of skipped lines and their reasons.
 
+        In aggregation mode, a bounded summary per reason category is logged and printed instead.
+
         Args:
             data (Data): The Data object containing the review_lines information.
         """
-        if data.review_lines:
+        if not data.review_lines:
+            return
+
+        if self.aggregate_skips:
+            summary = self.summarize_review_lines(data.review_lines)
             self.logger.log_warning(
-                f"{len(data.review_lines)} lines were skipped. Detailed reasons: {data.review_lines}"
+                "%d lines were skipped. Summary per reason: %s", len(data.review_lines), summary
+            )
+
+            print(f"{len(data.review_lines)} lines were skipped.")
+            for category, entry in summary.items():
+                examples = ", ".join(str(line_no) for line_no in entry["examples"])
+                more = ", ..." if entry["count"] > len(entry["examples"]) else ""
+                print(f"  - {category}: {entry['count']} lines (lines {examples}{more})")
+        else:
+            self.logger.log_warning(
+                "%d lines were skipped. Detailed reasons: %s", len(data.review_lines), data.review_lines
             )
 
             print(f"{len(data.review_lines)} lines were skipped.")
             for (line_no, reason) in data.review_lines:
                 print(f"  - Line {line_no} skipped: {reason}")
 
-    def export_csv(self, data: Data, export_folder: str, sort_key: str = "Duration", timestamp: bool = False):
+        if self.quarantine_path:
+            print(f"  Details of the skipped lines: {self.quarantine_path}")
+
+    def export_csv(self, data: Data, export_folder: str, sort_key: Union[str, Sequence[str]] = "Duration",
+                   timestamp: bool = False, compression: Optional[str] = None, compression_level: Optional[int] = None):
         """
-        Exports the data to a CSV file. The entries will be written in the order defined by the provided sort_key.
+        Exports the data to CSV files. The entries will be written in the order defined by the provided sort_key.
+
+        The rows are produced in batches of EXPORT_BATCH_SIZE: the fields of a batch are fetched column by column,
+        the durations are formatted by a memoizing DurationFormatter, and the batch is joined and written
+        with a single write call.
+
+        With several sort keys, one file per key is written from the same Data object. The sorted indexes
+        are built first, then the files are written concurrently by up to EXPORT_WORKERS threads.
+
+        With a compression, the files are compressed while they are written and get its suffix ('.gz', '.bz2', '.xz').
 
         Args:
             data (Data): The data object containing the entries to export.
             export_folder (str): The path to the folder where the exported CSV will be saved.
-            sort_key (str): The key that determines the order of entries in the exported CSV.
+            sort_key (Union[str, Sequence[str]]): The key(s) that determine the order of entries in the exported CSV(s).
                             Valid options: 'Requirement', 'Test Case', 'Duration', 'Status', or 'none'.
             timestamp (bool): Whether to include a timestamp in the filename.
+            compression (str, optional): 'gzip', 'bz2' or 'xz' to compress the exported CSV(s). Defaults to None.
+            compression_level (int, optional): The compression level (0-9, 1-9 for bz2). Defaults to 6 for gzip
+                                               and xz, 9 for bz2.
+
+        Raises:
+            CSVExportError: If there is an error writing a CSV file, or the compression is not supported.
+                            The other files are written nevertheless.
+        """
+        sort_keys = [sort_key] if isinstance(sort_key, str) else list(dict.fromkeys(sort_key))
+
+        # The sorted indexes are built lazily on first access, which is not thread-safe: build them up front
+        orders = []
+        for key in sort_keys:
+            if key == "none":
+                orders.append((key, list(data.data.keys())))
+            else:
+                orders.append((key, data.sorted_ids[key]))
+
+        if len(orders) == 1:
+            outcomes = [self._write_export(data, export_folder, *orders[0], timestamp, compression, compression_level)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(orders), self.EXPORT_WORKERS)) as pool:
+                futures = [pool.submit(self._write_export, data, export_folder, key, sorted_ids, timestamp,
+                                       compression, compression_level)
+                           for key, sorted_ids in orders]
+            outcomes = [future.exception() or future.result() for future in futures]
+
+        # Report in the order of the sort keys, independent of which thread finished first
+        for outcome in outcomes:
+            if not isinstance(outcome, Exception):
+                print(f"CSV exported successfully to {outcome}")
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+
+    def _write_export(self, data: Data, export_folder: str, sort_key: str, sorted_ids: Sequence[int],
+                      timestamp: bool = False, compression: Optional[str] = None,
+                      compression_level: Optional[int] = None) -> str:
+        """
+        Writes one exported CSV file with the entries in the order of `sorted_ids`.
+
+        Returns:
+            str: The path of the written file.
 
         Raises:
             CSVExportError: If there is an error writing the CSV file.
         """
-        
-        if sort_key == "Requirement":
-            sorted_ids = data.sorted_ids["Requirement"]  
-        elif sort_key == "Test Case":
-            sorted_ids = data.sorted_ids["Test Case"]
-        elif sort_key == "Duration":
-            sorted_ids = data.sorted_ids["Duration"] 
-        elif sort_key == "Status":
-            sorted_ids = data.sorted_ids["Status"]
-        elif sort_key == "none":
-            sorted_ids = list(data.data.keys())
-
-        output_name = self._generate_output_filename(sort_key, timestamp)
+        output_name = self._generate_output_filename(sort_key, timestamp, compression)
         export_file = os.path.join(export_folder, output_name)
 
         try:
-            with open(export_file, mode='w', encoding='utf-8') as f:
+            formatter = DurationFormatter()
+            with open_text(export_file, 'w', compression, compression_level) as f:
                 f.write("Requirement;Test Case;Duration;Status\n")
-                for cid in sorted_ids:
-                    entry = data.data[cid]
-                    duration = entry['Duration']
-                    if duration < 1e-6:
-                        formatted_duration = f"{duration:.9f}".rstrip("0").rstrip(".")
-                    elif duration < 60:
-                        formatted_duration = f"{duration:.6f}".rstrip("0").rstrip(".")
-                    else:
-                        formatted_duration = f"{duration:.3f}".rstrip("0").rstrip(".")
-                    line = (f"{entry['Requirement']};"
-                            f"{entry['Test Case']};"
-                            f"{formatted_duration};"
-                            f"{entry['Status']}\n")
-                    f.write(line)
+                for start in range(0, len(sorted_ids), self.EXPORT_BATCH_SIZE):
+                    batch_ids = sorted_ids[start:start + self.EXPORT_BATCH_SIZE]
+                    requirements, test_cases, durations, statuses = data.columns_of(batch_ids, self.EXPORT_FIELDS)
+                    f.write("".join([
+                        f"{requirement};{test_case};{duration};{status}\n"
+                        for requirement, test_case, duration, status
+                        in zip(requirements, test_cases, formatter.format_many(durations), statuses)
+                    ]))
             self.logger.log_info(f"CSVHandler: Exported CSV to '{export_file}'.")
-            print(f"CSV exported successfully to {export_file}")
+            return export_file
         
         except Exception as e:
             self.logger.log_error(f"CSVHandler: Failed exporting CSV: {e}")
             raise CSVExportError(f"Failed to write CSV file: {e}")
 
-    def _generate_output_filename(self, sort_key: str, timestamp: bool = False) -> str:
+    def _generate_output_filename(self, sort_key: str, timestamp: bool = False, compression: Optional[str] = None) -> str:
         """
-        Generates the output filename based on the base name of the input CSV,
-        the sort key, and an optional timestamp.
+        Generates the output filename based on the base name of the input (see `_output_base_name`),
+        the sort key, an optional timestamp and the suffix of an optional compression.
 
         Args:
             sort_key (str): The key used for sorting.
             timestamp (bool): Whether to include a timestamp in the filename.
+            compression (str, optional): The compression of the exported file. Defaults to None.
 
         Returns:
             str: The generated output filename.
         """
-        base_name = os.path.splitext(os.path.basename(self.csv_path))[0]
-        output_name = base_name + "_"
+        output_name = self._output_base_name() + "_"
 
         if sort_key.lower() != "none":
             output_name += f"sorted_by_{sort_key}"
@@ -257,5 +1208,11 @@ class CSVHandler:
             output_name += "_" + timestamp_str
 
         output_name += ".csv"
+        if compression is not None:
+            output_name += SUFFIXES.get(compression, "")
         return output_name
+
+    def _output_base_name(self) -> str:
+        """Returns the base name of the exported files: the name of the input CSV without extensions."""
+        return os.path.splitext(strip_suffix(os.path.basename(self.csv_path)))[0]
     
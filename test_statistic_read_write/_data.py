@@ -1,38 +1,93 @@
 # test_statistic_read_write/_data.py
 
 import bisect
-from typing import Dict, Any, List, Tuple
+import sys
+from functools import lru_cache
+from array import array
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator, Mapping, MutableSequence, Sequence
+from ._logger import Logger
 
 class Data:
     """
     Holds:
     - data: Dict[int, Dict[str, Any]] for all valid entries.
-    - sorted_ids: Dict[str, List[int]] - a dictionary of lists. Each list contains IDs of entries, sorted by the corresponding key ("Requirement", "Test Case", "Duration", "Status").
-    - sorted_values: Dict[str, List[Any]] - a dictionary of lists. Each list contains the values of a specific key ("Requirement", "Test Case", "Duration", "Status"), sorted in ascending order. These lists are used for efficient insertion using `bisect`.
+    - sorted_ids: Mapping[str, List[int]] - a mapping of lists. Each list contains IDs of entries, sorted by the corresponding key ("Requirement", "Test Case", "Duration", "Status").
+    - sorted_values: Mapping[str, List[Any]] - a mapping of lists. Each list contains the values of a specific key ("Requirement", "Test Case", "Duration", "Status"), sorted in ascending order. These lists are used for efficient insertion using `bisect`.
     - status_collections: Dict[str, List[int]] - a dictionary storing lists of entry IDs for each unique status value.
     - review_lines: List[Tuple[int, str]] - a list of tuples, each containing the line number and reason for skipping invalid lines during CSV parsing.
+      In data merged from several files, the line number is a string 'file:line'.
+    - sources: List[Tuple[int, str]] - for data merged from several files, the first ID and the name of each file.
+
+    The sorted indexes are built lazily: an index is built with one sort the first time `sorted_ids[key]`
+    or `sorted_values[key]` is accessed, and is cached afterwards. A run that only needs the Duration
+    index never pays for sorting the other keys.
+
+    Entries can be added in two ways:
+    - add_entry: incremental insertion, the already built indexes are kept up to date via `bisect`.
+    - append_entry: bulk loading, the entries are appended unsorted and the cached indexes are dropped.
+      They are rebuilt lazily on the next access. The resulting order is identical to the one produced
+      by add_entry, including the order of equal values.
 
     The CSVHandler writes here, no one else manipulates it directly except reading.
     """
 
+    INDEX_KEYS = ("Requirement", "Test Case", "Duration", "Status")
+    # Maximum number of distinct requirement strings whose sort keys are memoized
+    REQUIREMENT_CACHE_SIZE = 16384
+
     def __init__(self):
+        self.logger = Logger()
         self.data: Dict[int, Dict[str, Any]] = {}
-        self.sorted_ids: Dict[str, List[int]] = {
-            "Requirement": [],
-            "Test Case": [],
-            "Duration": [],
-            "Status": []
-        }
-        self.sorted_values: Dict[str, List[Any]] = {
-            "Requirement": [],
-            "Test Case": [],
-            "Duration": [],
-            "Status": []
-        }
+        # Built (cached) indexes, filled on first access
+        self._sorted_ids: Dict[str, MutableSequence[int]] = {}
+        self._sorted_values: Dict[str, MutableSequence[Any]] = {}
+        self.sorted_ids: Mapping[str, List[int]] = _LazySortedIndexes(self, self._sorted_ids)
+        self.sorted_values: Mapping[str, List[Any]] = _LazySortedIndexes(self, self._sorted_values)
         self.status_collections: Dict[str, List[int]] = {}
         self.review_lines: List[Tuple[int, str]] = []
+        self.sources: List[Tuple[int, str]] = []
+        self._init_requirement_cache()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The logger and the memo cache (wraps a bound method) cannot be pickled, they are recreated on unpickling
+        state = self.__dict__.copy()
+        del state["logger"]
+        del state["_requirement_sort_key"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self.logger = Logger()
+        self._init_requirement_cache()
+
+    def _init_requirement_cache(self):
+        """Creates the bounded memo cache for requirement sort keys (one per Data object, i.e. per load)."""
+        self._requirement_sort_key = lru_cache(maxsize=self.REQUIREMENT_CACHE_SIZE)(self._parse_requirement_sort_key)
+
+    def requirement_cache_info(self) -> Dict[str, int]:
+        """
+        Returns the statistics of the requirement sort key cache.
+
+        Returns:
+            Dict[str, int]: {"hits": int, "misses": int, "size": int, "maxsize": int}
+        """
+        info = self._requirement_sort_key.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
 
     def _extract_requirement_sort_key(self, req_str: str) -> Tuple[int, str, int]:
+        """
+        Returns the sort key of a requirement string. Every distinct requirement is parsed once,
+        repeated requirements are served from a bounded memo cache and share the same key tuple.
+
+        Args:
+            req_str (str): The requirement string, e.g. "42_MotorUnit_3".
+
+        Returns:
+            Tuple[int, str, int]: (prefix number, main part, suffix number).
+        """
+        return self._requirement_sort_key(req_str)
+
+    def _parse_requirement_sort_key(self, req_str: str) -> Tuple[int, str, int]:
         parts = req_str.split("_")
         
         if len(parts) >= 3:
@@ -62,7 +117,7 @@ class Data:
             main_part = req_str
             suffix_num = 0
         
-        return (prefix_num, main_part, suffix_num)
+        return (prefix_num, sys.intern(main_part), suffix_num)
 
 
 
@@ -82,53 +137,498 @@ class Data:
         value_list.insert(idx, value)
         index_list.insert(idx, key)
 
-    def add_entry(self, key: int, entry: Dict[str, Any]):
+    def _store_entry(self, key: int, entry: Dict[str, Any]):
         """
-        Inserts a new record into the data dictionary and maintains sorted indexes for each field.
+        Stores an entry and registers its ID in the status collections.
+        Does not touch the sorted indexes.
 
         Args:
             key (int): The unique ID of the entry.
-            entry (Dict[str, Any]): The dictionary containing the entry's data, with keys "Requirement", "Test Case", "Duration", and "Status".
+            entry (Dict[str, Any]): The dictionary containing the entry's data.
         """
         # Store the entry "as is"
         self.data[key] = entry
 
-        req_val = entry["Requirement"]
-        tc_val = entry["Test Case"]
-        dur_val = entry["Duration"]
         stat_val = entry["Status"]
-
-        self._insert_into_sorted_index(
-            self.sorted_ids["Requirement"],
-            self.sorted_values["Requirement"],
-            key,
-            self._extract_requirement_sort_key(req_val)
-        )
-
-        self._insert_into_sorted_index(
-            self.sorted_ids["Test Case"],
-            self.sorted_values["Test Case"],
-            key,
-            tc_val
-        )
-        self._insert_into_sorted_index(
-            self.sorted_ids["Duration"],
-            self.sorted_values["Duration"],
-            key,
-            dur_val
-        )
-        self._insert_into_sorted_index(
-            self.sorted_ids["Status"],
-            self.sorted_values["Status"],
-            key,
-            stat_val
-        )
-
-        # Status
-        if stat_val not in self.status_collections:  
+        if stat_val not in self.status_collections:
             self.status_collections[stat_val] = []
-        self.status_collections[stat_val].append(key) 
+        self.status_collections[stat_val].append(key)
+
+    def row_ids(self) -> Sequence[int]:
+        """
+        Returns the IDs of all entries in insertion order.
+        """
+        return list(self.data.keys())
+
+    def column(self, field: str) -> Sequence[Any]:
+        """
+        Returns the values of one field of all entries in insertion order.
+
+        Args:
+            field (str): One of "Requirement", "Test Case", "Duration", "Status".
+        """
+        return [entry[field] for entry in self.data.values()]
+
+    def columns_of(self, ids: Sequence[int], fields: Sequence[str]) -> List[List[Any]]:
+        """
+        Returns the values of the given fields of the given entries, one list per field in the order of `ids`.
+        Used to process a batch of entries column by column (e.g. by the CSV export).
+
+        Args:
+            ids (Sequence[int]): IDs of the entries.
+            fields (Sequence[str]): Field names, e.g. ("Requirement", "Duration").
+        """
+        entries = list(map(self.data.__getitem__, ids))
+        return [[entry[field] for entry in entries] for field in fields]
+
+    def _index_values(self, index_key: str) -> Sequence[Any]:
+        """
+        Returns the values by which the entries are ordered in the given index, in insertion order.
+
+        Args:
+            index_key (str): One of "Requirement", "Test Case", "Duration", "Status".
+        """
+        if index_key == "Requirement":
+            return [self._extract_requirement_sort_key(value) for value in self.column(index_key)]
+        return self.column(index_key)
+
+    def _new_id_index(self, ids: Iterable[int]) -> MutableSequence[int]:
+        """Creates the container used for a sorted ID index."""
+        return list(ids)
+
+    def _new_value_index(self, index_key: str, values: Iterable[Any]) -> MutableSequence[Any]:
+        """Creates the container used for a sorted value index."""
+        return list(values)
+
+    def append_entry(self, key: int, entry: Dict[str, Any]):
+        """
+        Appends a new record without sorting it into the indexes (bulk-load path).
+
+        Already built indexes are dropped and rebuilt lazily on their next access.
+        Status collections are kept up to date, as appending to them is O(1).
+
+        Args:
+            key (int): The unique ID of the entry.
+            entry (Dict[str, Any]): The dictionary containing the entry's data, with keys "Requirement", "Test Case", "Duration", and "Status".
+        """
+        self._store_entry(key, entry)
+        if self._sorted_ids:
+            self._sorted_ids.clear()
+            self._sorted_values.clear()
+
+    def is_indexed(self, index_key: str) -> bool:
+        """
+        Returns True if the given index is already built.
+
+        Args:
+            index_key (str): One of "Requirement", "Test Case", "Duration", "Status".
+        """
+        return index_key in self._sorted_ids
+
+    def build_index(self, index_key: str):
+        """
+        Builds one sorted index from scratch with a single sort, unless it is already built.
+
+        `add_entry` inserts every value with `bisect_left`, so equal values end up ordered from the
+        most recently inserted to the oldest one. A stable sort over the entries in reversed insertion
+        order reproduces exactly this order.
+
+        Args:
+            index_key (str): One of "Requirement", "Test Case", "Duration", "Status".
+        """
+        if index_key in self._sorted_ids:
+            if index_key not in self._sorted_values:
+                # Restored ID permutation (e.g. from a snapshot), the values follow the same order
+                self._sorted_values[index_key] = self._sorted_values_for(index_key, self._sorted_ids[index_key])
+            return
+
+        ids = self.row_ids()
+        values = self._index_values(index_key)
+        order = sorted(range(len(ids) - 1, -1, -1), key=values.__getitem__)
+        self._sorted_values[index_key] = self._new_value_index(index_key, (values[pos] for pos in order))
+        self._sorted_ids[index_key] = self._new_id_index(ids[pos] for pos in order)
+
+        if index_key == "Requirement":
+            info = self.requirement_cache_info()
+            self.logger.log_info(
+                f"Data: Requirement sort keys built with {info['hits']} cache hits and {info['misses']} misses."
+            )
+
+    def _sorted_values_for(self, index_key: str, sorted_ids: Sequence[int]) -> MutableSequence[Any]:
+        """
+        Returns the index values of the given entries, in the order of `sorted_ids`.
+
+        Args:
+            index_key (str): One of "Requirement", "Test Case", "Duration", "Status".
+            sorted_ids (Sequence[int]): IDs of the entries.
+        """
+        if index_key == "Requirement":
+            values = (self._extract_requirement_sort_key(self.data[cid][index_key]) for cid in sorted_ids)
+        else:
+            values = (self.data[cid][index_key] for cid in sorted_ids)
+        return self._new_value_index(index_key, values)
+
+    def build_indexes(self):
+        """
+        Builds all sorted indexes that are not built yet.
+        """
+        for index_key in self.INDEX_KEYS:
+            self.build_index(index_key)
+
+    def add_entry(self, key: int, entry: Dict[str, Any]):
+        """
+        Inserts a new record into the data dictionary and maintains the already built sorted indexes.
+        Indexes that are not built yet will include the entry once they are built.
+
+        Args:
+            key (int): The unique ID of the entry.
+            entry (Dict[str, Any]): The dictionary containing the entry's data, with keys "Requirement", "Test Case", "Duration", and "Status".
+        """
+        self._store_entry(key, entry)
+
+        for index_key in self._sorted_ids:
+            value = entry[index_key]
+            if index_key == "Requirement":
+                value = self._extract_requirement_sort_key(value)
+            self._insert_into_sorted_index(
+                self._sorted_ids[index_key],
+                self.sorted_values[index_key],
+                key,
+                value
+            )
 
-        
     def get_size(self) -> int:
         return len(self.data)
+
+    def source_of(self, key: int) -> Optional[str]:
+        """
+        Returns the name of the file an entry was read from, or None if the data was not merged from several files.
+
+        Args:
+            key (int): The ID of the entry.
+        """
+        pos = bisect.bisect_right([first_id for first_id, _ in self.sources], key) - 1
+        return self.sources[pos][1] if pos >= 0 else None
+
+    def _append_rows(self, part: "Data", new_ids: range):
+        """
+        Stores the entries of another Data object under new IDs, without touching the sorted indexes (used by `merged`).
+
+        Args:
+            part (Data): The entries to store.
+            new_ids (range): The new IDs, one per entry of `part` in insertion order.
+        """
+        for new_id, entry in zip(new_ids, part.data.values()):
+            self._store_entry(new_id, entry)
+
+    @classmethod
+    def merged(cls, parts: Sequence[Tuple[str, "Data"]]) -> "Data":
+        """
+        Creates one object holding the entries of several Data objects (e.g. one per input file), in order of the parts.
+
+        The entries get consecutive IDs across the parts, the first ID of every part is recorded in `sources`,
+        and the line numbers of the review lines are prefixed with the name of their part ('file:line').
+
+        The indexes built in every part are merged instead of sorted again: the per-part indexes are concatenated,
+        latest part first, and ordered by a stable sort, which detects the already sorted runs and merges them
+        (a k-way merge in C, faster than `heapq.merge`). Equal values end up in the same order as in an index
+        built over the merged entries. Other indexes are built lazily as usual.
+
+        Args:
+            parts (Sequence[Tuple[str, Data]]): The name and the Data object of every part.
+
+        Returns:
+            Data: The merged object, of the class this method is called on.
+        """
+        merged = cls()
+        renumbered = []
+        next_id = 1
+        for name, part in parts:
+            ids = part.row_ids()
+            new_ids = range(next_id, next_id + len(ids))
+            merged.sources.append((next_id, name))
+            merged._append_rows(part, new_ids)
+            merged.review_lines.extend((f"{name}:{line_no}", reason) for line_no, reason in part.review_lines)
+            renumbered.append(dict(zip(ids, new_ids)))
+            next_id += len(ids)
+
+        for index_key in cls.INDEX_KEYS:
+            if not parts or not all(part.is_indexed(index_key) for _, part in parts):
+                continue
+            values, ids = [], []
+            for (_, part), new_id in zip(reversed(parts), reversed(renumbered)):
+                values.extend(part.sorted_values[index_key])
+                ids.extend(map(new_id.__getitem__, part.sorted_ids[index_key]))
+            order = sorted(range(len(values)), key=values.__getitem__)
+            merged._sorted_values[index_key] = merged._new_value_index(index_key, (values[pos] for pos in order))
+            merged._sorted_ids[index_key] = merged._new_id_index(ids[pos] for pos in order)
+        return merged
+
+
+class _LazySortedIndexes(Mapping):
+    """
+    Read-only mapping view `index key -> sorted sequence` that builds an index on first access.
+    """
+
+    def __init__(self, owner: Data, built: Dict[str, MutableSequence[Any]]):
+        self._owner = owner
+        self._built = built
+
+    def __getitem__(self, index_key: str) -> MutableSequence[Any]:
+        if index_key not in self._built:
+            if index_key not in self._owner.INDEX_KEYS:
+                raise KeyError(index_key)
+            self._owner.build_index(index_key)
+        return self._built[index_key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owner.INDEX_KEYS)
+
+    def __len__(self) -> int:
+        return len(self._owner.INDEX_KEYS)
+
+
+class _StringTable:
+    """
+    Interned string table: every distinct string is stored once and referenced by a small int code.
+    """
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        """Returns the code of a string, adding it to the table if it is new."""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def from_values(cls, values: List[str]) -> "_StringTable":
+        """Creates a table holding `values` (distinct strings) with the codes 0..n-1."""
+        table = cls()
+        table.values = [sys.intern(value) for value in values]
+        table.codes = {value: code for code, value in enumerate(table.values)}
+        return table
+
+
+class _ColumnarRows(Mapping):
+    """
+    Read-only mapping view `ID -> entry dict` over the columns of a ColumnarData object.
+    The entry dictionaries are created on access and are not stored.
+    """
+
+    def __init__(self, owner: "ColumnarData"):
+        self._owner = owner
+
+    def __getitem__(self, key: int) -> Dict[str, Any]:
+        return self._owner._entry_at(self._owner._position(key))
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self._owner._position(key)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._owner._ids)
+
+    def __len__(self) -> int:
+        return len(self._owner._ids)
+
+
+class ColumnarData(Data):
+    """
+    Memory-efficient, columnar variant of Data.
+
+    Instead of one dictionary per entry, the entries are stored column-wise:
+    - IDs and durations in contiguous arrays ('q' and 'd').
+    - Requirements, test case names and statuses as int codes (array 'I') into interned string tables.
+
+    The read API is the same as for Data: `data` is a read-only mapping `ID -> entry dict` (entries
+    are created on access), `sorted_ids`, `sorted_values`, `status_collections` and `review_lines`
+    are available as usual. ID indexes and status collections are arrays instead of lists, duration
+    values are an array of doubles.
+
+    IDs must be unique. Consecutive, ascending IDs (as assigned by the CSVHandler) are looked up
+    arithmetically, any other ID sequence falls back to a position dictionary.
+    """
+
+    _CODED_FIELDS = {
+        "Requirement": "_requirements",
+        "Test Case": "_test_cases",
+        "Status": "_statuses",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._ids = array('q')
+        self._durations = array('d')
+        self._codes: Dict[str, array] = {field: array('I') for field in self._CODED_FIELDS}
+        self._requirements = _StringTable()
+        self._test_cases = _StringTable()
+        self._statuses = _StringTable()
+        # ID -> row position, only created if the IDs are not consecutive
+        self._positions: Dict[int, int] = None
+        self.data = _ColumnarRows(self)
+
+    def _table(self, field: str) -> _StringTable:
+        return getattr(self, self._CODED_FIELDS[field])
+
+    def _position(self, key: int) -> int:
+        """
+        Returns the row position of an ID.
+
+        Raises:
+            KeyError: If the ID is unknown.
+        """
+        if self._positions is not None:
+            return self._positions[key]
+        if self._ids:
+            pos = key - self._ids[0]
+            if 0 <= pos < len(self._ids):
+                return pos
+        raise KeyError(key)
+
+    def _entry_at(self, pos: int) -> Dict[str, Any]:
+        return {
+            "Requirement": self._requirements.values[self._codes["Requirement"][pos]],
+            "Test Case": self._test_cases.values[self._codes["Test Case"][pos]],
+            "Duration": self._durations[pos],
+            "Status": self._statuses.values[self._codes["Status"][pos]]
+        }
+
+    def _store_entry(self, key: int, entry: Dict[str, Any]):
+        ids = self._ids
+        if self._positions is not None:
+            self._positions[key] = len(ids)
+        elif ids and key != ids[0] + len(ids):
+            self._positions = {cid: pos for pos, cid in enumerate(ids)}
+            self._positions[key] = len(ids)
+        ids.append(key)
+
+        self._durations.append(entry["Duration"])
+        for field in self._CODED_FIELDS:
+            self._codes[field].append(self._table(field).code(entry[field]))
+
+        stat_val = entry["Status"]
+        if stat_val not in self.status_collections:
+            self.status_collections[stat_val] = array('q')
+        self.status_collections[stat_val].append(key)
+
+    def row_ids(self) -> Sequence[int]:
+        return self._ids
+
+    def column(self, field: str) -> Sequence[Any]:
+        if field == "Duration":
+            return self._durations
+        values = self._table(field).values
+        return [values[code] for code in self._codes[field]]
+
+    def columns_of(self, ids: Sequence[int], fields: Sequence[str]) -> List[List[Any]]:
+        if self._positions is not None:
+            positions = list(map(self._positions.__getitem__, ids))
+        elif not ids:
+            positions = []
+        else:
+            for cid in (min(ids), max(ids)):
+                self._position(cid)  # raises KeyError for unknown IDs
+            base = self._ids[0]
+            positions = [cid - base for cid in ids]
+        columns = []
+        for field in fields:
+            if field == "Duration":
+                durations = self._durations
+                columns.append([durations[pos] for pos in positions])
+            else:
+                values, codes = self._table(field).values, self._codes[field]
+                columns.append([values[codes[pos]] for pos in positions])
+        return columns
+
+    def _index_values(self, index_key: str) -> Sequence[Any]:
+        if index_key == "Duration":
+            return self._durations
+        # Sort keys are computed once per distinct string and shared between the rows
+        table_values = self._table(index_key).values
+        if index_key == "Requirement":
+            table_values = [self._extract_requirement_sort_key(value) for value in table_values]
+        return [table_values[code] for code in self._codes[index_key]]
+
+    def _sorted_values_for(self, index_key: str, sorted_ids: Sequence[int]) -> MutableSequence[Any]:
+        values = self._index_values(index_key)
+        position = self._position
+        return self._new_value_index(index_key, (values[position(cid)] for cid in sorted_ids))
+
+    @classmethod
+    def from_columns(cls, ids: array, durations: array, codes: Dict[str, array], tables: Dict[str, List[str]],
+                     status_collections: Dict[str, array], sorted_ids: Dict[str, array]) -> "ColumnarData":
+        """
+        Creates a ColumnarData object from its stored columns, without parsing or sorting (e.g. from a snapshot).
+
+        Args:
+            ids (array): The IDs ('q') in insertion order.
+            durations (array): The durations ('d') in insertion order.
+            codes (Dict[str, array]): Per coded field ("Requirement", "Test Case", "Status"), the codes ('I').
+            tables (Dict[str, List[str]]): Per coded field, the distinct strings in code order.
+            status_collections (Dict[str, array]): The IDs ('q') per status, in order of first occurrence.
+            sorted_ids (Dict[str, array]): Already built ID indexes ('q'). Their values are derived on first access.
+
+        Returns:
+            ColumnarData: The restored object.
+        """
+        data = cls()
+        data._ids = ids
+        data._durations = durations
+        data._codes = dict(codes)
+        for field, values in tables.items():
+            setattr(data, cls._CODED_FIELDS[field], _StringTable.from_values(values))
+        if ids and ids[-1] - ids[0] != len(ids) - 1:
+            data._positions = {cid: pos for pos, cid in enumerate(ids)}
+        data.status_collections = dict(status_collections)
+        data._sorted_ids.update(sorted_ids)
+        return data
+
+    def _append_rows(self, part: Data, new_ids: range):
+        if not isinstance(part, ColumnarData) or self._positions is not None or \
+                (self._ids and new_ids and new_ids[0] != self._ids[0] + len(self._ids)):
+            super()._append_rows(part, new_ids)
+            return
+        if not new_ids:
+            return
+
+        # Column-wise: the codes of the part are translated into codes of the own string tables
+        self._ids.extend(new_ids)
+        self._durations.extend(part._durations)
+        for field in self._CODED_FIELDS:
+            table = self._table(field)
+            translated = [table.code(value) for value in part._table(field).values]
+            self._codes[field].extend([translated[code] for code in part._codes[field]])
+
+        if part._positions is None:
+            shift = new_ids[0] - part._ids[0]
+            renumber = shift.__add__
+        else:
+            renumber = lambda cid: new_ids[part._positions[cid]]
+        for status, ids in part.status_collections.items():
+            if status not in self.status_collections:
+                self.status_collections[status] = array('q')
+            self.status_collections[status].extend(map(renumber, ids))
+
+    def _new_id_index(self, ids: Iterable[int]) -> MutableSequence[int]:
+        return array('q', ids)
+
+    def _new_value_index(self, index_key: str, values: Iterable[Any]) -> MutableSequence[Any]:
+        if index_key == "Duration":
+            return array('d', values)
+        return list(values)
+
+    def get_size(self) -> int:
+        return len(self._ids)
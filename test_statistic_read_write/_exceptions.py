@@ -24,6 +24,31 @@ class InvalidTopX(FriendlyException):
     pass
 
 
+class InvalidJobCount(FriendlyException):
+    """Raised when the number of parsing processes is invalid."""
+    pass
+
+
+class InvalidCacheSize(FriendlyException):
+    """Raised when the size limit of the parse cache is invalid."""
+    pass
+
+
+class InvalidCheckpointInterval(FriendlyException):
+    """Raised when the checkpoint interval of the ingest is invalid."""
+    pass
+
+
+class InvalidCompression(FriendlyException):
+    """Raised when an unsupported output compression or an invalid compression level is provided."""
+    pass
+
+
+class InvalidFollowMode(FriendlyException):
+    """Raised when an input cannot be followed or the refresh interval of the follow mode is invalid."""
+    pass
+
+
 class EmptyFileError(FriendlyException):
     """Raised when the input CSV file is empty."""
     pass
@@ -56,4 +81,9 @@ class CSVExportError(FriendlyException):
 
 class InvalidSortingKey(FriendlyException):
     """Raised when an invalid sorting key is provided for CSV export."""
-    pass
\ No newline at end of file
+    pass
+
+
+class InvalidGroupKey(FriendlyException):
+    """Raised when an invalid group-by key is provided."""
+    pass
@@ -0,0 +1,135 @@
+# test_statistic_read_write/_follower.py
+
+import os
+from typing import Callable, Dict, Any
+from ._csv_handler import CSVHandler, _complete_lines_end, _line_spans
+from ._compression import detect_compression
+from ._logger import Logger
+from ._exceptions import *
+
+
+class CSVFollower:
+    """
+    Follows a CSV file that is being appended to, e.g. by a test rig during a campaign.
+
+    The file is kept open. Every `poll` reads the bytes appended since the last poll, starting at the byte
+    offset where the previous poll stopped, and parses only the complete lines among them: a line the writer
+    has not finished yet is parsed by a later poll. The first poll reads (and validates) the header and
+    catches up with the existing content. A final poll (`final=True`, when following stops) also parses the
+    last line if it has no line ending, like the reading methods of the CSVHandler.
+
+    The entries are inserted into the target with `add_entry`, which keeps the already built sorted indexes
+    of a Data object up to date. A target without `add_entry` (e.g. a StreamingAnalysis) gets `append_entry`.
+    IDs and line numbers continue across the polls, skipped lines are recorded in the `review_lines` of the target.
+    The position (byte offset, line number, next ID) advances with every parsed line, so a poll that was interrupted
+    (e.g. by Ctrl+C) is continued by the next poll without parsing a line twice.
+
+    A file that shrinks (truncated or replaced) cannot be continued, the next poll raises an InputFileNotFound exception.
+    """
+
+    # Number of bytes read and parsed at once
+    BLOCK_SIZE = 8 << 20
+
+    def __init__(self, csv_handler: CSVHandler, target):
+        """
+        Args:
+            csv_handler (CSVHandler): The handler of the followed CSV, its parsers and skip options are used.
+            target: The object receiving the entries, e.g. a Data object.
+
+        Raises:
+            InputFileNotFound: If the file cannot be opened.
+            InvalidFollowMode: If the file is compressed.
+        """
+        self.logger = Logger()
+        self.csv_handler = csv_handler
+        self.csv_path = csv_handler.csv_path
+        self.target = target
+        self._insert: Callable[[int, Dict[str, Any]], None] = getattr(target, "add_entry", None) or target.append_entry
+        # Byte offset after the last parsed line, number of lines parsed (including the header), next entry ID
+        self.offset = 0
+        self.lineno = 0
+        self.next_id = target.get_size() + 1
+
+        try:
+            compression = detect_compression(self.csv_path)
+            self._file = open(self.csv_path, mode='rb')
+        except OSError as e:
+            self.logger.log_error(f"CSVFollower: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot open file: {e}")
+        if compression is not None:
+            self._file.close()
+            self.logger.log_error(f"CSVFollower: Cannot follow the {compression} compressed file '{self.csv_path}'.")
+            raise InvalidFollowMode(f"Cannot follow a {compression} compressed file: {self.csv_path}")
+
+    def poll(self, final: bool = False) -> int:
+        """
+        Parses the complete lines appended since the last poll and inserts their entries.
+
+        Args:
+            final (bool, optional): If True, the rest of the file after the last complete line is parsed as
+                                    the last line as well. Use it once, after the writer finished or when
+                                    following stops. Defaults to False.
+
+        Returns:
+            int: The number of inserted entries.
+
+        Raises:
+            InputFileNotFound: If the file cannot be read, or it shrank since the last poll.
+            InvalidHeaderColumns, InvalidHeaderFormat: If the header is invalid (checked once it is complete).
+        """
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < self.offset:
+                self.logger.log_error(f"CSVFollower: File '{self.csv_path}' shrank from {self.offset} to {size} bytes.")
+                raise InputFileNotFound(f"Followed file was truncated or replaced: {self.csv_path}")
+
+            added = 0
+            pending = b""
+            self._file.seek(self.offset)
+            for block in iter(lambda: self._file.read(self.BLOCK_SIZE), b""):
+                # buf starts at self.offset, _parse advances it to the end of the parsed lines
+                buf = pending + block
+                end = _complete_lines_end(buf)
+                if end:
+                    added += self._parse(buf, end)
+                pending = buf[end:]
+            if final and pending:
+                added += self._parse(pending, len(pending))
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.log_error(f"CSVFollower: Error reading file '{self.csv_path}': {e}")
+            raise InputFileNotFound(f"Cannot read file: {e}")
+
+        if added:
+            self.logger.log_info(f"CSVFollower: Parsed {added} new entries, up to line {self.lineno}.")
+        return added
+
+    def _parse(self, buf: bytes, end: int) -> int:
+        """
+        Parses the complete lines in buf[:end] (the header first, if it has not been read yet), which starts
+        at `self.offset`. Lines, also the header, are split like by the CSVHandler, see `_line_spans`.
+
+        Returns:
+            int: The number of inserted entries.
+        """
+        base = self.offset
+        start = 0
+        if self.lineno == 0:
+            _, header_end, start = next(_line_spans(buf, 0, end))
+            self.csv_handler._validate_header(buf[:header_end].decode('utf-8'))
+            self.lineno, self.offset = 1, base + start
+
+        added = 0
+        for line_start, line_end, next_pos in _line_spans(buf, start, end):
+            entry = self.csv_handler._parse_row(self.lineno + 1, buf[line_start:line_end].decode('utf-8'),
+                                                self.target.review_lines)
+            if entry is not None:
+                self._insert(self.next_id, entry)
+                self.next_id += 1
+                added += 1
+            self.lineno += 1
+            self.offset = base + next_pos
+        return added
+
+    def close(self):
+        """Closes the followed file."""
+        self._file.close()
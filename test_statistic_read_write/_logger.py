@@ -1,7 +1,23 @@
 # test_statistic_read_write/_logger.py
 
 import logging
+import logging.handlers
 import os
+import queue
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process queue. Merges the arguments into the message, but neither
+    copies nor formats the record in the calling thread; the listener thread formats it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            return super().prepare(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 class Logger:
     """
@@ -10,7 +26,11 @@ class Logger:
     Provides methods for:
     - Setting the log folder (adds a FileHandler).
     - Setting verbose mode (adjusts console logging level).
-    - Logging messages at different levels (info, error, warning).
+    - Logging messages at different levels (info, error, warning), with optional
+      %-style arguments that are only formatted if a handler emits the message.
+    - Cheap level checks (is_enabled_for) to skip building messages nobody receives.
+    - An optional asynchronous mode, in which records are handed to a background thread
+      through a queue, so callers never wait on console or file I/O.
     """
     _instance = None
 
@@ -30,13 +50,51 @@ class Logger:
         # By default, console handler at CRITICAL level (correponds to "no verbose")
         self.ch = logging.StreamHandler()
         self.ch.setLevel(logging.CRITICAL)
+        self._console_level = logging.CRITICAL
 
         # Set format
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         self.ch.setFormatter(formatter)
 
+        # Handlers owned by this class. Attached to the logger, or to the queue listener in asynchronous mode
+        self._handlers = []
+        self._queue_handler = None
+        self._listener = None
+
         if not self.logger.hasHandlers():
             self.logger.addHandler(self.ch)
+            self._handlers.append(self.ch)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Checks cheaply whether a message of the given level would be emitted by any handler.
+
+        Use it on hot paths to skip building log messages for disabled levels. Nothing is cached: the
+        levels of the logger and of all handlers reached through propagation are read on every call, so
+        handlers and levels changed later by other code (logging.basicConfig, pytest's caplog, an embedding
+        application) are respected.
+
+        Args:
+            level (int): A logging level, e.g. logging.WARNING.
+
+        Returns:
+            bool: True if a message of this level reaches at least one handler.
+        """
+        if not self.logger.isEnabledFor(level):
+            return False
+        if self.fh is not None or (self.ch in self._handlers and level >= self._console_level):
+            return True
+        if not isinstance(self.logger, logging.Logger):
+            return False
+        current = self.logger
+        while current:
+            for handler in current.handlers:
+                if handler is not self.ch and handler is not self._queue_handler and level >= handler.level:
+                    return True
+            if not current.propagate:
+                break
+            current = current.parent
+        return False
 
     def set_log_folder(self, folder: str):
         """
@@ -48,7 +106,7 @@ class Logger:
         """
         if self.fh:
             # if the log folder changes during execution
-            self.logger.removeHandler(self.fh)
+            self._detach_handler(self.fh)
             self.fh.close()
 
         log_path = os.path.join(folder, "test_statistic_read_wrte.log")
@@ -57,7 +115,7 @@ class Logger:
         self.fh.setLevel(logging.DEBUG)
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         self.fh.setFormatter(formatter)
-        self.logger.addHandler(self.fh)
+        self._attach_handler(self.fh)
 
     def set_verbose(self, enabled: bool):
         """
@@ -66,20 +124,106 @@ class Logger:
         Args:
             enabled (bool): Whether to enable verbose console logging.
         """
-        if enabled:
-            self.ch.setLevel(logging.INFO)
-        else:
-            self.ch.setLevel(logging.CRITICAL)
+        self._console_level = logging.INFO if enabled else logging.CRITICAL
+        self.ch.setLevel(self._console_level)
 
-    def log_info(self, message: str):
-        """Logs a message at the INFO level."""
-        self.logger.info(message)
+    def set_async(self, enabled: bool):
+        """
+        Enables or disables the asynchronous mode.
 
-    def log_error(self, message: str):
-        """Logs a message at the ERROR level."""
-        self.logger.error(message)
+        If enabled, the logger only puts records into a queue (QueueHandler); a background
+        QueueListener thread passes them to the console and file handler. Call flush() to
+        make sure all queued records are written.
 
-    def log_warning(self, message: str):
-        """Logs a message at the WARNING level."""
-        self.logger.warning(message)
+        Args:
+            enabled (bool): Whether to log asynchronously.
+        """
+        if enabled == (self._listener is not None):
+            return
 
+        if enabled:
+            for handler in self._handlers:
+                self.logger.removeHandler(handler)
+            log_queue = queue.SimpleQueue()
+            self._queue_handler = _QueueHandler(log_queue)
+            self.logger.addHandler(self._queue_handler)
+            self._listener = logging.handlers.QueueListener(log_queue, *self._handlers, respect_handler_level=True)
+            self._listener.start()
+        else:
+            self.logger.removeHandler(self._queue_handler)
+            self._listener.stop()
+            self._listener = None
+            self._queue_handler = None
+            for handler in self._handlers:
+                self.logger.addHandler(handler)
+
+    def flush(self):
+        """
+        Writes all pending records. In asynchronous mode, blocks until the queue is drained.
+        """
+        if self._listener is not None:
+            # stop() processes all queued records before it returns
+            self._listener.stop()
+            self._listener.start()
+        for handler in self._handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # The stream may already be closed at interpreter exit, as in logging.shutdown
+                pass
+
+    def _attach_handler(self, handler: logging.Handler):
+        """Attaches an owned handler to the logger, or to the queue listener in asynchronous mode."""
+        self._handlers.append(handler)
+        if self._listener is None:
+            self.logger.addHandler(handler)
+        else:
+            self._restart_listener()
+
+    def _detach_handler(self, handler: logging.Handler):
+        """Detaches an owned handler. In asynchronous mode, the queued records are written first."""
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+        if self._listener is None:
+            self.logger.removeHandler(handler)
+        else:
+            self._restart_listener()
+
+    def _restart_listener(self):
+        """Drains the queue and restarts the listener with the current handlers."""
+        self._listener.stop()
+        self._listener = logging.handlers.QueueListener(
+            self._listener.queue, *self._handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def _disable_async_in_child(self):
+        """Switches a forked child process back to synchronous handlers."""
+        if self._listener is not None:
+            self.logger.removeHandler(self._queue_handler)
+            self._listener = None
+            self._queue_handler = None
+            for handler in self._handlers:
+                self.logger.addHandler(handler)
+
+    def log_info(self, message: str, *args):
+        """Logs a message at the INFO level. `args` are merged into `message` with %-formatting when emitted."""
+        self.logger.info(message, *args)
+
+    def log_error(self, message: str, *args):
+        """Logs a message at the ERROR level. `args` are merged into `message` with %-formatting when emitted."""
+        self.logger.error(message, *args)
+
+    def log_warning(self, message: str, *args):
+        """Logs a message at the WARNING level. `args` are merged into `message` with %-formatting when emitted."""
+        self.logger.warning(message, *args)
+
+
+def _after_fork_in_child():
+    """A forked worker process has no listener thread, its Logger writes synchronously."""
+    if Logger._instance is not None:
+        Logger._instance._disable_async_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,198 @@
+# test_statistic_read_write/_multi_csv_handler.py
+
+import os
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from ._csv_handler import CSVHandler
+from ._compression import DECOMPRESSION_ERRORS, strip_suffix
+from ._data import Data, ColumnarData
+from ._exceptions import *
+
+
+def expand_input_paths(value: Union[str, Sequence[str]]) -> List[str]:
+    """
+    Returns the input files given by a path, a directory, a glob pattern, or a list of them.
+
+    A directory contributes its CSV files ('*.csv', also compressed: '*.csv.gz', '*.csv.bz2', '*.csv.xz'),
+    a glob pattern the CSV files it matches, both in name order. The same filter applies to both, so the
+    snapshot, checkpoint and quarantine files written next to the CSVs are never read as input. A path that
+    is neither is returned as is (its existence is checked by the caller). Duplicates are removed.
+
+    Args:
+        value (Union[str, Sequence[str]]): The input path(s).
+
+    Returns:
+        List[str]: The files, possibly empty if a directory or pattern does not match any.
+    """
+    paths = []
+    for item in [value] if isinstance(value, str) else value:
+        if os.path.isdir(item):
+            paths.extend(path for path in (os.path.join(item, name) for name in sorted(os.listdir(item)))
+                         if _is_csv_file(path))
+        elif any(char in item for char in "*?[") and not os.path.exists(item):
+            paths.extend(path for path in sorted(glob.glob(item)) if _is_csv_file(path))
+        else:
+            paths.append(item)
+    return list(dict.fromkeys(paths))
+
+
+def _is_csv_file(path: str) -> bool:
+    """Returns True if `path` is a file named like a CSV ('*.csv', also compressed), case-insensitive."""
+    return os.path.splitext(strip_suffix(path))[1].lower() == ".csv" and os.path.isfile(path)
+
+
+def _read_file(csv_path: str, columnar: bool, use_mmap: bool, aggregate_skips: bool,
+               index_keys: Sequence[str]) -> Data:
+    """
+    Worker function of the multi-file ingest. Parses one CSV and builds the given sorted indexes of its entries.
+
+    Module-level so it can be pickled into a worker process.
+
+    Returns:
+        Data: The entries of the file (a ColumnarData object if `columnar`), with IDs 1..n.
+    """
+    handler = CSVHandler(csv_path, columnar=columnar, use_mmap=use_mmap, aggregate_skips=aggregate_skips)
+    data = ColumnarData() if columnar else Data()
+    handler._read_into(data)
+    for index_key in index_keys:
+        data.build_index(index_key)
+    return data
+
+
+class _FileTarget:
+    """
+    Passes the entries of one file to the target of a multi-file read, with IDs continuing after the
+    entries of the previous files. The review lines are collected per file.
+    """
+
+    def __init__(self, target, first_id: int):
+        self.target = target
+        self.first_id = first_id
+        self.review_lines: List[Tuple[int, str]] = []
+        self.size = 0
+
+    def append_entry(self, key: int, entry):
+        self.target.append_entry(self.first_id + key - 1, entry)
+        self.size += 1
+
+    def get_size(self) -> int:
+        return self.size
+
+
+class MultiCSVHandler(CSVHandler):
+    """
+    CSVHandler reading several CSV files (e.g. one per test station) into one Data object.
+
+    The files are parsed concurrently by up to `jobs` worker processes, one file per process. Every worker
+    also builds the sorted indexes needed later (`index_keys`) for its file, the per-file indexes are then
+    merged (see `Data.merged`) instead of sorting all entries again. The entries get consecutive IDs
+    in the order of the files, skipped lines are reported as 'file:line'.
+
+    The export is the same as for a single file, the exported files are named after `output_name`.
+    Snapshots are not supported.
+    """
+
+    def __init__(self, csv_paths: Sequence[str], columnar: bool = False, jobs: int = 1, use_mmap: bool = False,
+                 aggregate_skips: bool = False, skip_examples: Optional[int] = None, quarantine_path: Optional[str] = None,
+                 index_keys: Sequence[str] = ("Duration",), output_name: str = "merged"):
+        """
+        Args:
+            csv_paths (Sequence[str]): Paths to the input CSV files (plain or compressed).
+            columnar, use_mmap, aggregate_skips, skip_examples, quarantine_path: See CSVHandler.
+            jobs (int, optional): Number of worker processes parsing the files, 1 parses them one after another in
+                                  the current process, 0 uses one process per CPU. Defaults to 1.
+            index_keys (Sequence[str], optional): The sorted indexes built per file and merged, e.g. the export
+                                                  sort keys. Defaults to ("Duration",).
+            output_name (str, optional): The base name of the exported files. Defaults to "merged".
+        """
+        super().__init__(csv_paths[0], columnar=columnar, jobs=jobs, use_mmap=use_mmap,
+                         aggregate_skips=aggregate_skips, skip_examples=skip_examples, quarantine_path=quarantine_path)
+        self.csv_paths = list(csv_paths)
+        self.index_keys = list(index_keys)
+        self.output_name = output_name
+
+        # Name of every file in the review lines: its path relative to the folder containing all files
+        folder = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in self.csv_paths])
+        self.sources: Dict[str, str] = {
+            os.path.relpath(os.path.abspath(path), folder).replace(os.sep, "/"): path for path in self.csv_paths
+        }
+
+    def read_csv(self, target=None):
+        """
+        Reads all CSV files into one Data object (or `target`), see CSVHandler.read_csv.
+
+        Without a target, the files are parsed concurrently and merged. A given target (e.g. a StreamingAnalysis)
+        receives the entries of the files one after another, in the current process.
+
+        Raises:
+            InputFileNotFound, EmptyFileError, InvalidHeaderColumns, InvalidHeaderFormat, NoDataLinesError:
+            If one of the files cannot be read. See CSVHandler.read_csv.
+            NoValidLinesError: If no file contains a valid data line.
+            CSVExportError: If the quarantine file cannot be written.
+
+        Returns:
+            Data: The merged Data object, or `target` if it was given.
+        """
+        if target is None:
+            data = self._read_files()
+        else:
+            data = target
+            for name, path in self.sources.items():
+                file_target = _FileTarget(target, target.get_size() + 1)
+                CSVHandler(path, use_mmap=self.use_mmap, aggregate_skips=self.aggregate_skips)._read_into(file_target)
+                target.review_lines.extend((f"{name}:{line_no}", reason) for line_no, reason in file_target.review_lines)
+
+        self._complete_read(data)
+        return data
+
+    def _read_files(self) -> Data:
+        """
+        Parses the files (concurrently with more than one job) and merges their entries and indexes.
+
+        Returns:
+            Data: The merged Data object.
+        """
+        options = (self.use_mmap, self.aggregate_skips, self.index_keys)
+        workers = min(self.jobs, len(self.csv_paths))
+        if workers > 1:
+            self.logger.log_info(f"CSVHandler: Parsing {len(self.csv_paths)} files in {workers} processes.")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # The workers return ColumnarData, which is pickled as a few arrays instead of one dict per entry
+                futures = [executor.submit(_read_file, path, True, *options) for path in self.sources.values()]
+                parts = [future.result() for future in futures]
+        else:
+            parts = [_read_file(path, self.columnar, *options) for path in self.sources.values()]
+
+        data_class = ColumnarData if self.columnar else Data
+        data = data_class.merged(list(zip(self.sources, parts)))
+        self.logger.log_info(f"CSVHandler: Merged {data.get_size()} entries of {len(parts)} files.")
+        return data
+
+    def _write_quarantine(self, review_lines: List[Tuple[str, str]]):
+        """
+        Writes the skipped lines of all files to the quarantine file: 'file:line;Reason;Content' per skipped line.
+
+        Raises:
+            CSVExportError: If the quarantine file cannot be written.
+        """
+        per_file: Dict[str, List[Tuple[int, str]]] = {}
+        for label, reason in review_lines:
+            name, line_no = label.rsplit(":", 1)
+            per_file.setdefault(name, []).append((int(line_no), reason))
+
+        out = ["Line;Reason;Content\n"]
+        try:
+            for name, file_review_lines in per_file.items():
+                out.extend(self._quarantine_rows(self.sources[name], file_review_lines, f"{name}:"))
+
+            with open(self.quarantine_path, mode='w', encoding='utf-8') as f:
+                f.write("".join(out))
+        except (UnicodeDecodeError, *DECOMPRESSION_ERRORS) as e:
+            self.logger.log_error(f"CSVHandler: Failed writing quarantine file '{self.quarantine_path}': {e}")
+            raise CSVExportError(f"Failed to write quarantine file: {e}")
+
+        self.logger.log_info(f"CSVHandler: Wrote {len(out) - 1} skipped lines to '{self.quarantine_path}'.")
+
+    def _output_base_name(self) -> str:
+        return self.output_name
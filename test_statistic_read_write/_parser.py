@@ -1,7 +1,9 @@
 # test_statistic_read_writec/_parser.py
 
 import re
-from typing import Optional, Dict, Any
+import logging
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from abc import ABC, abstractmethod
 from ._logger import Logger
 
@@ -41,14 +43,14 @@ class TestCaseParser(EntryParser):
             during parsing.
         """
         if value.count("\\") != 1:
-            self.logger.log_error(f"TestCaseParser: Expected exactly one backslash in '{value}'.")
+            if self.logger.is_enabled_for(logging.ERROR):
+                self.logger.log_error("TestCaseParser: Expected exactly one backslash in '%s'.", value)
             return None
 
         left, right = value.split("\\", 1)
         if not left.strip() or not right.strip():
-            self.logger.log_error(
-                f"TestCaseParser: One side of the backslash is empty in '{value}'."
-            )
+            if self.logger.is_enabled_for(logging.ERROR):
+                self.logger.log_error("TestCaseParser: One side of the backslash is empty in '%s'.", value)
             return None
 
         return {
@@ -56,13 +58,88 @@ class TestCaseParser(EntryParser):
             "Test Case": right.strip()
         }
 
+class _ParseCache:
+    """
+    Bounded memo cache for parse results, keyed on the raw input string.
+
+    Supports 'lru' (a hit refreshes the entry) and 'fifo' (entries are evicted in insertion order) eviction.
+    """
+    POLICIES = ("lru", "fifo")
+
+    def __init__(self, maxsize: int, policy: str = "lru"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown cache policy '{policy}'. Must be one of {self.POLICIES}.")
+        self.maxsize = max(0, maxsize)
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value of `key`, or None on a miss."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any):
+        """Stores `value` under `key`, evicting the oldest entry when the cache is full."""
+        if self.maxsize == 0:
+            return
+        if len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+        self._entries[key] = value
+
+    def clear(self):
+        """Removes all entries and resets the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Returns the cache statistics, including the hit rate over all lookups."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "policy": self.policy,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
 class DurationParser(EntryParser):
     """
     Parses time strings like "5 sec", "3 min 20 sec", applying checks for negativity,
     known units, zero duration, etc.
+
+    Results are memoized per raw string in a bounded cache (successes and failures, together
+    with the log messages of the parse), so repeated values skip parsing entirely.
     """
-    def __init__(self):
+
+    # Default number of distinct duration strings kept in the memo cache
+    CACHE_SIZE = 4096
+    # Default eviction policy of the memo cache
+    CACHE_POLICY = "lru"
+
+    def __init__(self, cache_size: Optional[int] = None, cache_policy: Optional[str] = None):
+        """
+        Args:
+            cache_size (int, optional): Maximum number of memoized duration strings, 0 disables
+                                        the cache. Defaults to CACHE_SIZE.
+            cache_policy (str, optional): Eviction policy of the cache, 'lru' or 'fifo'.
+                                          Defaults to CACHE_POLICY.
+        """
         self.logger = Logger()
+        self.cache = _ParseCache(
+            self.CACHE_SIZE if cache_size is None else cache_size,
+            self.CACHE_POLICY if cache_policy is None else cache_policy
+        )
         self.time_units = { # multipliers to convert into seconds
             'hr': 3600, 'hour': 3600,
             'min': 60,
@@ -82,74 +159,129 @@ class DurationParser(EntryParser):
             r'(-?\d+(\.\d+)?)\s+([a-zA-Z]+)',
             re.IGNORECASE
         )
+        # Anchored form of `pattern` for the single-pass scan, a token absorbs the spaces around it
+        self.token_pattern = re.compile(
+            r' *(-?\d+(?:\.\d+)?)\s+([a-zA-Z]+) *',
+            re.IGNORECASE
+        )
 
     def parse(self, value: str) -> Optional[float]:
         """
         Parses a time string (e.g., "5 sec", "3 min 20 sec").
 
+        A repeated value is answered from the memo cache, its log messages are emitted again.
+
         Returns:
             Optional[float]: The duration in seconds if successful, None otherwise.
         """
-        matches = list(self.pattern.finditer(value.lower()))
-        if not matches:
-            self.logger.log_error(f"DurationParser: Time format incorrect: '{value}'")
-            return None
+        cache = self.cache
+        if cache.maxsize:
+            cached = cache.get(value)
+            if cached is None:
+                cached = self._parse_uncached(value)
+                cache.put(value, cached)
+        else:
+            cached = self._parse_uncached(value)
 
-        matched_substrings = ''.join(m.group(0).replace(' ', '') for m in matches)
-        stripped_input = value.lower().replace(' ', '')
-        if matched_substrings != stripped_input:
-            unrecognized = stripped_input.replace(matched_substrings, '')
-            self.logger.log_error(
-                f"DurationParser: Unrecognized components in '{value}': '{unrecognized}'"
-            )
-            return None
+        result, events = cached
+        for level, message in events:
+            if level == "error":
+                if self.logger.is_enabled_for(logging.ERROR):
+                    self.logger.log_error(message)
+            elif self.logger.is_enabled_for(logging.WARNING):
+                self.logger.log_warning(message)
+        return result
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Returns the statistics of the memo cache.
+
+        Returns:
+            Dict[str, Any]: {"hits": int, "misses": int, "size": int, "maxsize": int, "policy": str, "hit_rate": float}
+        """
+        return self.cache.info()
+
+    def _parse_uncached(self, value: str) -> Tuple[Optional[float], Tuple[Tuple[str, str], ...]]:
+        """
+        Parses a time string without the memo cache, in a single left-to-right scan.
+
+        Each step matches one '<number> <unit>' token anchored at the current position, so
+        unrecognized components are found without re-joining and comparing the matches.
+        Format errors take precedence over value errors (negative value, unknown or repeated
+        unit), hence the first value error is only reported once the whole string has been
+        scanned; warnings of the tokens before it are kept, as with a per-token check.
 
+        Returns:
+            Tuple[Optional[float], Tuple[Tuple[str, str], ...]]: The duration in seconds (None on error)
+            and the (level, message) log events of the parse.
+        """
+        lowered = value.lower()
+        match = self.token_pattern.match
+        time_units = self.time_units
+        length = len(lowered)
+
+        events: Tuple[Tuple[str, str], ...] = ()
+        error = None
         total_seconds = 0.0
         used_units = set()
+        pos = 0
+        while pos < length:
+            token = match(lowered, pos)
+            if token is None:
+                break
+            pos = token.end()
+            if error is not None:
+                continue
 
-        for match in matches:
-            numeric_str = match.group(1)
-            unit = match.group(3)
-
+            numeric_str, unit = token.groups()
             try:
                 numeric_value = float(numeric_str)
             except ValueError:
-                self.logger.log_error(f"DurationParser: Invalid numeric value '{numeric_str}' in '{value}'")
-                return None
+                error = f"DurationParser: Invalid numeric value '{numeric_str}' in '{value}'"
+                continue
 
             if numeric_value < 0:
-                self.logger.log_error(
-                    f"DurationParser: Negative value '{numeric_value} {unit}' in '{value}'."
-                )
-                return None
-
-            if unit not in self.time_units:
-                self.logger.log_error(
-                    f"DurationParser: Unknown unit '{unit}' in '{value}'."
-                )
-                return None
-
-            if unit in used_units:
-                self.logger.log_error(
-                    f"DurationParser: Unit '{unit}' used multiple times in '{value}'."
-                )
-                return None
-            used_units.add(unit)
-
-            max_allowed = self.max_values[unit]
-            if unit in ('min', 'sec', 's') and numeric_value > max_allowed:
-                self.logger.log_warning(
-                    f"DurationParser: '{numeric_value} {unit}' > '{max_allowed}' is unusual."
-                )
-
-            multiplier = self.time_units[unit]
-            total_seconds += numeric_value * multiplier
+                error = f"DurationParser: Negative value '{numeric_value} {unit}' in '{value}'."
+            elif unit not in time_units:
+                error = f"DurationParser: Unknown unit '{unit}' in '{value}'."
+            elif unit in used_units:
+                error = f"DurationParser: Unit '{unit}' used multiple times in '{value}'."
+            else:
+                used_units.add(unit)
+                if unit in ('min', 'sec', 's') and numeric_value > self.max_values[unit]:
+                    events += ((
+                        "warning",
+                        f"DurationParser: '{numeric_value} {unit}' > '{self.max_values[unit]}' is unusual."
+                    ),)
+                total_seconds += numeric_value * time_units[unit]
+
+        if pos < length or pos == 0:
+            return None, (("error", self._describe_format_error(value)),)
+
+        if error is not None:
+            return None, events + (("error", error),)
 
         if total_seconds == 0.0:
-            self.logger.log_error(f"DurationParser: Total duration is zero for '{value}'.")
-            return None
+            return None, events + (("error", f"DurationParser: Total duration is zero for '{value}'."),)
+
+        return total_seconds, events
+
+    def _describe_format_error(self, value: str) -> str:
+        """
+        Builds the error message for a time string that is not a sequence of '<number> <unit>' tokens.
 
-        return total_seconds
+        Only called on the error path, it reproduces the messages of the token search.
+
+        Returns:
+            str: The error message.
+        """
+        matches = list(self.pattern.finditer(value.lower()))
+        if not matches:
+            return f"DurationParser: Time format incorrect: '{value}'"
+
+        matched_substrings = ''.join(m.group(0).replace(' ', '') for m in matches)
+        unrecognized = value.lower().replace(' ', '').replace(matched_substrings, '')
+        return f"DurationParser: Unrecognized components in '{value}': '{unrecognized}'"
 
 class StatusParser(EntryParser):
     """
@@ -166,3 +298,56 @@ class StatusParser(EntryParser):
             Optional[str]: The stripped status string. Can return None in the future, if validity checks are applied.
         """
         return value.strip()
+
+class DurationFormatter:
+    """
+    Formats durations in seconds for the CSV export: 9 decimals below 1 microsecond, 6 below one minute
+    and 3 otherwise, without trailing zeros (e.g. 0.000000001, 1.25, 3600.001, 60).
+
+    Results are memoized per value in a bounded dictionary, as test durations repeat a lot.
+    When it is full, it is emptied and refilled with the values that follow.
+    """
+
+    # Default number of distinct durations kept in the memo cache
+    CACHE_SIZE = 65536
+
+    def __init__(self, cache_size: Optional[int] = None):
+        """
+        Args:
+            cache_size (int, optional): Maximum number of memoized durations. Defaults to CACHE_SIZE.
+        """
+        self.cache_size = self.CACHE_SIZE if cache_size is None else cache_size
+        self._cache: Dict[float, str] = {}
+
+    @staticmethod
+    def format_uncached(duration: float) -> str:
+        """Formats one duration without the memo cache."""
+        if duration < 1e-6:
+            return f"{duration:.9f}".rstrip("0").rstrip(".")
+        elif duration < 60:
+            return f"{duration:.6f}".rstrip("0").rstrip(".")
+        return f"{duration:.3f}".rstrip("0").rstrip(".")
+
+    def _format_miss(self, duration: float) -> str:
+        cache = self._cache
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        text = cache[duration] = self.format_uncached(duration)
+        return text
+
+    def format(self, duration: float) -> str:
+        """Formats one duration."""
+        return self._cache.get(duration) or self._format_miss(duration)
+
+    def format_many(self, durations: Iterable[float]) -> List[str]:
+        """
+        Formats a batch of durations. A repeated value costs one dictionary lookup.
+
+        Args:
+            durations (Iterable[float]): The durations in seconds.
+
+        Returns:
+            List[str]: The formatted durations, in the same order.
+        """
+        get, miss = self._cache.get, self._format_miss
+        return [get(duration) or miss(duration) for duration in durations]
@@ -8,6 +8,9 @@ class Printer:
     Displays analysis results on the console (or could be extended for other output).
     """
 
+    # Percentiles shown for the duration sketches
+    PERCENTILES = (0.5, 0.9, 0.99)
+
     def display_results(self, analysis: Dict[str, Any], formatting: bool = True):
         """
         Displays the analysis results either in a formatted table or as plain text.
@@ -20,6 +23,13 @@ class Printer:
                                     - "test_case_counts": Tuple[int, int, int] representing the total, valid, and skipped
                                                             test case counts.
                                     - "status_counts": Dict[str, int] representing the counts of each status.
+                                    Optional key:
+                                    - "duration_sketch_overall": DurationSketch representing the overall duration
+                                                                  distribution (with "duration_sketches").
+                                    - "duration_sketches": Dict[str, DurationSketch] representing the duration
+                                                            distribution per status.
+                                    - "groups": Dict[str, Any] representing the top groups of a group-by
+                                                ("key", "group_count", "top_groups").
             formatting (bool, optional): If True, displays results in a formatted table.
                                         If False, displays results as plain text. Defaults to True.
         """
@@ -40,6 +50,14 @@ class Printer:
         else:
             print("  No status data available.")
 
+        duration_sketch_overall = analysis.get("duration_sketch_overall")
+        if duration_sketch_overall is not None:
+            self.do_distribution_output(duration_sketch_overall, analysis["duration_sketches"])
+
+        groups = analysis.get("groups")
+        if groups:
+            self.do_group_output(groups)
+
         num_entries = len(top_entries)
         if num_entries > 0:
             print(f"Top {num_entries} (Longest Tests):\n")
@@ -51,6 +69,77 @@ class Printer:
         else:
             self.do_basic_output(top_entries)
 
+    def do_distribution_output(self, duration_sketch_overall: Any, duration_sketches: Dict[str, Any]):
+        """
+        Displays the approximate duration percentiles and the log-scale duration histogram overall ("All")
+        and per status.
+
+        Args:
+            duration_sketch_overall (DurationSketch): Duration sketch of all entries.
+            duration_sketches (Dict[str, DurationSketch]): Duration sketches per status.
+        """
+        groups = [("All", duration_sketch_overall), *duration_sketches.items()]
+        accuracy = max(sketch.alpha for _, sketch in groups)
+        print(f"Duration Percentiles (Approx. +/-{accuracy:.0%}, Seconds):")
+        for group, sketch in groups:
+            values = ", ".join(
+                f"p{q * 100:g} {sketch.quantile(q):.3f}" for q in self.PERCENTILES
+            ) if sketch.count else "no data"
+            print(f"  {group}: {values}")
+
+        histograms = [(group, dict(sketch.histogram())) for group, sketch in groups]
+        bounds = sorted({bound for _, histogram in histograms for bound in histogram})
+        if not bounds:
+            return
+
+        labels = [f"[{bound:g}, {bound * 10:g})" for bound in bounds]
+        label_width = max(len("Range"), *(len(label) for label in labels)) + 2
+        widths = [
+            max(len(group), *(len(str(histogram.get(bound, 0))) for bound in bounds)) + 2
+            for group, histogram in histograms
+        ]
+        print("Duration Histogram (Seconds, Log Scale):")
+        print("  " + "Range".ljust(label_width) + "".join(group.rjust(w) for (group, _), w in zip(histograms, widths)))
+        for bound, label in zip(bounds, labels):
+            counts = "".join(str(histogram.get(bound, 0)).rjust(w) for (_, histogram), w in zip(histograms, widths))
+            print("  " + label.ljust(label_width) + counts)
+
+    def do_group_output(self, groups: Dict[str, Any]):
+        """
+        Displays the top groups of a group-by in a table: count, total, mean, min and max duration, and the
+        number of entries per status with its share of the group.
+
+        Args:
+            groups (Dict[str, Any]): {"key": str, "group_count": int, "top_groups": List[Tuple[str, GroupStats]]}.
+        """
+        key = groups["key"]
+        top_groups = groups["top_groups"]
+        print(f"Top {len(top_groups)} of {groups['group_count']} {key} Groups (By Total Duration):")
+        if not top_groups:
+            return
+
+        statuses = []
+        for _, stats in top_groups:
+            statuses.extend(status for status in stats.status_counts if status not in statuses)
+
+        headers = [key, "Count", "Total (sec)", "Mean (sec)", "Min (sec)", "Max (sec)"] + statuses
+        rows = [
+            [group, str(stats.count), f"{stats.total:.3f}", f"{stats.mean:.3f}", f"{stats.min:.3f}", f"{stats.max:.3f}"]
+            + [
+                f"{stats.status_counts.get(status, 0)} ({stats.status_counts.get(status, 0) / stats.count:.1%})"
+                for status in statuses
+            ]
+            for group, stats in top_groups
+        ]
+
+        pad = 3
+        widths = [max(len(header), *(len(row[col]) for row in rows)) + pad for col, header in enumerate(headers)]
+        print("  " + "".join(header.ljust(width) for header, width in zip(headers, widths)).rstrip())
+        print("  " + "-" * (sum(widths) - pad))
+        for row in rows:
+            print("  " + "".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+        print()
+
     def do_advanced_output(self, top_entries: List[Tuple[int, Dict[str, Any]]]):
         """
         Displays the top entries in a formatted table with dynamic column widths.
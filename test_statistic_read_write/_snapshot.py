@@ -0,0 +1,211 @@
+# test_statistic_read_write/_snapshot.py
+
+"""
+Binary snapshot of a parsed Data object.
+
+Layout:
+    MAGIC (8 bytes) | header length (uint32, little endian) | JSON header | sections
+
+The header records the format version, the byte order and item sizes of the machine that wrote
+the snapshot, the size and modification time of the source CSV, and the offset and length of
+every section. Sections are 8-byte aligned and hold either the raw bytes of an array
+(IDs 'q', durations 'd', string codes 'I', status collections and sorted ID indexes 'q')
+or UTF-8 JSON (string tables, review lines).
+
+Loading maps the file, checks the header and copies the sections into arrays; nothing is parsed
+or sorted. The prebuilt index permutations are restored as they are, their values are derived on
+first access.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Tuple
+from ._data import Data, ColumnarData, _StringTable
+
+
+MAGIC = b"TSRWSNAP"
+VERSION = 1
+_HEADER_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+_TYPECODES = ("q", "d", "I")
+# Keys of the header besides "version"
+_HEADER_KEYS = ("byteorder", "itemsizes", "source", "sections", "statuses", "indexes", "rows")
+
+
+def snapshot_path_for(csv_path: str) -> str:
+    """Returns the path of the snapshot belonging to a CSV file (stored next to it)."""
+    return csv_path + ".snapshot"
+
+
+def source_signature(csv_path: str) -> Dict[str, int]:
+    """
+    Returns what identifies the current content of the source CSV: its size and modification time.
+
+    Raises:
+        OSError: If the file cannot be accessed.
+    """
+    stat = os.stat(csv_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _columns(data: Data) -> Tuple[array, array, Dict[str, array], Dict[str, List[str]]]:
+    """
+    Returns the IDs, durations, string codes and string tables of `data`.
+    ColumnarData already stores them, for Data they are encoded here.
+    """
+    if isinstance(data, ColumnarData):
+        tables = {field: data._table(field).values for field in ColumnarData._CODED_FIELDS}
+        return data._ids, data._durations, data._codes, tables
+
+    codes, tables = {}, {}
+    for field in ColumnarData._CODED_FIELDS:
+        table = _StringTable()
+        codes[field] = array('I', map(table.code, data.column(field)))
+        tables[field] = table.values
+    return array('q', data.row_ids()), array('d', data.column("Duration")), codes, tables
+
+
+def save_snapshot(data: Data, path: str, source: Dict[str, int]):
+    """
+    Writes `data` with all its built sorted indexes to a snapshot file.
+
+    The file is written under a temporary name and renamed, so a reader never sees a partial snapshot.
+
+    Args:
+        data (Data): The Data or ColumnarData object to store.
+        path (str): Path of the snapshot file.
+        source (Dict[str, int]): The `source_signature` of the CSV the data was parsed from.
+
+    Raises:
+        OSError: If the snapshot cannot be written.
+    """
+    ids, durations, codes, tables = _columns(data)
+    statuses = list(data.status_collections)
+
+    sections: List[Tuple[str, bytes]] = [("ids", ids.tobytes()), ("durations", durations.tobytes())]
+    for field, field_codes in codes.items():
+        sections.append((f"codes.{field}", field_codes.tobytes()))
+    sections.append(("tables", json.dumps(tables).encode("utf-8")))
+    sections.append(("review_lines", json.dumps(data.review_lines).encode("utf-8")))
+    for i, status in enumerate(statuses):
+        sections.append((f"status.{i}", array('q', data.status_collections[status]).tobytes()))
+    indexes = [key for key in data.INDEX_KEYS if data.is_indexed(key)]
+    for key in indexes:
+        sections.append((f"index.{key}", array('q', data.sorted_ids[key]).tobytes()))
+
+    offsets, offset = {}, 0
+    for name, payload in sections:
+        offsets[name] = [offset, len(payload)]
+        offset += len(payload) + (-len(payload) % _ALIGNMENT)
+
+    header = json.dumps({
+        "version": VERSION,
+        "byteorder": sys.byteorder,
+        "itemsizes": {code: array(code).itemsize for code in _TYPECODES},
+        "source": source,
+        "rows": len(ids),
+        "statuses": statuses,
+        "indexes": indexes,
+        "sections": offsets,
+    }).encode("utf-8")
+    prefix = len(MAGIC) + _HEADER_LENGTH.size + len(header)
+    padding = -prefix % _ALIGNMENT
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header) + padding))
+            f.write(header + b" " * padding)
+            for _, payload in sections:
+                f.write(payload)
+                f.write(b"\0" * (-len(payload) % _ALIGNMENT))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_snapshot(path: str, source: Dict[str, int]) -> ColumnarData:
+    """
+    Loads a snapshot written by `save_snapshot`.
+
+    The data is always restored as ColumnarData, which has the read API of Data.
+
+    Args:
+        path (str): Path of the snapshot file.
+        source (Dict[str, int]): The current `source_signature` of the CSV. The snapshot is only
+                                 used if it was written from the same file content.
+
+    Returns:
+        ColumnarData: The restored data, with the sorted indexes that were built when it was saved.
+
+    Raises:
+        OSError: If the snapshot cannot be read.
+        ValueError: If the file is not a snapshot, was written by another format version or machine
+                    layout, is truncated, or belongs to another version of the source CSV.
+    """
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError("empty snapshot file")
+
+    with buf:
+        start = len(MAGIC) + _HEADER_LENGTH.size
+        if len(buf) < start or buf[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a snapshot file")
+        (header_length,) = _HEADER_LENGTH.unpack_from(buf, len(MAGIC))
+        try:
+            header = json.loads(buf[start:start + header_length])
+        except ValueError:
+            raise ValueError("corrupt snapshot header")
+        if not isinstance(header, dict):
+            raise ValueError("corrupt snapshot header")
+        if header.get("version") != VERSION:
+            raise ValueError(f"unsupported snapshot version {header.get('version')}")
+        if any(key not in header for key in _HEADER_KEYS):
+            raise ValueError("corrupt snapshot header")
+        if header["byteorder"] != sys.byteorder or \
+                header["itemsizes"] != {code: array(code).itemsize for code in _TYPECODES}:
+            raise ValueError("snapshot was written on a machine with another data layout")
+        if header["source"] != source:
+            raise ValueError("snapshot is stale, the CSV has changed")
+
+        base = start + header_length
+        sections = header["sections"]
+
+        def section(name: str) -> bytes:
+            if name not in sections:
+                raise ValueError(f"snapshot section '{name}' is missing")
+            offset, length = sections[name]
+            payload = buf[base + offset:base + offset + length]
+            if len(payload) != length:
+                raise ValueError("truncated snapshot")
+            return payload
+
+        def column(name: str, typecode: str) -> array:
+            values = array(typecode)
+            values.frombytes(section(name))
+            return values
+
+        ids = column("ids", "q")
+        durations = column("durations", "d")
+        codes = {field: column(f"codes.{field}", "I") for field in ColumnarData._CODED_FIELDS}
+        tables: Dict[str, List[str]] = json.loads(section("tables"))
+        review_lines: List[Any] = json.loads(section("review_lines"))
+        status_collections = {
+            status: column(f"status.{i}", "q") for i, status in enumerate(header["statuses"])
+        }
+        sorted_ids = {key: column(f"index.{key}", "q") for key in header["indexes"]}
+
+    if not (len(ids) == len(durations) == header["rows"]) or any(len(c) != len(ids) for c in codes.values()):
+        raise ValueError("inconsistent snapshot columns")
+
+    data = ColumnarData.from_columns(ids, durations, codes, tables, status_collections, sorted_ids)
+    data.review_lines = [tuple(line) for line in review_lines]
+    return data
@@ -8,12 +8,15 @@ import atexit
 from test_statistic_read_write._logger import Logger
 from test_statistic_read_write.test_statistic_read_write import TestStatisticReadWrite
 from test_statistic_read_write._exceptions import FriendlyException
+from test_statistic_read_write._cache import ParseCache, default_cache_dir
+from test_statistic_read_write._csv_handler import CSVHandler
 
 
 def log_end_of_session():
-    """Logs an end-of-session message."""
+    """Logs an end-of-session message and writes all pending log records."""
     logger = Logger()
     logger.log_info("Execution ended.\n")
+    logger.flush()
 
 def main():
     """
@@ -40,14 +43,28 @@ def main():
         "  tsrw -i data.csv -o results -x 5 -v\n"
         "  tsrw -i input.csv -o output -L logs\n"
         "  tsrw -i input.csv -o output -s Requirement\n"
+        "  tsrw -i input.csv -o output -s Duration Requirement Status\n"
+        "  tsrw -i input.csv -o output --jobs 8\n"
+        "  tsrw -i nightly/ -o output --jobs 8\n"
+        "  tsrw -i 'nightly/station*.csv' other.csv -o output\n"
+        "  tsrw -i input.csv --report-only\n"
+        "  tsrw -i running.csv -o output --follow --refresh 5\n"
+        "  tsrw -i input.csv -o output --group-by Requirement\n"
+        "  tsrw -i input.csv -o output --snapshot\n"
+        "  tsrw -i huge.csv -o output --checkpoint --jobs 8\n"
+        "  tsrw -i input.csv.gz -o output --compress xz --compress-level 9\n"
+        "  tsrw -i input.csv -o output --cache\n"
+        "  tsrw --clear-cache\n"
     ),
         formatter_class=lambda prog: argparse.HelpFormatter(prog, max_help_position=100, width=200)
     )
     parser.add_argument(
         "-i",
+        nargs="+",
         required=False,
         metavar="<input CSV>",
-        help="Path to the input CSV file."
+        help="Path to the input CSV file. Several files, folders of CSV files and glob patterns (quoted) are "
+             "parsed and merged into one result, concurrently with --jobs."
     )
     parser.add_argument(
         "-o",
@@ -74,13 +91,139 @@ def main():
     )
     parser.add_argument(
         "-s",
+        nargs="+",
         metavar="<sort key>",
-        default="Duration",
+        default=["Duration"],
         dest="sort_key",
-        help="Specify the key for sorting the output CSV. "
+        help="Specify the key for sorting the output CSV. Several keys export one CSV per key from a single parse. "
              "Valid options are 'Requirement', 'Test Case', 'Duration', 'Status' and 'none'. "
              "Default is 'Duration'."
     )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="If set, store the parsed data column-wise to reduce memory usage on large files."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="<num processes>",
+        help="Number of processes used to parse the input CSV. 0 uses one process per CPU. Default is 1."
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="If set, memory-map the input CSV instead of streaming it. Faster on large files read repeatedly."
+    )
+    parser.add_argument(
+        "--async-log",
+        action="store_true",
+        help="If set, write log records in a background thread, so parsing never waits on log output."
+    )
+    parser.add_argument(
+        "--aggregate-skips",
+        action="store_true",
+        help="If set, report skipped lines as a short summary per reason instead of one line each."
+    )
+    parser.add_argument(
+        "--quarantine",
+        metavar="<file>",
+        help="If specified, write all skipped lines with their line number and reason to this file."
+    )
+    parser.add_argument(
+        "--percentiles",
+        action="store_true",
+        help="If set, display approximate p50/p90/p99 durations and a log-scale duration histogram, overall and per status."
+    )
+    parser.add_argument(
+        "--group-by",
+        metavar="<group key>",
+        help="If specified, display count, total, mean, min and max duration and the status breakdown per group. "
+             "Valid options are 'Requirement' and 'Test Case'."
+    )
+    parser.add_argument(
+        "--top-groups",
+        type=int,
+        default=10,
+        metavar="<num groups>",
+        help="Number of groups with the largest total duration to display with --group-by. Default is 10."
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="If set, save the parsed data as binary snapshot next to the input CSV ('<input CSV>.snapshot'). "
+             "Later runs on the unchanged CSV load the snapshot instead of parsing it."
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="If set, checkpoint the parsing progress next to the input CSV ('<input CSV>.checkpoint'). "
+             "If the run is interrupted, the next run with --checkpoint continues from the last checkpoint."
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=CSVHandler.CHECKPOINT_INTERVAL >> 20,
+        metavar="<MB>",
+        help=f"MB of the input CSV parsed between two checkpoints. Default is {CSVHandler.CHECKPOINT_INTERVAL >> 20}."
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="If set, keep the parsed data and analysis results of the input CSV in the parse cache, so repeated "
+             "runs on the unchanged CSV skip parsing. The input is hashed to look it up."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="<cache dir>",
+        help="Folder of the parse cache used with --cache and --clear-cache. Default is $TSRW_CACHE_DIR or ~/.cache/tsrw."
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=ParseCache.DEFAULT_MAX_BYTES >> 20,
+        metavar="<MB>",
+        help="Size limit of the parse cache in MB, the least recently used inputs are evicted first. "
+             f"Default is {ParseCache.DEFAULT_MAX_BYTES >> 20}."
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="If set, remove all entries of the parse cache first. Without -i, exit afterwards."
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "bz2", "xz"],
+        metavar="<compression>",
+        help="If specified, compress the exported CSV(s). Valid options are 'gzip', 'bz2' and 'xz'. "
+             "Compressed input CSVs are always detected and decompressed."
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        metavar="<level>",
+        help="Compression level of --compress, 0-9 (1-9 for bz2). Default is 6 for gzip and xz, 9 for bz2."
+    )
+    parser.add_argument(
+        "--report-only",
+        action="store_true",
+        help="If set, only display the analysis results, computed while parsing, without exporting a CSV. "
+             "Memory use does not grow with the file size. -o is not required."
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="If set, keep the input CSV open after reading it, parse the lines appended to it and refresh the "
+             "displayed results until Ctrl+C. The sorted CSV is exported when stopped."
+    )
+    parser.add_argument(
+        "--refresh",
+        type=float,
+        default=10.0,
+        metavar="<seconds>",
+        help="Seconds between two checks for appended lines with --follow. Default is 10."
+    )
     parser.add_argument(
     "-g",
     nargs="?",
@@ -108,8 +251,15 @@ def main():
         print("Data generation completed successfully.\n")
         sys.exit(0)
 
-    # If -g was NOT passed, ensure -i and -o are provided
-    if not args.i or not args.o:
+    cache_dir = os.path.abspath(args.cache_dir) if args.cache_dir else default_cache_dir()
+    if args.clear_cache:
+        removed = ParseCache(cache_dir).clear()
+        print(f"Removed {removed} entries from the cache in: {cache_dir}")
+        if not args.i:
+            sys.exit(0)
+
+    # If -g was NOT passed, ensure -i and -o are provided (-o is not needed for a report-only run)
+    if not args.i or (not args.o and not args.report_only):
         print("Error: -i and -o are required when not using -g.")
         parser.print_help()
         sys.exit(1)
@@ -138,12 +288,31 @@ def main():
 
     try:
         tsrw = TestStatisticReadWrite(
-            csv_path=os.path.abspath(args.i),
-            output_folder=os.path.abspath(args.o),
+            csv_path=os.path.abspath(args.i[0]) if len(args.i) == 1 else [os.path.abspath(path) for path in args.i],
+            output_folder=os.path.abspath(args.o) if args.o else None,
             top_x=args.x,
-            sort_key=args.sort_key,
+            sort_key=args.sort_key[0] if len(args.sort_key) == 1 else args.sort_key,
             log_folder=log_folder,
-            verbose=args.verbose
+            verbose=args.verbose,
+            columnar=args.columnar,
+            jobs=args.jobs,
+            use_mmap=args.mmap,
+            async_log=args.async_log,
+            aggregate_skips=args.aggregate_skips,
+            quarantine_path=os.path.abspath(args.quarantine) if args.quarantine else None,
+            report_only=args.report_only,
+            percentiles=args.percentiles,
+            group_by=args.group_by,
+            top_groups=args.top_groups,
+            snapshot=args.snapshot,
+            cache_dir=cache_dir if args.cache else None,
+            cache_size=args.cache_size << 20 if args.cache_size >= 0 else args.cache_size,
+            compression=args.compress,
+            compression_level=args.compress_level,
+            follow=args.follow,
+            refresh_interval=args.refresh,
+            checkpoint=args.checkpoint,
+            checkpoint_interval=args.checkpoint_interval << 20 if args.checkpoint_interval > 0 else args.checkpoint_interval
         )
         tsrw.run()
 
@@ -1,10 +1,19 @@
 # test_statistic_read_write/test_statistic_read_write.py
 
 import sys
+import time
+from typing import List, Union
 from ._logger import Logger
 from ._csv_handler import CSVHandler
+from ._multi_csv_handler import MultiCSVHandler, expand_input_paths
+from ._follower import CSVFollower
+from ._data import Data, ColumnarData
 from ._analyser import Analyser
 from ._printer import Printer
+from ._snapshot import snapshot_path_for
+from ._checkpoint import checkpoint_path_for
+from ._cache import ParseCache, CacheEntry
+from ._compression import validate as validate_compression
 from test_statistic_read_write._exceptions import *
 import os 
 
@@ -16,45 +25,119 @@ class TestStatisticReadWrite:
       1. CSVHandler reads CSV.
       2. Analyser computes results, Printer displays them.
       3. CSVHandler exports CSV sorted by a chosen field (internal logic).
+
+    In report-only mode, step 1 and the analysis run in one streaming pass and step 3 is skipped.
     """
 
-    def __init__(self, csv_path: str, output_folder: str, top_x: int = 10, sort_key: str = "Duration", log_folder: str = None, verbose: bool = False):
+    def __init__(self, csv_path: str, output_folder: str, top_x: int = 10, sort_key: str = "Duration", log_folder: str = None, verbose: bool = False, columnar: bool = False, jobs: int = 1, use_mmap: bool = False, async_log: bool = False,
+                 aggregate_skips: bool = False, quarantine_path: str = None, report_only: bool = False,
+                 percentiles: bool = False, group_by: str = None, top_groups: int = 10, snapshot: bool = False,
+                 cache_dir: str = None, cache_size: int = ParseCache.DEFAULT_MAX_BYTES, compression: str = None,
+                 compression_level: int = None, follow: bool = False, refresh_interval: float = 10.0,
+                 checkpoint: bool = False, checkpoint_interval: int = CSVHandler.CHECKPOINT_INTERVAL):
         """
         Initializes the TestStatisticReadWrite orchestrator.
 
         Args:
-            csv_path (str): Path to the input CSV file.
-            output_folder (str): Path to the output folder for the exported CSV.
+            csv_path (Union[str, List[str]]): Path to the input CSV file, a folder of CSV files, a glob pattern, or a
+                                              list of them. Several files are parsed (concurrently with jobs > 1) and
+                                              merged into one Data object, they are neither cached nor snapshotted.
+            output_folder (str): Path to the output folder for the exported CSV. Can be None in report-only mode.
             top_x (int): Number of top entries to display in the analysis results.
-            sort_key (str, optional): The key to sort by for CSV export. Defaults to "Duration".
+            sort_key (Union[str, List[str]], optional): The key to sort by for CSV export, or a list of keys to export
+                                                        one CSV per key from the same data. Defaults to "Duration".
             log_folder (str, optional): Path to the folder for log files. Defaults to None.
             verbose (bool, optional): If True, enables verbose logging. Defaults to False.
+            columnar (bool, optional): If True, the CSV is loaded into the memory-efficient columnar storage. Defaults to False.
+            jobs (int, optional): Number of processes used to parse the CSV, 0 uses one per CPU. Defaults to 1.
+            use_mmap (bool, optional): If True, the CSV is memory-mapped instead of streamed. Defaults to False.
+            async_log (bool, optional): If True, log records are written by a background thread. Defaults to False.
+            aggregate_skips (bool, optional): If True, skipped lines are reported as a bounded summary per reason. Defaults to False.
+            quarantine_path (str, optional): Path of a file receiving all skipped lines with their reasons. Defaults to None.
+            report_only (bool, optional): If True, the results are computed while parsing, without building a Data
+                                          object, and no CSV is exported. Defaults to False.
+            percentiles (bool, optional): If True, approximate duration percentiles and a log-scale histogram are
+                                          displayed, overall and per status. Defaults to False.
+            group_by (str, optional): If set ("Requirement" or "Test Case"), duration statistics and the status breakdown
+                                      are displayed per group. Defaults to None.
+            top_groups (int, optional): Number of groups with the largest total duration to display. Defaults to 10.
+            snapshot (bool, optional): If True, a binary snapshot of the parsed data is written next to the input CSV
+                                       ('<csv>.snapshot'). An up-to-date snapshot is always loaded instead of
+                                       parsing the CSV. Defaults to False.
+            cache_dir (str, optional): If set, the parsed data and the analysis results are cached in this folder,
+                                       keyed by the size, modification time and content of the input CSV, and
+                                       reused by later runs on the unchanged CSV. Not used in report-only mode.
+                                       Defaults to None.
+            cache_size (int, optional): Size limit of the cache folder in bytes, the least recently used inputs are
+                                        evicted first. Defaults to ParseCache.DEFAULT_MAX_BYTES.
+            compression (str, optional): If set ('gzip', 'bz2' or 'xz'), the exported CSVs are compressed. Compressed
+                                         input CSVs are always detected and decompressed. Defaults to None.
+            compression_level (int, optional): The level of the export compression. Defaults to None (the default
+                                               level of the compression).
+            follow (bool, optional): If True, the input CSV is kept open after it was read, the lines appended to it
+                                     are parsed and the results are refreshed until the run is interrupted (Ctrl+C).
+                                     The CSV is exported when interrupted. Not possible with several input files.
+                                     Defaults to False.
+            refresh_interval (float, optional): Seconds between two checks for appended lines in follow mode.
+                                                Defaults to 10.0.
+            checkpoint (bool, optional): If True, the progress of parsing the input CSV is checkpointed next to it
+                                         ('<csv>.checkpoint'), and a run interrupted while parsing is resumed from
+                                         its last checkpoint by the next run with this option. Not used with several
+                                         input files or in report-only mode. Defaults to False.
+            checkpoint_interval (int, optional): Number of input bytes parsed between two checkpoints.
+                                                 Defaults to CSVHandler.CHECKPOINT_INTERVAL.
         """
         self.logger = Logger()  
 
+        self.report_only = report_only
         self.csv_path = csv_path
         self.output_folder = output_folder
         self.top_x = top_x
         self.sort_key = sort_key
         self.log_folder = log_folder
         self.verbose = verbose
+        self.async_log = async_log
+        self.columnar = columnar
+        self.jobs = jobs
+        self.use_mmap = use_mmap
+        self.aggregate_skips = aggregate_skips
+        self.quarantine_path = quarantine_path
+        self.percentiles = percentiles
+        self.group_by = group_by
+        self.top_groups = top_groups
+        self.snapshot = snapshot
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.compression = compression
+        self.compression_level = compression_level
+        self.follow = follow
+        self.refresh_interval = refresh_interval
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
 
-        self.csv_handler = CSVHandler(self.csv_path)
+        self.csv_handler = self._create_csv_handler()
         self.analyser = Analyser()
         self.printer = Printer()
 
     @property
-    def csv_path(self) -> str:
+    def csv_path(self) -> Union[str, List[str]]:
         return self._csv_path
 
     @csv_path.setter
-    def csv_path(self, value: str):
+    def csv_path(self, value: Union[str, List[str]]):
         if value is None:
             self.logger.log_error("TestStatisticReadWrite: csv_path cannot be None.")
             raise InputFileNotFound("csv_path cannot be None")
-        if not os.path.isfile(value):
-            self.logger.log_error(f"TestStatisticReadWrite: Input file does not exist: {value}")
-            raise InputFileNotFound(f"Input file not found: {value}")
+        paths = expand_input_paths(value)
+        if not paths:
+            self.logger.log_error(f"TestStatisticReadWrite: No input files found: {value}")
+            raise InputFileNotFound(f"No input CSV files found: {value}")
+        for path in paths:
+            if not os.path.isfile(path):
+                self.logger.log_error(f"TestStatisticReadWrite: Input file does not exist: {path}")
+                raise InputFileNotFound(f"Input file not found: {path}")
+        # The input files, csv_path is kept as given
+        self.csv_paths = paths
         self._csv_path = value
 
     @property
@@ -63,6 +146,10 @@ class TestStatisticReadWrite:
 
     @output_folder.setter
     def output_folder(self, value: str):
+        if value is None and self.report_only:
+            # Nothing is exported in report-only mode
+            self._output_folder = None
+            return
         if value is None:
             self.logger.log_error("TestStatisticReadWrite: output_folder cannot be None.")
             raise OutputFolderError("output_folder cannot be None")
@@ -87,17 +174,137 @@ class TestStatisticReadWrite:
         self._top_x = value
 
     @property
-    def sort_key(self) -> str:
+    def jobs(self) -> int:
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, value: int):
+        if not isinstance(value, int) or value < 0:
+            self.logger.log_error(f"TestStatisticReadWrite: Invalid jobs value: {value}. Must be a non-negative integer.")
+            raise InvalidJobCount(f"Invalid jobs value: {value}. Must be a non-negative integer.")
+        self._jobs = value
+
+    @property
+    def sort_key(self) -> Union[str, List[str]]:
         return self._sort_key
 
     @sort_key.setter
-    def sort_key(self, value: str):
+    def sort_key(self, value: Union[str, List[str]]):
         valid_keys = ["Requirement", "Test Case", "Duration", "Status", "none"]
-        if value not in valid_keys:
-            self.logger.log_error(f"TestStatisticReadWrite: Invalid sort key '{value}'. Must be in {valid_keys}.")
-            raise InvalidSortingKey(f"Invalid sort key '{value}'. Must be one of {valid_keys}.")
+        keys = [value] if isinstance(value, str) else value
+        if not keys:
+            self.logger.log_error("TestStatisticReadWrite: No sort key given.")
+            raise InvalidSortingKey(f"No sort key given. Must be one or more of {valid_keys}.")
+        for key in keys:
+            if key not in valid_keys:
+                self.logger.log_error(f"TestStatisticReadWrite: Invalid sort key '{key}'. Must be in {valid_keys}.")
+                raise InvalidSortingKey(f"Invalid sort key '{key}'. Must be one of {valid_keys}.")
         self._sort_key = value
 
+    @property
+    def group_by(self) -> str:
+        return self._group_by
+
+    @group_by.setter
+    def group_by(self, value: str):
+        valid_keys = ["Requirement", "Test Case"]
+        if value is not None and value not in valid_keys:
+            self.logger.log_error(f"TestStatisticReadWrite: Invalid group key '{value}'. Must be in {valid_keys}.")
+            raise InvalidGroupKey(f"Invalid group key '{value}'. Must be one of {valid_keys}.")
+        self._group_by = value
+
+    @property
+    def top_groups(self) -> int:
+        return self._top_groups
+
+    @top_groups.setter
+    def top_groups(self, value: int):
+        if not isinstance(value, int) or value < 0:
+            self.logger.log_error(f"TestStatisticReadWrite: Invalid top_groups value: {value}. Must be a non-negative integer.")
+            raise InvalidTopX(f"Invalid top_groups value: {value}. Must be a non-negative integer.")
+        self._top_groups = value
+
+    @property
+    def cache_size(self) -> int:
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, value: int):
+        if not isinstance(value, int) or value < 0:
+            self.logger.log_error(f"TestStatisticReadWrite: Invalid cache_size value: {value}. Must be a non-negative integer.")
+            raise InvalidCacheSize(f"Invalid cache_size value: {value}. Must be a non-negative integer.")
+        if getattr(self, "cache", None) is not None:
+            self.cache.max_bytes = value
+        self._cache_size = value
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, value: str):
+        self.cache = ParseCache(value, max_bytes=self.cache_size) if value is not None else None
+        self._cache_dir = value
+
+    @property
+    def compression(self) -> str:
+        return self._compression
+
+    @compression.setter
+    def compression(self, value: str):
+        try:
+            validate_compression(value)
+        except ValueError as e:
+            self.logger.log_error(f"TestStatisticReadWrite: {e}.")
+            raise InvalidCompression(f"{e}.")
+        self._compression = value
+
+    @property
+    def compression_level(self) -> int:
+        return self._compression_level
+
+    @compression_level.setter
+    def compression_level(self, value: int):
+        try:
+            validate_compression(self.compression, value)
+        except ValueError as e:
+            self.logger.log_error(f"TestStatisticReadWrite: {e}.")
+            raise InvalidCompression(f"{e}.")
+        self._compression_level = value
+
+    @property
+    def follow(self) -> bool:
+        return self._follow
+
+    @follow.setter
+    def follow(self, value: bool):
+        if value and len(self.csv_paths) > 1:
+            self.logger.log_error("TestStatisticReadWrite: Follow mode requires a single input file.")
+            raise InvalidFollowMode("Follow mode requires a single input file.")
+        self._follow = value
+
+    @property
+    def refresh_interval(self) -> float:
+        return self._refresh_interval
+
+    @refresh_interval.setter
+    def refresh_interval(self, value: float):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not value > 0:
+            self.logger.log_error(f"TestStatisticReadWrite: Invalid refresh_interval value: {value}. Must be a positive number.")
+            raise InvalidFollowMode(f"Invalid refresh_interval value: {value}. Must be a positive number of seconds.")
+        self._refresh_interval = value
+
+    @property
+    def checkpoint_interval(self) -> int:
+        return self._checkpoint_interval
+
+    @checkpoint_interval.setter
+    def checkpoint_interval(self, value: int):
+        if not isinstance(value, int) or value <= 0:
+            self.logger.log_error(f"TestStatisticReadWrite: Invalid checkpoint_interval value: {value}. Must be a positive integer.")
+            raise InvalidCheckpointInterval(f"Invalid checkpoint_interval value: {value}. Must be a positive integer.")
+        self._checkpoint_interval = value
+
     @property
     def log_folder(self) -> str:
         return self._log_folder
@@ -124,6 +331,15 @@ class TestStatisticReadWrite:
         self.logger.set_verbose(value)
         self._verbose = value
 
+    @property
+    def async_log(self) -> bool:
+        return self._async_log
+
+    @async_log.setter
+    def async_log(self, value: bool):
+        self.logger.set_async(value)
+        self._async_log = value
+
 
     def run(self):
         """
@@ -134,18 +350,54 @@ class TestStatisticReadWrite:
         3. Displays results using Printer.
         4. Exports the sorted CSV using CSVHandler.
 
+        With a cache folder, steps 1 and 2 are served from the cache when the CSV is unchanged
+        and the results are cached otherwise.
+
+        In report-only mode, steps 1 and 2 are a single streaming pass and step 4 is skipped.
+
+        In follow mode, steps 1 to 3 are repeated for the lines appended to the CSV until the run is
+        interrupted, see `_run_follow`. Neither the cache nor a snapshot is used.
+
         Raises:
             FriendlyException: If any error occurs during the processing.
         """
         try:
-            # read CSV
+            if self.follow:
+                self._run_follow()
+                return
+
+            if self.report_only:
+                # read CSV and analyze each row while parsing, no Data object is built
+                stream = self.csv_handler.read_csv(self.analyser.create_stream(
+                    self.top_x, percentiles=self.percentiles, group_by=self.group_by, top_groups=self.top_groups
+                ))
+                self.printer.display_results(stream.result())
+                return
+
+            entry = self._cache_entry()
+            if entry is not None:
+                self.csv_handler = self._create_csv_handler(entry)
+
+            # read CSV (from the snapshot if there is one)
             data = self.csv_handler.read_csv()
-            # analyze read data
-            result = self.analyser.analyze(data, self.top_x)
+            # analyze read data, unless the result for these options is cached
+            options = {"top_x": self.top_x, "percentiles": self.percentiles,
+                       "group_by": self.group_by, "top_groups": self.top_groups}
+            result = entry.load_result(options) if entry is not None else None
+            if result is None:
+                result = self.analyser.analyze(
+                    data, self.top_x, percentiles=self.percentiles, group_by=self.group_by, top_groups=self.top_groups
+                )
+                if entry is not None:
+                    self._store_result(entry, options, result)
             # print to console
             self.printer.display_results(result)
             # export CSV
-            self.csv_handler.export_csv(data, self.output_folder, sort_key=self.sort_key)
+            self.csv_handler.export_csv(data, self.output_folder, sort_key=self.sort_key,
+                                        compression=self.compression, compression_level=self.compression_level)
+
+            if self.cache is not None:
+                self.cache.evict()
 
         except FriendlyException as e:
             user_msg = f"Error in processing. {e.user_message}. Exiting."
@@ -153,7 +405,121 @@ class TestStatisticReadWrite:
             self.logger.log_error(user_msg)
             sys.exit(1)
 
-    
+    def _run_follow(self):
+        """
+        Follow mode: reads the CSV and displays the results, then checks for appended lines every
+        `refresh_interval` seconds. Only the new lines are parsed, their entries are inserted into the
+        data and the results are displayed again. On Ctrl+C, the lines appended so far are read, the skipped
+        lines are reported (and quarantined) and the CSV is exported (not in report-only mode).
+
+        The follower's position advances with every parsed line, so the last poll after Ctrl+C continues a
+        poll that was interrupted (also the first one) instead of parsing its lines again. This last poll is final,
+        so a last line without line ending is read like by a normal read.
+
+        The entries are added through an IncrementalAnalysis (a StreamingAnalysis in report-only mode), which
+        updates the results per entry, so a refresh does not rescan the entries read before.
+
+        Raises:
+            FriendlyException: If the CSV cannot be followed or read, see CSVFollower.
+        """
+        options = {"percentiles": self.percentiles, "group_by": self.group_by, "top_groups": self.top_groups}
+        if self.report_only:
+            data = analysis = self.analyser.create_stream(self.top_x, **options)
+        else:
+            data = ColumnarData() if self.columnar else Data()
+            analysis = self.analyser.create_incremental(data, self.top_x, **options)
+        follower = CSVFollower(self.csv_handler, analysis)
+        displayed = 0
+        try:
+            self.logger.log_info(
+                f"TestStatisticReadWrite: Following '{self.csv_paths[0]}', checking every {self.refresh_interval} s. "
+                "Press Ctrl+C to stop."
+            )
+            try:
+                while True:
+                    follower.poll()
+                    displayed = self._display_follow_results(data, analysis, displayed)
+                    time.sleep(self.refresh_interval)
+            except KeyboardInterrupt:
+                self.logger.log_info("TestStatisticReadWrite: Interrupted, reading the lines appended so far.")
+            follower.poll(final=True)
+            self._display_follow_results(data, analysis, displayed)
+        finally:
+            follower.close()
+
+        self.logger.log_info(f"TestStatisticReadWrite: Stopped following after {data.get_size()} entries.")
+        self.csv_handler._complete_read(data)
+        if not self.report_only:
+            self.csv_handler.export_csv(data, self.output_folder, sort_key=self.sort_key,
+                                        compression=self.compression, compression_level=self.compression_level)
+
+    def _display_follow_results(self, data, analysis, displayed: int) -> int:
+        """
+        Displays the results of the followed CSV, unless there are no new entries since the last display.
+
+        Args:
+            data: The followed Data object (or the StreamingAnalysis in report-only mode).
+            analysis: The IncrementalAnalysis or StreamingAnalysis providing the results.
+            displayed (int): The number of entries when the results were displayed last.
+
+        Returns:
+            int: The number of entries the displayed results are based on.
+        """
+        size = data.get_size()
+        if size != displayed:
+            self.printer.display_results(analysis.result())
+        return size
+
+    def _cache_entry(self) -> CacheEntry:
+        """
+        Returns the cache entry of the input CSV, or None if the cache is disabled or cannot be used.
+        A broken cache never stops the run, the CSV is parsed instead.
+        """
+        if self.cache is None or len(self.csv_paths) > 1:
+            return None
+        try:
+            return self.cache.entry(self.csv_paths[0])
+        except OSError as e:
+            self.logger.log_warning(f"TestStatisticReadWrite: Cache folder '{self.cache_dir}' is not usable, parsing without cache: {e}")
+            return None
+
+    def _store_result(self, entry: CacheEntry, options: dict, result: dict):
+        try:
+            entry.store_result(options, result)
+        except OSError as e:
+            self.logger.log_warning(f"TestStatisticReadWrite: Failed caching the analysis result: {e}")
+
+    def _create_csv_handler(self, entry: CacheEntry = None) -> CSVHandler:
+        """
+        Creates the CSVHandler. Its snapshot is the one next to the input CSV, if it exists or is requested.
+        Otherwise, with a cache entry, the snapshot is kept (loaded or written) in the cache, with only the
+        sorted indexes of the export sort keys, which the run builds anyway.
+        With `checkpoint`, the parsing is checkpointed next to the input CSV.
+
+        Several input files are read by a MultiCSVHandler, which builds the indexes of the export sort keys per file.
+        Its exports are named after the input folder, or 'merged'.
+        """
+        sort_keys = [self.sort_key] if isinstance(self.sort_key, str) else self.sort_key
+        index_keys = [key for key in sort_keys if key != "none"]
+        if len(self.csv_paths) > 1:
+            is_folder = isinstance(self.csv_path, str) and os.path.isdir(self.csv_path)
+            return MultiCSVHandler(
+                self.csv_paths, columnar=self.columnar, jobs=self.jobs, use_mmap=self.use_mmap,
+                aggregate_skips=self.aggregate_skips, quarantine_path=self.quarantine_path,
+                index_keys=index_keys,
+                output_name=os.path.basename(os.path.normpath(self.csv_path)) if is_folder else "merged"
+            )
+
+        snapshot_path, write_snapshot, snapshot_indexes = snapshot_path_for(self.csv_paths[0]), self.snapshot, None
+        if entry is not None and not self.snapshot and not os.path.isfile(snapshot_path):
+            snapshot_path, write_snapshot, snapshot_indexes = entry.snapshot_path, True, index_keys
+        return CSVHandler(
+            self.csv_paths[0], columnar=self.columnar, jobs=self.jobs, use_mmap=self.use_mmap,
+            aggregate_skips=self.aggregate_skips, quarantine_path=self.quarantine_path,
+            snapshot_path=snapshot_path, write_snapshot=write_snapshot, snapshot_indexes=snapshot_indexes,
+            checkpoint_path=checkpoint_path_for(self.csv_paths[0]) if self.checkpoint else None,
+            checkpoint_interval=self.checkpoint_interval
+        )
 
     def reset(self):
-        self.csv_handler = CSVHandler(self.csv_path)
+        self.csv_handler = self._create_csv_handler()
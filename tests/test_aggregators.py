@@ -0,0 +1,255 @@
+# tests/test_aggregators.py
+
+import math
+import random
+import pytest
+from test_statistic_read_write._aggregators import select_top_x, TopX, ExactSum, DurationSketch, GroupBy, StreamingAnalysis, IncrementalAnalysis
+from test_statistic_read_write._analyser import Analyser
+from test_statistic_read_write._data import Data, ColumnarData
+
+@pytest.fixture
+def durations():
+    """Fixture providing 500 durations with many ties (seeded, reproducible)."""
+    rng = random.Random(42)
+    return [float(rng.randint(1, 20)) for _ in range(500)]
+
+def test_top_x_matches_select_top_x(durations):
+    """
+    Test-ID: D-T-AGG-TOP-001
+    Tests that the streaming `TopX` selection returns the same entries in the same order as `select_top_x`,
+    which matches the order of the Duration index, for several values of X.
+
+    Args:
+        durations (List[float]): Fixture providing durations with many ties.
+    """
+    ids = list(range(100, 100 + len(durations)))
+    for top_x in (0, 1, 7, 50, len(durations), len(durations) + 3):
+        top = TopX(top_x)
+        for cid, duration in zip(ids, durations):
+            top.add(cid, {"Duration": duration})
+
+        assert [cid for cid, _ in top.result()] == select_top_x(ids, durations, top_x)
+
+    assert len(top.result()) == len(durations)
+
+def test_streaming_analysis_matches_analyze(durations):
+    """
+    Test-ID: D-T-AGG-STR-001
+    Tests that `StreamingAnalysis` computes the same results as `Analyser.analyze` on a Data object
+    holding the same entries and review lines.
+
+    Args:
+        durations (List[float]): Fixture providing durations with many ties.
+    """
+    statuses = ["Passed", "Failed", "Skipped"]
+    data = Data()
+    stream = StreamingAnalysis(10)
+    for cid, duration in enumerate(durations, start=1):
+        entry = {"Requirement": f"R{cid % 7}", "Test Case": f"TC{cid}", "Duration": duration, "Status": statuses[cid % 3]}
+        data.append_entry(cid, dict(entry))
+        stream.append_entry(cid, entry)
+    data.review_lines.append((3, "Empty field"))
+    stream.review_lines.append((3, "Empty field"))
+
+    result = stream.result()
+
+    assert stream.get_size() == len(durations)
+    assert result == Analyser().analyze(data, 10)
+    assert result["test_case_counts"] == (501, 500, 1)
+
+def test_exact_sum():
+    """
+    Test-ID: D-T-AGG-SUM-001
+    Tests that `ExactSum` equals `math.fsum` over the same values while they are added, also for durations of very
+    different magnitudes, and that `StreamingAnalysis` and `Analyser.analyze` return this exact total duration.
+    """
+    rng = random.Random(7)
+    values = [rng.choice([0.1, 1e-3, 1e6]) * rng.random() for _ in range(2000)]
+    total = ExactSum()
+    for count, value in enumerate(values, start=1):
+        total.add(value)
+        if count % 250 == 0:
+            assert total.value() == math.fsum(values[:count])
+
+    data = Data()
+    stream = StreamingAnalysis(1)
+    for cid in range(1, 11):
+        entry = {"Requirement": "R1", "Test Case": f"TC{cid}", "Duration": 0.1, "Status": "Passed"}
+        data.append_entry(cid, dict(entry))
+        stream.append_entry(cid, entry)
+
+    assert sum([0.1] * 10) != 1.0
+    assert stream.result()["total_duration"] == Analyser().analyze(data, 1)["total_duration"] == 1.0
+
+def test_duration_sketch_accuracy():
+    """
+    Test-ID: D-T-AGG-SKE-001
+    Tests that the quantiles of a `DurationSketch` are within its relative accuracy of the exact quantiles,
+    and that the log-scale histogram counts are exact.
+    """
+    rng = random.Random(7)
+    values = [rng.lognormvariate(2, 1.5) for _ in range(20000)]
+    sketch = DurationSketch()
+    for value in values:
+        sketch.add(value)
+
+    exact = sorted(values)
+    for q in (0.0, 0.25, 0.5, 0.9, 0.99, 0.999, 1.0):
+        expected = exact[int(q * (len(exact) - 1))]
+        assert abs(sketch.quantile(q) - expected) <= sketch.alpha * expected
+
+    histogram = sketch.histogram()
+    assert sum(count for _, count in histogram) == len(values)
+    assert dict(histogram)[1.0] == sum(1 for value in values if 1 <= value < 10)
+    assert len(sketch.buckets) < 1000
+
+def test_duration_sketch_merge():
+    """
+    Test-ID: D-T-AGG-SKE-002
+    Tests that merging the sketches of two shards yields the sketch of all durations,
+    and that sketches with different relative accuracies cannot be merged.
+    """
+    values = [0.001 * i for i in range(1, 3001)]
+    whole, first, second = DurationSketch(), DurationSketch(), DurationSketch()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (first if i % 3 else second).add(value)
+
+    first.merge(second)
+
+    assert first == whole
+    assert first.quantile(0.5) == whole.quantile(0.5)
+    with pytest.raises(ValueError):
+        first.merge(DurationSketch(alpha=0.05))
+
+def test_duration_sketch_edge_cases():
+    """
+    Test-ID: D-T-AGG-SKE-003
+    Tests `DurationSketch` with no data, a single duration, and invalid arguments.
+    """
+    sketch = DurationSketch()
+    assert sketch.quantile(0.5) is None
+    assert sketch.histogram() == []
+
+    sketch.add(42.0)
+    assert sketch.quantile(0.0) == sketch.quantile(1.0) == 42.0
+    assert sketch.histogram() == [(10.0, 1)]
+
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+    with pytest.raises(ValueError):
+        DurationSketch(alpha=0)
+
+def test_streaming_analysis_percentiles(durations):
+    """
+    Test-ID: D-T-AGG-STR-002
+    Tests that `StreamingAnalysis` computes the same duration sketches, overall and per status,
+    as `Analyser.analyze` with percentiles enabled, also when its pending buffer overflows.
+
+    Args:
+        durations (List[float]): Fixture providing durations with many ties.
+    """
+    statuses = ["Passed", "Failed", "Skipped"]
+    data = Data()
+    stream = StreamingAnalysis(3, percentiles=True)
+    stream.PENDING_LIMIT = 7  # fold the pending counts into the sketches several times
+    for cid, duration in enumerate(durations, start=1):
+        entry = {"Requirement": "R1", "Test Case": f"TC{cid}", "Duration": duration, "Status": statuses[cid % 3]}
+        data.append_entry(cid, dict(entry))
+        stream.append_entry(cid, entry)
+
+    result = stream.result()
+
+    assert result["duration_sketch_overall"].count == len(durations)
+    assert list(result["duration_sketches"]) == ["Failed", "Skipped", "Passed"]
+    assert result == Analyser().analyze(data, 3, percentiles=True)
+    assert "duration_sketches" not in StreamingAnalysis(3).result()
+
+def test_group_by():
+    """
+    Test-ID: D-T-AGG-GRP-001
+    Tests that `GroupBy` aggregates count, sum, min, max, mean and the status breakdown per group in one pass,
+    returns the groups with the largest total duration first, and merges the groups of two shards.
+    """
+    rows = [("R1", 2.0, "Passed"), ("R2", 10.0, "Failed"), ("R1", 4.0, "Failed"),
+            ("R3", 6.0, "Passed"), ("R2", 1.0, "Passed"), ("R3", 0.5, "Passed")]
+    groups = GroupBy("Requirement")
+    groups.add_all(*zip(*rows))
+
+    assert list(groups.groups) == ["R1", "R2", "R3"]
+    r2 = groups.groups["R2"]
+    assert (r2.count, r2.total, r2.min, r2.max, r2.mean) == (2, 11.0, 1.0, 10.0, 5.5)
+    assert r2.status_counts == {"Failed": 1, "Passed": 1}
+    assert [group for group, _ in groups.top(2)] == ["R2", "R3"]
+    assert groups.result(1) == {"key": "Requirement", "group_count": 3, "top_groups": [("R2", r2)]}
+
+    first, second = GroupBy("Requirement"), GroupBy("Requirement")
+    for group, duration, status in rows[:3]:
+        first.add(group, duration, status)
+    for group, duration, status in rows[3:]:
+        second.add(group, duration, status)
+    first.merge(second)
+    assert first.groups == groups.groups
+
+    with pytest.raises(ValueError):
+        first.merge(GroupBy("Test Case"))
+    with pytest.raises(ValueError):
+        GroupBy("Status")
+
+def test_streaming_analysis_group_by(durations):
+    """
+    Test-ID: D-T-AGG-STR-003
+    Tests that `StreamingAnalysis` computes the same groups as `Analyser.analyze` with a group-by.
+
+    Args:
+        durations (List[float]): Fixture providing durations with many ties.
+    """
+    data = Data()
+    stream = StreamingAnalysis(3, group_by="Test Case", top_groups=4)
+    for cid, duration in enumerate(durations, start=1):
+        entry = {"Requirement": "R1", "Test Case": f"TC{cid % 9}", "Duration": duration, "Status": ["Passed", "Failed"][cid % 2]}
+        data.append_entry(cid, dict(entry))
+        stream.append_entry(cid, entry)
+
+    result = stream.result()
+
+    assert result["groups"]["group_count"] == 9
+    assert len(result["groups"]["top_groups"]) == 4
+    assert result == Analyser().analyze(data, 3, group_by="Test Case", top_groups=4)
+
+@pytest.mark.parametrize("data_class", [Data, ColumnarData])
+def test_incremental_analysis_matches_analyze(durations, data_class):
+    """
+    Test-ID: D-T-AGG-INC-001
+    Tests that `IncrementalAnalysis` folds in the entries already in the Data object, and that after entries
+    were added through it, its results equal those of `Analyser.analyze` on the grown Data object (with
+    percentiles, groups and review lines), while the built Duration index of the Data object stays sorted.
+
+    Args:
+        durations (List[float]): Fixture providing durations with many ties.
+        data_class (type): The class of the analyzed data object.
+    """
+    statuses = ["Passed", "Failed", "Skipped"]
+    def entry(cid):
+        return {"Requirement": f"R{cid % 7}", "Test Case": f"TC{cid % 11}", "Duration": durations[cid - 1],
+                "Status": statuses[cid % 3]}
+    options = {"percentiles": True, "group_by": "Requirement", "top_groups": 3}
+
+    data = data_class()
+    for cid in range(1, 201):
+        data.append_entry(cid, entry(cid))
+    data.build_index("Duration")
+    incremental = IncrementalAnalysis(data, 10, **options)
+    assert incremental.result() == Analyser().analyze(data, 10, **options)
+
+    for cid in range(201, len(durations) + 1):
+        incremental.add_entry(cid, entry(cid))
+        if cid % 150 == 0:
+            data.review_lines.append((cid, "Empty field"))
+            assert incremental.result() == Analyser().analyze(data, 10, **options)
+
+    result = incremental.result()
+    assert incremental.get_size() == data.get_size() == len(durations)
+    assert result["test_case_counts"] == (502, 500, 2)
+    assert result == Analyser().analyze(data, 10, **options)
+    assert list(data.sorted_values["Duration"]) == sorted(durations)
@@ -2,8 +2,9 @@
 
 import pytest
 from test_statistic_read_write._analyser import Analyser
-from test_statistic_read_write._data import Data
-from test_statistic_read_write._exceptions import InvalidTopX
+from test_statistic_read_write._data import Data, ColumnarData
+from test_statistic_read_write._printer import Printer
+from test_statistic_read_write._exceptions import InvalidTopX, InvalidGroupKey
 
 @pytest.fixture
 def analyser():
@@ -123,3 +124,145 @@ def test_get_zero_top_x_entries(analyser, sample_data):
     """
     top_x_entries = analyser._get_top_x_entries(sample_data, 0)
     assert len(top_x_entries) == 0
+
+@pytest.mark.parametrize("data_cls", [Data, ColumnarData])
+def test_get_top_x_entries_without_duration_index(analyser, data_cls):
+    """
+    Test-ID: D-T-AN-GTX-005
+    Tests that the `_get_top_x_entries` method selects the top entries without building the Duration index,
+    with the same result (including the order of equal durations) as the Duration index.
+
+    Args:
+        analyser (Analyser): The `Analyser` fixture.
+        data_cls (type): The Data class under test, row-wise or columnar.
+    """
+    durations = [3.0, 7.5, 1.0, 7.5, 2.0, 7.5, 9.0, 3.0, 0.5, 3.0]
+    data = data_cls()
+    for cid, duration in enumerate(durations):
+        data.append_entry(cid, {"Requirement": f"R{cid}", "Test Case": "TC", "Duration": duration, "Status": "Passed"})
+
+    heap_results = {top_x: analyser._get_top_x_entries(data, top_x) for top_x in range(len(durations) + 2)}
+    assert not data.is_indexed("Duration")
+    assert [cid for cid, _ in heap_results[4]] == [6, 1, 3, 5]
+
+    data.build_index("Duration")
+    for top_x, heap_result in heap_results.items():
+        assert heap_result == analyser._get_top_x_entries(data, top_x)
+
+def test_analyze_does_not_sort(analyser):
+    """
+    Test-ID: D-T-AN-GDU-002
+    Tests that the `analyze` method computes its results without building any sorted index.
+
+    Args:
+        analyser (Analyser): The `Analyser` fixture.
+    """
+    data = Data()
+    for cid, duration in enumerate([1.5, 4.0, 2.5]):
+        data.append_entry(cid, {"Requirement": "R1", "Test Case": f"TC{cid}", "Duration": duration, "Status": "Passed"})
+
+    result = analyser.analyze(data, 2)
+
+    assert result["total_duration"] == 8.0
+    assert [cid for cid, _ in result["top_x_entries"]] == [1, 2]
+    assert not any(data.is_indexed(key) for key in Data.INDEX_KEYS)
+
+def test_analyze_percentiles(analyser, sample_data):
+    """
+    Test-ID: D-T-AN-PCT-001
+    Tests that the `analyze` method adds duration sketches, overall and per status, only if percentiles are requested.
+
+    Args:
+        analyser (Analyser): The `Analyser` fixture.
+        sample_data (Data): The `Data` fixture containing sample data.
+    """
+    assert "duration_sketches" not in analyser.analyze(sample_data, 2)
+
+    result = analyser.analyze(sample_data, 2, percentiles=True)
+    overall, sketches = result["duration_sketch_overall"], result["duration_sketches"]
+
+    assert list(sketches) == ["Passed", "Failed"]
+    assert [sketch.count for sketch in [overall, *sketches.values()]] == [4, 2, 2]
+    assert overall.quantile(1.0) == 15.8
+    assert sketches["Failed"].quantile(0.0) == 2.1
+    assert abs(overall.quantile(0.5) - 5.2) <= 0.01 * 5.2
+
+def test_analyze_percentiles_status_all(analyser, sample_data, capsys):
+    """
+    Test-ID: D-T-AN-PCT-002
+    Tests that a status named "All" gets its own duration sketch, separate from the sketch of all durations,
+    in `analyze` and in the streaming analysis, and that both are displayed.
+
+    Args:
+        analyser (Analyser): The `Analyser` fixture.
+        sample_data (Data): The `Data` fixture containing sample data.
+        capsys (pytest.fixture): Fixture for capturing stdout and stderr.
+    """
+    sample_data.add_entry(5, {"Requirement": "R5", "Test Case": "TC5", "Duration": 300.0, "Status": "All"})
+    stream = analyser.create_stream(2, percentiles=True)
+    for key, entry in sample_data.data.items():
+        stream.append_entry(key, entry)
+
+    result = analyser.analyze(sample_data, 2, percentiles=True)
+
+    assert result["duration_sketch_overall"].count == 5
+    assert list(result["duration_sketches"]) == ["Passed", "Failed", "All"]
+    assert result["duration_sketches"]["All"].count == 1
+    assert stream.result() == result
+
+    Printer().display_results(result)
+    lines = capsys.readouterr().out.splitlines()
+    start = lines.index("Duration Percentiles (Approx. +/-1%, Seconds):")
+    assert lines[start + 1] == "  All: p50 10.486, p90 15.643, p99 15.643"
+    assert lines[start + 4] == "  All: p50 300.000, p90 300.000, p99 300.000"
+
+def test_analyze_group_by(analyser, sample_data):
+    """
+    Test-ID: D-T-AN-GRP-001
+    Tests that the `analyze` method adds the top groups if a group key is given, and that an invalid
+    group key or number of groups raises an exception.
+
+    Args:
+        analyser (Analyser): The `Analyser` fixture.
+        sample_data (Data): The `Data` fixture containing sample data.
+    """
+    sample_data.add_entry(5, {"Requirement": "R1", "Test Case": "TC5", "Duration": 1.5, "Status": "Failed"})
+
+    assert "groups" not in analyser.analyze(sample_data, 2)
+    groups = analyser.analyze(sample_data, 2, group_by="Requirement", top_groups=2)["groups"]
+
+    assert groups["key"] == "Requirement"
+    assert groups["group_count"] == 4
+    assert [group for group, _ in groups["top_groups"]] == ["R3", "R1"]
+    assert groups["top_groups"][1][1].status_counts == {"Passed": 1, "Failed": 1}
+
+    with pytest.raises(InvalidGroupKey):
+        analyser.analyze(sample_data, 2, group_by="Duration")
+    with pytest.raises(InvalidTopX):
+        analyser.analyze(sample_data, 2, group_by="Requirement", top_groups=-1)
+
+def test_create_incremental(analyser, sample_data):
+    """
+    Test-ID: D-T-AN-INC-001
+    Tests that `create_incremental` returns an analysis of the current entries, that entries added through it
+    are inserted into the Data object and update its results, and that invalid options raise an exception.
+
+    Args:
+        analyser (Analyser): The `Analyser` fixture.
+        sample_data (Data): The `Data` fixture containing sample data.
+    """
+    incremental = analyser.create_incremental(sample_data, 2)
+    assert incremental.result() == analyser.analyze(sample_data, 2)
+
+    incremental.add_entry(5, {"Requirement": "R5", "Test Case": "TC5", "Duration": 12.0, "Status": "Skipped"})
+    result = incremental.result()
+
+    assert sample_data.get_size() == 5
+    assert [cid for cid, _ in result["top_x_entries"]] == [3, 5]
+    assert result["status_counts"] == {"Passed": 2, "Failed": 2, "Skipped": 1}
+    assert result == analyser.analyze(sample_data, 2)
+
+    with pytest.raises(InvalidTopX):
+        analyser.create_incremental(sample_data, -1)
+    with pytest.raises(InvalidGroupKey):
+        analyser.create_incremental(sample_data, 2, group_by="Status")
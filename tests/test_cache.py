@@ -0,0 +1,95 @@
+# tests/test_cache.py
+
+import json
+import os
+import pytest
+from test_statistic_read_write._cache import ParseCache, default_cache_dir
+from test_statistic_read_write._analyser import Analyser
+from test_statistic_read_write._data import Data
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Fixture providing a small input CSV."""
+    path = tmp_path / "input.csv"
+    path.write_text("Test case;Duration;Status\nR1\\TC1;1 sec;Passed\n", encoding="utf-8")
+    return path
+
+def test_cache_entries(tmp_path, csv_file, monkeypatch):
+    """
+    Test-ID: D-T-CAC-ENT-001
+    Verifies that the cache key of an input depends on its content and modification time, that an entry
+    stores one analysis result per set of options as JSON (restored with its sketches and group statistics, an
+    unreadable result is ignored), and that the default cache folder can be set by environment.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        csv_file (pathlib.Path): Fixture providing a small input CSV.
+        monkeypatch (pytest.MonkeyPatch): Fixture for setting environment variables.
+    """
+    cache = ParseCache(str(tmp_path / "cache"))
+    key = cache.key(str(csv_file))
+    entry = cache.entry(str(csv_file))
+
+    assert cache.key(str(csv_file)) == key
+    assert entry.path == os.path.join(str(tmp_path / "cache"), key)
+    assert entry.snapshot_path == os.path.join(entry.path, "data.snapshot")
+
+    data = Data()
+    for cid, (duration, status) in enumerate([(1.5, "Passed"), (0.0, "Failed"), (12.0, "Passed")], start=1):
+        data.append_entry(cid, {"Requirement": f"R{cid % 2}", "Test Case": f"TC{cid}", "Duration": duration, "Status": status})
+    data.review_lines.append((5, "Empty field"))
+    options = {"top_x": 3, "percentiles": True, "group_by": "Requirement", "top_groups": 10}
+    result = Analyser().analyze(data, **options)
+
+    assert entry.load_result(options) is None
+    entry.store_result(options, result)
+    assert entry.load_result(dict(options)) == result
+    assert entry.load_result(dict(options, top_x=4)) is None
+    (result_file,) = [name for name in os.listdir(entry.path) if name.startswith("result-")]
+    assert result_file.endswith(".json")
+    with open(os.path.join(entry.path, result_file), encoding="utf-8") as f:
+        assert json.load(f)["test_case_counts"] == [4, 3, 1]
+    with open(os.path.join(entry.path, result_file), "wb") as f:
+        f.write(b"\x80\x05K\x01.")
+    assert entry.load_result(options) is None
+
+    stat = os.stat(csv_file)
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cache.key(str(csv_file)) != key
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC2;1 sec;Passed\n", encoding="utf-8")
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.key(str(csv_file)) != key
+
+    monkeypatch.setenv("TSRW_CACHE_DIR", str(tmp_path / "env"))
+    assert default_cache_dir() == str(tmp_path / "env")
+
+def test_cache_eviction(tmp_path):
+    """
+    Test-ID: D-T-CAC-LRU-001
+    Verifies that the cache evicts the least recently used entries once its size limit is exceeded,
+    and that clearing removes all entries but no other files in the cache folder.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    cache = ParseCache(str(tmp_path / "cache"), max_bytes=2500)
+    entries = []
+    for i in range(3):
+        csv_file = tmp_path / f"input{i}.csv"
+        csv_file.write_text(f"Test case;Duration;Status\nR1\\TC{i};1 sec;Passed\n", encoding="utf-8")
+        entry = cache.entry(str(csv_file))
+        entry.store_result({"top_x": i}, {"payload": "x" * 1000})
+        os.utime(entry.path, (i, i))
+        entries.append(entry)
+    os.utime(entries[0].path, (10, 10))  # the first entry was used again
+    (tmp_path / "cache" / "README").write_text("not an entry", encoding="utf-8")
+
+    assert cache.size() > 2500
+    assert cache.evict() == 1
+    assert [os.path.isdir(entry.path) for entry in entries] == [True, False, True]
+    assert cache.size() <= 2500
+    assert cache.evict() == 0
+
+    assert cache.clear() == 2
+    assert os.listdir(tmp_path / "cache") == ["README"]
@@ -0,0 +1,97 @@
+# tests/test_checkpoint.py
+
+import pytest
+from test_statistic_read_write._checkpoint import CheckpointWriter, load_checkpoint, checkpoint_path_for
+from test_statistic_read_write._snapshot import source_signature
+from test_statistic_read_write._data import Data, ColumnarData
+
+SOURCE = {"size": 1234, "mtime_ns": 42}
+
+def _fill(data, first_id, last_id):
+    """Appends the entries with the IDs first_id..last_id and repeated values to `data`."""
+    statuses = ["Passed", "Failed", "Skipped"]
+    for cid in range(first_id, last_id + 1):
+        data.append_entry(cid, {"Requirement": f"{cid % 4}_Req_{cid % 3}", "Test Case": f"TC{cid % 7}",
+                                "Duration": float(cid % 5), "Status": statuses[cid % 3]})
+    return data
+
+@pytest.mark.parametrize("data_class", [Data, ColumnarData])
+def test_checkpoint_segments(tmp_path, data_class):
+    """
+    Test-ID: D-T-CKP-SEG-001
+    Verifies that a checkpoint restores the entries, review lines and position of all complete segments
+    (including a segment without entries), that a resumed writer continues the string codes, and that
+    a segment cut short is dropped with everything after it.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        data_class (type): The class of the data object being checkpointed.
+    """
+    path = str(tmp_path / "input.csv.checkpoint")
+    data = _fill(data_class(), 1, 20)
+
+    writer = CheckpointWriter(path, SOURCE, 26)
+    writer.write(data, range(1, 11), 300, 11, [])
+    writer.write(data, range(11, 21), 600, 22, [(15, "Empty field")])
+    writer.write(data, range(21, 21), 650, 24, [(23, "Empty field"), (24, "Empty field")])
+    writer.close()
+
+    checkpoint = load_checkpoint(path, SOURCE)
+    assert (checkpoint.offset, checkpoint.lineno, checkpoint.next_id) == (650, 24, 21)
+    assert dict(checkpoint.data.data) == dict(data.data)
+    assert {status: list(ids) for status, ids in checkpoint.data.status_collections.items()} == \
+           {status: list(ids) for status, ids in data.status_collections.items()}
+    assert checkpoint.data.review_lines == [(15, "Empty field"), (23, "Empty field"), (24, "Empty field")]
+
+    _fill(data, 21, 30)
+    data.append_entry(31, {"Requirement": "New_Req", "Test Case": "TC99", "Duration": 9.5, "Status": "Passed"})
+    writer = CheckpointWriter(path, SOURCE, 26, checkpoint)
+    writer.write(data, range(21, 32), 900, 35, [])
+    writer.close()
+    assert dict(load_checkpoint(path, SOURCE).data.data) == dict(data.data)
+
+    with open(path, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 3)
+    checkpoint = load_checkpoint(path, SOURCE)
+    assert (checkpoint.offset, checkpoint.next_id) == (650, 21)
+    assert checkpoint.data.get_size() == 20
+
+    CheckpointWriter(path, SOURCE, 26).close()
+    checkpoint = load_checkpoint(path, SOURCE)
+    assert (checkpoint.offset, checkpoint.lineno, checkpoint.next_id, checkpoint.data.get_size()) == (26, 1, 1, 0)
+
+def test_checkpoint_rejected(tmp_path):
+    """
+    Test-ID: D-T-CKP-INV-001
+    Verifies that loading a checkpoint raises a ValueError if it belongs to another version of the source CSV,
+    or if the file is not a checkpoint or was written by another format version.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\n", encoding="utf-8")
+    path = checkpoint_path_for(str(csv_file))
+    source = source_signature(str(csv_file))
+    writer = CheckpointWriter(path, source, 26)
+    writer.write(_fill(Data(), 1, 5), range(1, 6), 100, 6, [])
+    writer.close()
+    content = open(path, "rb").read()
+
+    assert path == str(csv_file) + ".checkpoint"
+    assert load_checkpoint(path, source).next_id == 6
+
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;1 sec;Passed\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="stale"):
+        load_checkpoint(path, source_signature(str(csv_file)))
+
+    corrupted = {
+        "not a checkpoint": b"Test case;Duration;Status\n",
+        "unsupported checkpoint version": content.replace(b'"version": 1', b'"version": 9', 1),
+        "corrupt checkpoint header": content[:20],
+    }
+    for message, payload in corrupted.items():
+        with open(path, "wb") as f:
+            f.write(payload)
+        with pytest.raises(ValueError, match=message):
+            load_checkpoint(path, source)
@@ -1,11 +1,13 @@
 # tests/test_cli.py
 
 import pytest
+import os
 import sys
 from test_statistic_read_write import cli
 from test_statistic_read_write._exceptions import *
 from test_statistic_read_write.cli import main
 from test_statistic_read_write._logger import Logger
+from test_statistic_read_write._csv_handler import CSVHandler
 
 @pytest.fixture
 def mock_logger(mocker):
@@ -226,13 +228,15 @@ def test_log_end_of_session(mock_logger):
     Verifies that the log_end_of_session function logs the correct message.
 
     This test checks that when log_end_of_session is called, it invokes
-    the log_info method of the logger with the message "Execution ended.\n".
+    the log_info method of the logger with the message "Execution ended.\n"
+    and flushes the pending log records.
 
     Args:
         mock_logger: A mock of the Logger object.
     """
     cli.log_end_of_session()
     mock_logger.log_info.assert_called_once_with("Execution ended.\n")
+    mock_logger.flush.assert_called_once()
 
 def test_success_scenario_no_verbose(mocker):
     """
@@ -332,3 +336,284 @@ def test_unexpected_exception(mocker, capsys):
 
 
 
+def test_cli_jobs(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-JOB-001
+    Verifies that the `--jobs` argument is passed to TestStatisticReadWrite.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--jobs", "4"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["jobs"] == 4
+    mock_cls.return_value.run.assert_called_once()
+
+def test_cli_mmap(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-MAP-001
+    Verifies that the `--mmap` argument is passed to TestStatisticReadWrite.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--mmap"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["use_mmap"] is True
+    mock_cls.return_value.run.assert_called_once()
+
+def test_cli_async_log(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-ASY-001
+    Verifies that the `--async-log` argument is passed to TestStatisticReadWrite.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--async-log"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["async_log"] is True
+    mock_cls.return_value.run.assert_called_once()
+
+def test_cli_skip_reporting(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-SKP-001
+    Verifies that the `--aggregate-skips` and `--quarantine` arguments are passed to TestStatisticReadWrite.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--aggregate-skips", "--quarantine", "skipped.csv"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["aggregate_skips"] is True
+    assert mock_cls.call_args.kwargs["quarantine_path"] == os.path.abspath("skipped.csv")
+    mock_cls.return_value.run.assert_called_once()
+
+def test_cli_report_only(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-REP-001
+    Verifies that the `--report-only` argument is passed to TestStatisticReadWrite and that `-o` is not required with it.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "--report-only"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["report_only"] is True
+    assert mock_cls.call_args.kwargs["output_folder"] is None
+    mock_cls.return_value.run.assert_called_once()
+
+def test_cli_percentiles(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-PCT-001
+    Verifies that the `--percentiles` argument is passed to TestStatisticReadWrite.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--percentiles"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["percentiles"] is True
+    mock_cls.return_value.run.assert_called_once()
+
+def test_cli_group_by(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-GRP-001
+    Verifies that the `--group-by` and `--top-groups` arguments are passed to TestStatisticReadWrite.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--group-by", "Test Case", "--top-groups", "3"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["group_by"] == "Test Case"
+    assert mock_cls.call_args.kwargs["top_groups"] == 3
+    mock_cls.return_value.run.assert_called_once()
+
+def test_cli_snapshot(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-SNP-001
+    Verifies that the `--snapshot` argument is passed to TestStatisticReadWrite and is off by default.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--snapshot"])
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    main()
+
+    assert mock_cls.call_args.kwargs["snapshot"] is True
+    mock_cls.return_value.run.assert_called_once()
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output"])
+    main()
+
+    assert mock_cls.call_args.kwargs["snapshot"] is False
+
+def test_cli_cache(mocker, mock_logger, tmp_path, capsys):
+    """
+    Test-ID: D-T-CLI-CAC-001
+    Verifies that the cache is only used with `--cache`, that the cache folder and size limit are passed to
+    TestStatisticReadWrite then, and that `--clear-cache` without `-i` clears the cache and exits.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+    """
+    cache_dir = str(tmp_path / "cache")
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--cache", "--cache-dir", cache_dir, "--cache-size", "8"])
+    main()
+    assert mock_cls.call_args.kwargs["cache_dir"] == cache_dir
+    assert mock_cls.call_args.kwargs["cache_size"] == 8 << 20
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "--cache-dir", cache_dir])
+    main()
+    assert mock_cls.call_args.kwargs["cache_dir"] is None
+
+    os.makedirs(os.path.join(cache_dir, "0" * 32))
+    mocker.patch.object(sys, "argv", ["tsrw", "--cache-dir", cache_dir, "--clear-cache"])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 0
+    assert os.listdir(cache_dir) == []
+    assert f"Removed 1 entries from the cache in: {cache_dir}" in capsys.readouterr().out
+    assert mock_cls.call_count == 2
+
+def test_cli_multiple_sort_keys(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-MSK-001
+    Verifies that several keys after `-s` are passed to TestStatisticReadWrite as a list, and a single key as a string.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output", "-s", "Duration", "Test Case", "Status", "-x", "3"])
+    main()
+    assert mock_cls.call_args.kwargs["sort_key"] == ["Duration", "Test Case", "Status"]
+    assert mock_cls.call_args.kwargs["top_x"] == 3
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output"])
+    main()
+    assert mock_cls.call_args.kwargs["sort_key"] == "Duration"
+
+def test_cli_compression(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-CMP-001
+    Verifies that `--compress` and `--compress-level` are passed to TestStatisticReadWrite, and that they default to None.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv.gz", "-o", "output", "--compress", "xz", "--compress-level", "9"])
+    main()
+    assert mock_cls.call_args.kwargs["compression"] == "xz"
+    assert mock_cls.call_args.kwargs["compression_level"] == 9
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output"])
+    main()
+    assert mock_cls.call_args.kwargs["compression"] is None
+    assert mock_cls.call_args.kwargs["compression_level"] is None
+
+def test_cli_multiple_inputs(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-MUL-001
+    Verifies that several paths after `-i` are passed to TestStatisticReadWrite as a list of absolute paths,
+    and a single path as a string.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "station1.csv", "nightly/*.csv.gz", "-o", "output"])
+    main()
+    assert mock_cls.call_args.kwargs["csv_path"] == [os.path.abspath("station1.csv"), os.path.abspath("nightly/*.csv.gz")]
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "nightly", "-o", "output"])
+    main()
+    assert mock_cls.call_args.kwargs["csv_path"] == os.path.abspath("nightly")
+
+def test_cli_follow(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-FOL-001
+    Verifies that `--follow` and `--refresh` are passed to TestStatisticReadWrite, and that they default to False and 10 seconds.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "running.csv", "-o", "output", "--follow", "--refresh", "2.5"])
+    main()
+    assert mock_cls.call_args.kwargs["follow"] is True
+    assert mock_cls.call_args.kwargs["refresh_interval"] == 2.5
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output"])
+    main()
+    assert mock_cls.call_args.kwargs["follow"] is False
+    assert mock_cls.call_args.kwargs["refresh_interval"] == 10.0
+
+
+def test_cli_checkpoint(mocker, mock_logger):
+    """
+    Test-ID: D-T-CLI-CKP-001
+    Verifies that `--checkpoint` and `--checkpoint-interval` (in MB) are passed to TestStatisticReadWrite, and that
+    they default to False and CSVHandler.CHECKPOINT_INTERVAL.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mock_cls = mocker.patch('test_statistic_read_write.cli.TestStatisticReadWrite')
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "huge.csv", "-o", "output", "--checkpoint", "--checkpoint-interval", "64"])
+    main()
+    assert mock_cls.call_args.kwargs["checkpoint"] is True
+    assert mock_cls.call_args.kwargs["checkpoint_interval"] == 64 << 20
+
+    mocker.patch.object(sys, "argv", ["tsrw", "-i", "input.csv", "-o", "output"])
+    main()
+    assert mock_cls.call_args.kwargs["checkpoint"] is False
+    assert mock_cls.call_args.kwargs["checkpoint_interval"] == CSVHandler.CHECKPOINT_INTERVAL
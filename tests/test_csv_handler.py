@@ -1,9 +1,16 @@
 # tests/test_csv_handler.py
 
+import bz2
+import gzip
+import lzma
+import os
 import pytest
 from unittest.mock import patch
 from test_statistic_read_write._csv_handler import CSVHandler
-from test_statistic_read_write._data import Data
+from test_statistic_read_write._analyser import Analyser
+from test_statistic_read_write._data import Data, ColumnarData
+from test_statistic_read_write._checkpoint import CheckpointWriter, load_checkpoint
+from test_statistic_read_write._snapshot import source_signature
 from test_statistic_read_write._exceptions import *
 
 @pytest.fixture
@@ -102,7 +109,7 @@ def test_log_review_lines(capsys, mock_logger):
     csv_handler._log_review_lines(data)
 
     mock_logger.log_warning.assert_called_once_with(
-        "2 lines were skipped. Detailed reasons: [(10, 'Reason A'), (12, 'Reason B')]"
+        "%d lines were skipped. Detailed reasons: %s", 2, [(10, 'Reason A'), (12, 'Reason B')]
     )
 
     captured = capsys.readouterr()
@@ -407,8 +414,8 @@ def test_read_csv_status_parser_returns_none(mock_logger, mocker):
     data = csv_handler.read_csv()
 
     # 1. Check that the warning was logged for the correct line
-    mock_logger.log_warning.assert_any_call('CSVHandler: Status parsing error at line 3, skipping.')
-    mock_logger.log_warning.assert_any_call('1 lines were skipped. Detailed reasons: [(3, "Status parse error. Invalid value: \'BadStatus\'")]')
+    mock_logger.log_warning.assert_any_call('CSVHandler: Status parsing error at line %d, skipping.', 3)
+    mock_logger.log_warning.assert_any_call('%d lines were skipped. Detailed reasons: %s', 1, [(3, "Status parse error. Invalid value: 'BadStatus'")])
     
     # 2. Check that the correct line was added to review_lines
     assert len(data.review_lines) == 1
@@ -417,4 +424,648 @@ def test_read_csv_status_parser_returns_none(mock_logger, mocker):
 
     # 3. Check that only the line with "GoodStatus" was added
     assert data.get_size() == 1
-    assert data.data[1]["Status"] == "GoodStatus"  
\ No newline at end of file
+    assert data.data[1]["Status"] == "GoodStatus"
+
+
+def test_read_csv_columnar(tmp_path):
+    """
+    Test-ID: D-T-CSV-RDC-012
+    Verifies that read_csv with columnar storage yields the same content and export as the default storage.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text(
+        "Test case;Duration;Status\n"
+        "R1\\TC1;10.5 sec;Passed\n"
+        "R2\\TC2;5.2 min;Failed\n"
+        "R3TC3;1 sec;Failed\n"
+        "R1\\TC3;20 ms;Passed\n",
+        encoding="utf-8"
+    )
+
+    data = CSVHandler(str(csv_file)).read_csv()
+    columnar = CSVHandler(str(csv_file), columnar=True).read_csv()
+
+    assert dict(columnar.data) == data.data
+    assert columnar.review_lines == data.review_lines
+    assert list(columnar.sorted_ids["Duration"]) == data.sorted_ids["Duration"]
+
+    out_default = tmp_path / "default"
+    out_columnar = tmp_path / "columnar"
+    out_default.mkdir()
+    out_columnar.mkdir()
+    CSVHandler(str(csv_file)).export_csv(data, str(out_default), "Requirement")
+    CSVHandler(str(csv_file)).export_csv(columnar, str(out_columnar), "Requirement")
+
+    name = "input_sorted_by_Requirement.csv"
+    assert (out_columnar / name).read_text() == (out_default / name).read_text()
+
+def test_read_csv_streams_in_chunks(tmp_path):
+    """
+    Test-ID: D-T-CSV-RDC-013
+    Verifies that read_csv streams the file in chunks and keeps exact line numbers.
+
+    The chunk size hint is reduced so that every chunk contains a single line. The
+    parsed entries and the line numbers in review_lines must be the same as for the
+    default chunk size.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text(
+        "Test case;Duration;Status\n"
+        "R1\\TC1;10.5 sec;Passed\n"
+        "R2\\TC2;5.2 min\n"
+        "R3\\TC3;2 min;Failed\n"
+        "R4\\TC4;;Failed\n"
+        "R5\\TC5;1 ms;Passed",
+        encoding="utf-8"
+    )
+
+    default = CSVHandler(str(csv_file)).read_csv()
+
+    csv_handler = CSVHandler(str(csv_file))
+    csv_handler.READ_CHUNK_SIZE = 1
+    chunked = csv_handler.read_csv()
+
+    assert chunked.data == default.data
+    assert chunked.get_size() == 3
+    assert chunked.review_lines == default.review_lines == [(3, "2 columns instead of 3"), (5, "Empty field")]
+    assert chunked.data[3] == {"Requirement": "R5", "Test Case": "TC5", "Duration": 0.001, "Status": "Passed"}
+
+def test_read_csv_undecodable_file(tmp_path):
+    """
+    Test-ID: D-T-CSV-RDC-014
+    Verifies that an InputFileNotFound exception is raised if the file cannot be decoded while streaming.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(b"Test case;Duration;Status\nR1\\TC1;10 sec;Passed\n\xff\xfe\n")
+
+    with pytest.raises(InputFileNotFound):
+        CSVHandler(str(csv_file)).read_csv()
+
+def test_read_csv_parallel_matches_serial(tmp_path):
+    """
+    Test-ID: D-T-CSV-PAR-001
+    Verifies that the parallel ingest yields the same Data as the serial path.
+
+    The byte range size is reduced so that the file is split into many ranges parsed
+    by two worker processes. IDs, entries, review line numbers and index order must be
+    identical to the serial result.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    rows = []
+    for i in range(60):
+        if i % 7 == 3:
+            rows.append(f"R{i % 5}\\TC{i};{i} min")                 # missing column
+        elif i % 11 == 5:
+            rows.append(f"R{i % 5}TC{i};{i} sec;Passed")             # invalid test case
+        else:
+            rows.append(f"{i % 4}_Req_{i % 3}\\TC{i % 9};{i % 13 + 1} sec;{['Passed', 'Failed'][i % 2]}")
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\r\n" + "\r\n".join(rows), encoding="utf-8")
+
+    serial = CSVHandler(str(csv_file)).read_csv()
+
+    csv_handler = CSVHandler(str(csv_file), jobs=2)
+    csv_handler.PARALLEL_CHUNK_SIZE = 64
+    parallel = csv_handler.read_csv()
+
+    assert parallel.data == serial.data
+    assert parallel.review_lines == serial.review_lines
+    assert parallel.sorted_ids == serial.sorted_ids
+    assert parallel.status_collections == serial.status_collections
+
+@pytest.mark.parametrize("content, exception", [
+    (b"", EmptyFileError),
+    (b"Test case;Duration;Status\n", NoDataLinesError),
+    (b"Test;Duration;Status\nR1\\TC1;1 sec;Passed\n", InvalidHeaderFormat),
+    (b"Test case;Duration;Status\nR1TC1;1 sec;Passed\n", NoValidLinesError),
+])
+def test_read_csv_parallel_errors(tmp_path, content, exception):
+    """
+    Test-ID: D-T-CSV-PAR-002
+    Verifies that the parallel ingest raises the same exceptions as the serial path.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        content (bytes): The content of the input file.
+        exception (type): The expected exception.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(content)
+
+    with pytest.raises(exception):
+        CSVHandler(str(csv_file), jobs=2).read_csv()
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_read_csv_parallel_lone_carriage_returns(tmp_path, use_mmap, monkeypatch):
+    """
+    Test-ID: D-T-CSV-PAR-003
+    Verifies that lone '\\r' line endings inside the byte ranges (and a '\\r\\n' split across the blocks the line
+    endings are counted in) are split and numbered like by the serial text reader, so the parallel ingest reports
+    the same entries and line numbers of skipped lines as the serial path.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        use_mmap (bool): Whether the workers scan a memory map of the file.
+        monkeypatch (pytest.MonkeyPatch): Fixture for patching attributes.
+    """
+    rows = []
+    for i in range(60):
+        row = f"R{i % 5}\\TC{i};{i % 13 + 1} sec" + ("" if i % 7 == 3 else f";{['Passed', 'Failed'][i % 2]}")
+        rows.append(row + ["\n", "\r", "\r\n"][i % 3])
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(("Test case;Duration;Status\n" + "".join(rows)).encode("utf-8"))
+    monkeypatch.setattr(CSVHandler, "READ_CHUNK_SIZE", 37)
+
+    serial = CSVHandler(str(csv_file)).read_csv()
+
+    csv_handler = CSVHandler(str(csv_file), jobs=2, use_mmap=use_mmap)
+    csv_handler.PARALLEL_CHUNK_SIZE = 64
+    parallel = csv_handler.read_csv()
+
+    assert serial.get_size() == 51
+    assert [line_no for line_no, _ in serial.review_lines] == [i + 2 for i in range(60) if i % 7 == 3]
+    assert parallel.data == serial.data
+    assert parallel.review_lines == serial.review_lines
+
+@pytest.mark.parametrize("options", [
+    {"use_mmap": True}, {"jobs": 2}, {"jobs": 2, "use_mmap": True}, {"checkpoint_interval": 64},
+    {"checkpoint_interval": 64, "jobs": 2}
+], ids=["mmap", "jobs", "jobs-mmap", "checkpoint", "checkpoint-jobs"])
+def test_read_csv_cr_only_line_endings(tmp_path, mocker, options):
+    """
+    Test-ID: D-T-CSV-CRL-001
+    Verifies that a CSV with only '\\r' line endings (also after the header) is read like by the serial reader
+    in every reading mode.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        options (Dict[str, Any]): The CSVHandler options of the reading mode.
+    """
+    rows = [f"R{i % 3}\\TC{i};{i + 1} sec" + ("" if i % 6 == 4 else ";Passed") + "\r" for i in range(20)]
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(("Test case;Duration;Status\r" + "".join(rows)).encode("utf-8"))
+
+    serial = CSVHandler(str(csv_file)).read_csv()
+    if "checkpoint_interval" in options:
+        options = dict(options, checkpoint_path=str(tmp_path / "input.csv.checkpoint"))
+    csv_handler = CSVHandler(str(csv_file), **options)
+    csv_handler.PARALLEL_CHUNK_SIZE = 64
+    write_checkpoint = mocker.spy(CheckpointWriter, "write")
+    data = csv_handler.read_csv()
+
+    assert serial.get_size() == 17
+    assert [line_no for line_no, _ in serial.review_lines] == [6, 12, 18]
+    assert data.data == serial.data
+    assert data.review_lines == serial.review_lines
+    # The checkpointed read cuts the CSV into blocks at the '\r' line endings as well
+    assert (write_checkpoint.call_count > 1) == ("checkpoint_path" in options)
+
+def test_read_csv_mmap_matches_serial(tmp_path):
+    """
+    Test-ID: D-T-CSV-MAP-001
+    Verifies that the memory-mapped reader yields the same Data as the streaming reader.
+
+    The input uses CRLF line endings, has no trailing newline and contains lines with
+    too few and too many columns, an empty line and empty fields. The memory map is
+    also used by the worker processes of the parallel ingest.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    rows = []
+    for i in range(40):
+        if i % 7 == 3:
+            rows.append(f"R{i % 5}\\TC{i};{i} min")                 # missing column
+        elif i % 9 == 4:
+            rows.append(f"R{i % 5}\\TC{i};{i} sec;Passed;extra")    # extra column
+        elif i % 13 == 6:
+            rows.append("")                                          # empty line
+        elif i % 17 == 8:
+            rows.append(f"R{i % 5}\\TC{i}; ;Passed")                 # empty field
+        else:
+            rows.append(f"{i % 4}_Req_{i % 3}\\TC{i % 9};{i % 13 + 1} sec;{['Passed', 'Failed'][i % 2]}")
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\r\n" + "\r\n".join(rows), encoding="utf-8")
+
+    serial = CSVHandler(str(csv_file)).read_csv()
+    mapped = CSVHandler(str(csv_file), use_mmap=True).read_csv()
+
+    csv_handler = CSVHandler(str(csv_file), jobs=2, use_mmap=True)
+    csv_handler.PARALLEL_CHUNK_SIZE = 64
+    parallel = csv_handler.read_csv()
+
+    for result in (mapped, parallel):
+        assert result.data == serial.data
+        assert result.review_lines == serial.review_lines
+        assert result.sorted_ids == serial.sorted_ids
+
+@pytest.mark.parametrize("content, exception", [
+    (b"", EmptyFileError),
+    (b"Test case;Duration;Status", NoDataLinesError),
+    (b"Test case;Duration;Status\n", NoDataLinesError),
+    (b"Test case;Duration\nR1\\TC1;1 sec;Passed\n", InvalidHeaderColumns),
+    (b"Test case;Duration;Status\nR1TC1;1 sec;Passed\n", NoValidLinesError),
+    (b"Test case;Duration;Status\nR1\\TC1;10 sec;Passed\n\xff\xfe;1 sec;Passed\n", InputFileNotFound),
+])
+def test_read_csv_mmap_errors(tmp_path, content, exception):
+    """
+    Test-ID: D-T-CSV-MAP-002
+    Verifies that the memory-mapped reader raises the same exceptions as the streaming reader.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        content (bytes): The content of the input file.
+        exception (type): The expected exception.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(content)
+
+    with pytest.raises(exception):
+        CSVHandler(str(csv_file), use_mmap=True).read_csv()
+
+def test_read_csv_aggregate_skips(tmp_path, mock_logger, capsys):
+    """
+    Test-ID: D-T-CSV-SKP-001
+    Verifies that in aggregation mode the skipped lines are summarized per reason category with
+    a bounded number of example lines, and that per-line warnings are limited per category.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        capsys (pytest.CaptureFixture): Fixture to capture stdout and stderr.
+    """
+    rows = ["R1\\TC1;1 sec;Passed"]
+    rows += [f"R1\\TC{i};{i} days;Passed" for i in range(8)]     # lines 3-10: duration errors
+    rows += ["R1TC1;1 sec;Passed", "R1TC2;1 sec;Passed"]          # lines 11-12: test case errors
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    csv_handler = CSVHandler(str(csv_file), aggregate_skips=True, skip_examples=3)
+    data = csv_handler.read_csv()
+
+    assert len(data.review_lines) == 10
+    assert csv_handler.summarize_review_lines(data.review_lines) == {
+        "Duration parse error": {"count": 8, "examples": [3, 4, 5]},
+        "Test case parse error": {"count": 2, "examples": [11, 12]},
+    }
+
+    row_warnings = [c.args for c in mock_logger.log_warning.call_args_list if "at line" in c.args[0]]
+    assert len(row_warnings) == 5
+
+    captured = capsys.readouterr()
+    assert "10 lines were skipped." in captured.out
+    assert "  - Duration parse error: 8 lines (lines 3, 4, 5, ...)" in captured.out
+    assert "  - Test case parse error: 2 lines (lines 11, 12)" in captured.out
+    assert "Line 6 skipped" not in captured.out
+
+def test_read_csv_quarantine(tmp_path):
+    """
+    Test-ID: D-T-CSV-SKP-002
+    Verifies that the skipped lines are written to the quarantine file with line number, reason and
+    content, also if no valid line remains.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text(
+        "Test case;Duration;Status\r\nR1\\TC1;5 days;Passed\r\nR1TC2;1 sec\r\n", encoding="utf-8"
+    )
+    quarantine = tmp_path / "skipped.csv"
+
+    with pytest.raises(NoValidLinesError):
+        CSVHandler(str(csv_file), quarantine_path=str(quarantine)).read_csv()
+
+    assert quarantine.read_text(encoding="utf-8").splitlines() == [
+        "Line;Reason;Content",
+        "2;Duration parse error. Invalid value: '5 days';R1\\TC1;5 days;Passed",
+        "3;2 columns instead of 3;R1TC2;1 sec",
+    ]
+
+def test_read_csv_quarantine_write_error(tmp_path):
+    """
+    Test-ID: D-T-CSV-SKP-003
+    Verifies that a CSVExportError is raised if the quarantine file cannot be written.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;1 sec;Passed\nR1TC2;1 sec;Passed\n", encoding="utf-8")
+
+    with pytest.raises(CSVExportError):
+        CSVHandler(str(csv_file), quarantine_path=str(tmp_path / "missing" / "skipped.csv")).read_csv()
+
+@pytest.mark.parametrize("options", [{}, {"use_mmap": True}, {"jobs": 2}])
+def test_read_csv_streaming_target(tmp_path, options):
+    """
+    Test-ID: D-T-CSV-STR-001
+    Verifies that read_csv passes the entries to a given target instead of building a Data object,
+    with every read path, and that the streamed analysis matches the analysis of the Data object.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        options (dict): The read options of the CSVHandler (streaming, memory-mapped, parallel).
+    """
+    rows = [f"R{i % 5}\\TC{i};{i % 13 + 1} sec;{['Passed', 'Failed'][i % 2]}" for i in range(40)]
+    rows[7] = "R1\\TC7;7 sec"
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    analyser = Analyser()
+    stream = analyser.create_stream(5)
+    csv_handler = CSVHandler(str(csv_file), **options)
+    csv_handler.PARALLEL_CHUNK_SIZE = 64
+
+    assert csv_handler.read_csv(stream) is stream
+    assert stream.result() == analyser.analyze(CSVHandler(str(csv_file)).read_csv(), 5)
+    assert stream.review_lines == [(9, "2 columns instead of 3")]
+
+def test_read_csv_snapshot(tmp_path, mock_logger):
+    """
+    Test-ID: D-T-CSV-SNP-001
+    Verifies that read_csv writes a snapshot with all sorted indexes after parsing, loads it instead of parsing
+    while the CSV is unchanged, and parses the CSV again once it has changed or the snapshot is corrupt.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\nR2\\TC2;1 sec\nR2\\TC3;2 sec;Failed\n", encoding="utf-8")
+    snapshot = str(tmp_path / "input.csv.snapshot")
+
+    parsed = CSVHandler(str(csv_file), snapshot_path=snapshot, write_snapshot=True).read_csv()
+    assert os.path.isfile(snapshot)
+    assert all(parsed.is_indexed(key) for key in parsed.INDEX_KEYS)
+
+    with patch.object(CSVHandler, "_read_serial") as read_serial:
+        loaded = CSVHandler(str(csv_file), snapshot_path=snapshot).read_csv()
+    read_serial.assert_not_called()
+    assert dict(loaded.data) == dict(parsed.data)
+    assert loaded.review_lines == [(3, "2 columns instead of 3")]
+    assert list(loaded.sorted_ids["Duration"]) == [2, 1]
+
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\n", encoding="utf-8")
+    assert CSVHandler(str(csv_file), snapshot_path=snapshot).read_csv().get_size() == 1
+    assert "stale" in mock_logger.log_warning.call_args.args[0]
+
+    with open(snapshot, "wb") as f:
+        f.write(b"garbage")
+    assert CSVHandler(str(csv_file), snapshot_path=snapshot).read_csv().get_size() == 1
+
+    CSVHandler(str(csv_file), snapshot_path=snapshot, write_snapshot=True).read_csv()
+    content = open(snapshot, "rb").read()
+    with open(snapshot, "wb") as f:
+        f.write(content.replace(b'"byteorder"', b'"byteordex"', 1))
+    assert CSVHandler(str(csv_file), snapshot_path=snapshot).read_csv().get_size() == 1
+    assert "corrupt snapshot header" in mock_logger.log_warning.call_args.args[0]
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "golden")
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("sort_key, golden_file", [
+    ("Requirement", "expected_sorted_by_Requirement.csv"),
+    ("Test Case", "expected_sorted_by_Test_Case.csv"),
+    ("Duration", "expected_sorted_by_Duration.csv"),
+    ("Status", "expected_sorted_by_Status.csv"),
+    ("none", "expected_unsorted.csv"),
+])
+def test_export_csv_golden(tmp_path, mock_logger, sort_key, golden_file, columnar):
+    """
+    Test-ID: D-T-CSV-GLD-001
+    Verifies that the batched export writes exactly the bytes of the golden files, which were produced by
+    the former row-by-row export, for every sort key and both storages, with batches that do not divide the
+    number of rows.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        sort_key (str): The sort key of the export.
+        golden_file (str): The expected export in tests/golden.
+        columnar (bool): If True, the data is stored in a ColumnarData object.
+    """
+    csv_handler = CSVHandler(os.path.join(GOLDEN_DIR, "input.csv"), columnar=columnar)
+    csv_handler.EXPORT_BATCH_SIZE = 7
+    data = csv_handler.read_csv()
+
+    csv_handler.export_csv(data, str(tmp_path), sort_key)
+
+    exported = os.path.join(str(tmp_path), csv_handler._generate_output_filename(sort_key))
+    with open(exported, "rb") as f, open(os.path.join(GOLDEN_DIR, golden_file), "rb") as g:
+        assert f.read() == g.read()
+
+def test_export_csv_multiple_sort_keys(tmp_path, mock_logger, capsys):
+    """
+    Test-ID: D-T-CSV-MUL-001
+    Verifies that export_csv writes one file per distinct sort key from the same Data object, matching the golden
+    files, reports them in the order of the keys, and that a failing file does not prevent the other files.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+    """
+    csv_handler = CSVHandler(os.path.join(GOLDEN_DIR, "input.csv"), columnar=True)
+    data = csv_handler.read_csv()
+    capsys.readouterr()
+    golden = {"Status": "expected_sorted_by_Status.csv", "Duration": "expected_sorted_by_Duration.csv",
+              "none": "expected_unsorted.csv"}
+
+    csv_handler.export_csv(data, str(tmp_path), ["Status", "Duration", "Status", "none"])
+
+    for sort_key, golden_file in golden.items():
+        exported = os.path.join(str(tmp_path), csv_handler._generate_output_filename(sort_key))
+        with open(exported, "rb") as f, open(os.path.join(GOLDEN_DIR, golden_file), "rb") as g:
+            assert f.read() == g.read()
+    assert capsys.readouterr().out.splitlines() == [
+        f"CSV exported successfully to {os.path.join(str(tmp_path), csv_handler._generate_output_filename(sort_key))}"
+        for sort_key in golden
+    ]
+
+    # a folder in place of the Duration export makes its write fail
+    failing = tmp_path / "failing"
+    (failing / csv_handler._generate_output_filename("Duration")).mkdir(parents=True)
+    with pytest.raises(CSVExportError):
+        csv_handler.export_csv(data, str(failing), ["Duration", "Requirement"])
+    assert os.path.isfile(os.path.join(str(failing), csv_handler._generate_output_filename("Requirement")))
+
+COMPRESSORS = {"gzip": gzip, "bz2": bz2, "xz": lzma}
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_compressed_input_and_export(tmp_path, mock_logger, capsys, compression):
+    """
+    Test-ID: D-T-CSV-CMP-001
+    Verifies that a compressed CSV is detected by its magic bytes and read into the same data and quarantine file
+    as the plain CSV, also when parallel or memory-mapped reading is requested, and that export_csv writes
+    compressed files whose content matches the golden file.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+        compression (str): The compression of the input and the exported file.
+    """
+    with open(os.path.join(GOLDEN_DIR, "input.csv"), "rb") as f:
+        content = f.read()
+    compressed = tmp_path / "input.csv.gz"  # the suffix does not have to match the compression
+    compressed.write_bytes(COMPRESSORS[compression].compress(content))
+    expected = CSVHandler(os.path.join(GOLDEN_DIR, "input.csv")).read_csv()
+
+    for options in [{}, {"jobs": 2}, {"use_mmap": True}]:
+        data = CSVHandler(str(compressed), **options).read_csv()
+        assert dict(data.data) == dict(expected.data)
+        assert data.review_lines == expected.review_lines
+
+    quarantine = {}
+    for name, path in [("plain", os.path.join(GOLDEN_DIR, "input.csv")), ("compressed", str(compressed))]:
+        quarantine[name] = tmp_path / f"{name}_skipped.csv"
+        CSVHandler(path, quarantine_path=str(quarantine[name])).read_csv()
+    assert quarantine["compressed"].read_bytes() == quarantine["plain"].read_bytes()
+
+    csv_handler = CSVHandler(str(compressed))
+    csv_handler.export_csv(data, str(tmp_path), ["Duration", "none"], compression=compression, compression_level=1)
+
+    assert csv_handler._generate_output_filename("Duration", compression=compression) == \
+           "input_sorted_by_Duration.csv" + {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}[compression]
+    for sort_key, golden_file in [("Duration", "expected_sorted_by_Duration.csv"), ("none", "expected_unsorted.csv")]:
+        exported = tmp_path / csv_handler._generate_output_filename(sort_key, compression=compression)
+        with open(os.path.join(GOLDEN_DIR, golden_file), "rb") as g:
+            assert COMPRESSORS[compression].decompress(exported.read_bytes()) == g.read()
+
+def test_compression_errors(tmp_path, mock_logger, sample_data):
+    """
+    Test-ID: D-T-CSV-CMP-002
+    Verifies that a truncated or corrupt compressed CSV raises an InputFileNotFound exception, and that
+    an unsupported compression or compression level raises a CSVExportError without writing a file.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        sample_data (Data): Fixture providing sample data for the test.
+    """
+    content = b"Test case;Duration;Status\n" + b"R1\\TC1;10 sec;Passed\n" * 1000
+    for name, payload in {"truncated.csv.gz": gzip.compress(content)[:-100],
+                          "corrupt.csv.xz": lzma.compress(content)[:40] + b"\0" * 100}.items():
+        csv_file = tmp_path / name
+        csv_file.write_bytes(payload)
+        with pytest.raises(InputFileNotFound):
+            CSVHandler(str(csv_file)).read_csv()
+
+    out = tmp_path / "out"
+    out.mkdir()
+    csv_handler = CSVHandler("dummy.csv")
+    with pytest.raises(CSVExportError):
+        csv_handler.export_csv(sample_data, str(out), "Duration", compression="zip")
+    with pytest.raises(CSVExportError):
+        csv_handler.export_csv(sample_data, str(out), "Duration", compression="bz2", compression_level=0)
+    assert os.listdir(out) == []
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_read_csv_resume_from_checkpoint(tmp_path, mocker, mock_logger, columnar, jobs):
+    """
+    Test-ID: D-T-CSV-CKP-001
+    Verifies that a read interrupted after its second checkpoint is resumed by the next read at the checkpointed
+    position, without reading the header again, into the same entries, skipped lines (numbered alike, also with lone
+    '\\r' line endings) and quarantine file as an uninterrupted read, and that the checkpoint is removed once the CSV
+    is read completely.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        columnar (bool): Whether the data is stored in a ColumnarData object.
+        jobs (int): The number of worker processes.
+    """
+    csv_file = tmp_path / "input.csv"
+    with open(os.path.join(GOLDEN_DIR, "input.csv"), "rb") as f:
+        header, *lines = f.read().split(b"\n")
+    # Every third data line ends in a lone '\r'
+    csv_file.write_bytes(header + b"\n" + b"".join(line + (b"\r" if i % 3 == 1 else b"\n") for i, line in enumerate(lines)))
+    checkpoint_path = str(tmp_path / "input.csv.checkpoint")
+    mocker.patch.object(CSVHandler, "PARALLEL_CHUNK_SIZE", 128)
+    options = {"columnar": columnar, "jobs": jobs, "checkpoint_path": checkpoint_path, "checkpoint_interval": 300}
+
+    write = CheckpointWriter.write
+    def write_and_kill(writer, *args):
+        write(writer, *args)
+        if write_and_kill.count == 1:
+            raise KeyboardInterrupt
+        write_and_kill.count += 1
+    write_and_kill.count = 0
+    mocker.patch.object(CheckpointWriter, "write", write_and_kill)
+    with pytest.raises(KeyboardInterrupt):
+        CSVHandler(str(csv_file), **options).read_csv()
+    mocker.patch.object(CheckpointWriter, "write", write)
+
+    checkpoint = load_checkpoint(checkpoint_path, source_signature(str(csv_file)))
+    assert 600 <= checkpoint.offset < csv_file.stat().st_size
+    read_header = mocker.spy(CSVHandler, "_read_header")
+    data = CSVHandler(str(csv_file), quarantine_path=str(tmp_path / "resumed.csv"), **options).read_csv()
+    expected = CSVHandler(str(csv_file), quarantine_path=str(tmp_path / "expected.csv")).read_csv()
+
+    read_header.assert_not_called()
+    mock_logger.log_info.assert_any_call(
+        f"CSVHandler: Resuming from checkpoint '{checkpoint_path}' at line {checkpoint.lineno + 1} with "
+        f"{checkpoint.next_id - 1} entries ({checkpoint.offset} of {csv_file.stat().st_size} bytes parsed)."
+    )
+    assert type(data) is (ColumnarData if columnar else Data)
+    assert dict(data.data) == dict(expected.data)
+    assert data.review_lines == expected.review_lines
+    assert (tmp_path / "resumed.csv").read_bytes() == (tmp_path / "expected.csv").read_bytes()
+    assert not os.path.exists(checkpoint_path)
+
+def test_read_csv_checkpoint_fallbacks(tmp_path, mocker, mock_logger):
+    """
+    Test-ID: D-T-CSV-CKP-002
+    Verifies that a stale checkpoint is ignored and the CSV is read from the beginning, that a checkpoint that
+    cannot be written does not stop the read, that a compressed CSV is read without checkpoints, and that
+    an invalid header still raises an InvalidHeaderFormat exception.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    content = b"Test case;Duration;Status\n" + b"R1\\TC1;10 sec;Passed\nR1\\TC2;2 sec;Failed\n" * 50
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(content[:-1])  # the last line has no newline
+    checkpoint_path = str(tmp_path / "input.csv.checkpoint")
+    mocker.patch.object(CSVHandler, "PARALLEL_CHUNK_SIZE", 128)
+    expected = CSVHandler(str(csv_file)).read_csv()
+
+    writer = CheckpointWriter(checkpoint_path, {"size": 1, "mtime_ns": 1}, 26)
+    writer.write(expected, range(1, 11), 300, 11, [])
+    writer.close()
+    data = CSVHandler(str(csv_file), checkpoint_path=checkpoint_path, checkpoint_interval=1000).read_csv()
+    assert dict(data.data) == dict(expected.data)
+    assert any("Ignoring checkpoint" in str(call) for call in mock_logger.log_warning.call_args_list)
+    assert not os.path.exists(checkpoint_path)
+
+    missing_folder = str(tmp_path / "missing" / "input.csv.checkpoint")
+    data = CSVHandler(str(csv_file), checkpoint_path=missing_folder, checkpoint_interval=1000).read_csv()
+    assert dict(data.data) == dict(expected.data)
+    assert any("Failed writing checkpoint" in str(call) for call in mock_logger.log_warning.call_args_list)
+
+    compressed = tmp_path / "input.csv.gz"
+    compressed.write_bytes(gzip.compress(content))
+    data = CSVHandler(str(compressed), checkpoint_path=checkpoint_path, checkpoint_interval=100).read_csv()
+    assert dict(data.data) == dict(expected.data)
+    assert not os.path.exists(checkpoint_path)
+
+    csv_file.write_bytes(b"Test case;Time;Status\n" + content[26:])
+    with pytest.raises(InvalidHeaderFormat):
+        CSVHandler(str(csv_file), checkpoint_path=checkpoint_path).read_csv()
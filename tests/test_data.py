@@ -1,7 +1,8 @@
 # tests/test_data.py
 
+import pickle
 import pytest
-from test_statistic_read_write._data import Data
+from test_statistic_read_write._data import Data, ColumnarData
 from test_statistic_read_write._analyser import Analyser
 
 def test_add_entries_with_same_values():
@@ -226,3 +227,246 @@ def test_initial_state():
     assert data.status_collections == {}, "status_collections should be empty initially."
 
 
+
+def test_bulk_build_matches_incremental_insertion():
+    """
+    Test-ID: D-T-DAT-BLK-001
+    Verifies that bulk-loading entries produces the same indexes as incremental insertion.
+
+    The same entries (including duplicate values in every field) are loaded once via
+    `add_entry` and once via `append_entry` followed by `build_indexes`. Both Data objects
+    must have identical `sorted_ids`, `sorted_values` and `status_collections`, including
+    the order of equal values. An incremental insert after a bulk load must also keep the
+    same order.
+    """
+    entries = [
+        {"Requirement": "5_MotorUnit_2", "Test Case": "TC-B", "Duration": 10.0, "Status": "Passed"},
+        {"Requirement": "MotorUnit", "Test Case": "TC-A", "Duration": 2.5, "Status": "Failed"},
+        {"Requirement": "5_MotorUnit_2", "Test Case": "TC-B", "Duration": 10.0, "Status": "Passed"},
+        {"Requirement": "1_FanModule", "Test Case": "TC-C", "Duration": 0.001, "Status": "Unknown"},
+        {"Requirement": "FanModule_3", "Test Case": "TC-A", "Duration": 2.5, "Status": "Passed"},
+        {"Requirement": "MotorUnit", "Test Case": "TC-C", "Duration": 10.0, "Status": "Failed"},
+    ]
+
+    incremental = Data()
+    bulk = Data()
+    for key, entry in enumerate(entries, start=1):
+        incremental.add_entry(key, entry)
+        bulk.append_entry(key, entry)
+    bulk.build_indexes()
+
+    assert bulk.sorted_ids == incremental.sorted_ids
+    assert bulk.sorted_values == incremental.sorted_values
+    assert bulk.status_collections == incremental.status_collections
+
+    extra = {"Requirement": "MotorUnit", "Test Case": "TC-A", "Duration": 2.5, "Status": "Failed"}
+    incremental.add_entry(7, extra)
+    bulk.add_entry(7, extra)
+
+    assert bulk.sorted_ids == incremental.sorted_ids
+    assert bulk.sorted_values == incremental.sorted_values
+
+def test_columnar_data_matches_data():
+    """
+    Test-ID: D-T-DAT-COL-001
+    Verifies that ColumnarData exposes the same read API and content as Data.
+
+    The same entries are bulk-loaded into a Data and a ColumnarData object. The entries
+    returned by `data`, the sorted indexes, the status collections and the size must be
+    equal. Incremental insertion via `add_entry` must keep both objects equal.
+    """
+    entries = [
+        {"Requirement": "5_MotorUnit_2", "Test Case": "TC-B", "Duration": 10.0, "Status": "Passed"},
+        {"Requirement": "MotorUnit", "Test Case": "TC-A", "Duration": 2.5, "Status": "Failed"},
+        {"Requirement": "5_MotorUnit_2", "Test Case": "TC-C", "Duration": 10.0, "Status": "Passed"},
+        {"Requirement": "1_FanModule", "Test Case": "TC-A", "Duration": 0.001, "Status": "Unknown"},
+    ]
+
+    data = Data()
+    columnar = ColumnarData()
+    for key, entry in enumerate(entries, start=1):
+        data.append_entry(key, entry)
+        columnar.append_entry(key, entry)
+    data.build_indexes()
+    columnar.build_indexes()
+
+    extra = {"Requirement": "MotorUnit", "Test Case": "TC-D", "Duration": 2.5, "Status": "Failed"}
+    data.add_entry(5, extra)
+    columnar.add_entry(5, extra)
+
+    assert columnar.get_size() == data.get_size() == 5
+    assert dict(columnar.data) == data.data
+    assert list(columnar.data.keys()) == [1, 2, 3, 4, 5]
+    assert 5 in columnar.data and 6 not in columnar.data
+    for index_key in Data.INDEX_KEYS:
+        assert list(columnar.sorted_ids[index_key]) == data.sorted_ids[index_key]
+        assert list(columnar.sorted_values[index_key]) == data.sorted_values[index_key]
+    assert {status: list(ids) for status, ids in columnar.status_collections.items()} == data.status_collections
+
+    # Strings are stored once per distinct value
+    assert len(columnar._requirements) == 3
+    assert len(columnar._statuses) == 3
+
+def test_columnar_data_non_consecutive_ids():
+    """
+    Test-ID: D-T-DAT-COL-002
+    Verifies that ColumnarData resolves entries correctly when IDs are not consecutive.
+    """
+    columnar = ColumnarData()
+    columnar.add_entry(10, {"Requirement": "R1", "Test Case": "TC1", "Duration": 1.0, "Status": "Passed"})
+    columnar.add_entry(3, {"Requirement": "R2", "Test Case": "TC2", "Duration": 2.0, "Status": "Failed"})
+
+    assert columnar.data[10]["Requirement"] == "R1"
+    assert columnar.data[3]["Status"] == "Failed"
+    assert list(columnar.sorted_ids["Duration"]) == [10, 3]
+    with pytest.raises(KeyError):
+        columnar.data[4]
+
+@pytest.mark.parametrize("ids", [[5, 6, 7, 8], [8, 2, 6]])
+def test_columns_of(ids):
+    """
+    Test-ID: D-T-DAT-COL-003
+    Verifies that `columns_of` returns the requested fields of a batch of entries column by column, in the order
+    of the given IDs, identically for Data and ColumnarData, and raises a KeyError for an unknown ID.
+
+    Args:
+        ids (List[int]): The IDs of the entries, consecutive or not.
+    """
+    results = []
+    for data in (Data(), ColumnarData()):
+        for cid in ids:
+            data.append_entry(cid, {"Requirement": f"R{cid % 2}", "Test Case": f"TC{cid}", "Duration": cid / 2, "Status": "Passed"})
+        results.append(data.columns_of(list(reversed(ids)), ("Test Case", "Duration", "Requirement")))
+        assert data.columns_of([], ("Duration",)) == [[]]
+        with pytest.raises(KeyError):
+            data.columns_of([ids[0], 100], ("Duration",))
+
+    assert results[0] == results[1]
+    assert results[0][0] == [f"TC{cid}" for cid in reversed(ids)]
+    assert results[0][1] == [cid / 2 for cid in reversed(ids)]
+
+def test_indexes_are_built_lazily(mocker):
+    """
+    Test-ID: D-T-DAT-LZY-001
+    Verifies that sorted indexes are only built when they are accessed.
+
+    After a bulk load no index is built. Accessing the Duration index builds only this
+    index, the requirement sort key is never computed.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+    """
+    data = Data()
+    spy = mocker.spy(data, "_extract_requirement_sort_key")
+
+    data.append_entry(1, {"Requirement": "REQ-B", "Test Case": "TC1", "Duration": 3.0, "Status": "Passed"})
+    data.append_entry(2, {"Requirement": "REQ-A", "Test Case": "TC2", "Duration": 1.0, "Status": "Failed"})
+
+    assert not any(data.is_indexed(index_key) for index_key in Data.INDEX_KEYS)
+
+    assert data.sorted_ids["Duration"] == [2, 1]
+    assert data.is_indexed("Duration")
+    assert not data.is_indexed("Requirement")
+    assert not data.is_indexed("Test Case")
+    assert not data.is_indexed("Status")
+    assert spy.call_count == 0
+
+    assert data.sorted_ids.get("Unknown") is None
+
+def test_lazy_indexes_with_incremental_insertion():
+    """
+    Test-ID: D-T-DAT-LZY-002
+    Verifies that built and not yet built indexes stay consistent with incremental insertion.
+
+    The Duration index is built before an `add_entry` call, the Status index after it.
+    Both must match a Data object whose indexes are maintained from the beginning.
+    Appending in bulk afterwards drops the built indexes.
+    """
+    entries = [
+        {"Requirement": "REQ-B", "Test Case": "TC1", "Duration": 3.0, "Status": "Passed"},
+        {"Requirement": "REQ-A", "Test Case": "TC2", "Duration": 1.0, "Status": "Failed"},
+        {"Requirement": "REQ-C", "Test Case": "TC3", "Duration": 3.0, "Status": "Passed"},
+    ]
+    reference = Data()
+    reference.build_indexes()
+    lazy = Data()
+    for key, entry in enumerate(entries[:2], start=1):
+        reference.add_entry(key, entry)
+        lazy.append_entry(key, entry)
+
+    assert lazy.sorted_ids["Duration"] == [2, 1]
+    reference.add_entry(3, entries[2])
+    lazy.add_entry(3, entries[2])
+
+    assert lazy.sorted_ids["Duration"] == reference.sorted_ids["Duration"] == [2, 3, 1]
+    assert lazy.sorted_ids["Status"] == reference.sorted_ids["Status"] == [2, 3, 1]
+    assert lazy.sorted_values == reference.sorted_values
+
+    lazy.append_entry(4, {"Requirement": "REQ-D", "Test Case": "TC4", "Duration": 0.5, "Status": "Failed"})
+    assert not lazy.is_indexed("Duration")
+    assert lazy.sorted_ids["Duration"] == [4, 2, 3, 1]
+
+def test_requirement_sort_key_cache():
+    """
+    Test-ID: D-T-DAT-RCC-001
+    Verifies that requirement sort keys are memoized per Data object and that the cache statistics are exposed.
+
+    Each distinct requirement is parsed once, repeated requirements are cache hits and
+    share the same key tuple. The cache survives pickling (it is recreated empty).
+    """
+    data = Data()
+    for key, requirement in enumerate(["42_MotorUnit_3", "FanModule", "42_MotorUnit_3", "42_MotorUnit_3"], start=1):
+        data.append_entry(key, {"Requirement": requirement, "Test Case": "TC", "Duration": 1.0, "Status": "Passed"})
+
+    assert data.sorted_values["Requirement"] == [(42, "MotorUnit", 3)] * 3 + [(float("inf"), "FanModule", 0)]
+    assert data.requirement_cache_info() == {"hits": 2, "misses": 2, "size": 2, "maxsize": Data.REQUIREMENT_CACHE_SIZE}
+    assert data._extract_requirement_sort_key("42_MotorUnit_3") is data._extract_requirement_sort_key("42_MotorUnit_3")
+
+    restored = pickle.loads(pickle.dumps(data))
+    assert restored.requirement_cache_info()["size"] == 0
+    assert restored.sorted_ids["Requirement"] == data.sorted_ids["Requirement"]
+
+@pytest.mark.parametrize("data_class", [Data, ColumnarData])
+def test_merged(data_class):
+    """
+    Test-ID: D-T-DAT-MRG-001
+    Verifies that merging Data and ColumnarData parts yields the entries, status collections and sorted indexes
+    (including the order of equal values) of one object holding all entries, with consecutive IDs, the source
+    of every entry and the review lines as 'file:line'. Indexes not built in every part are built lazily.
+
+    Args:
+        data_class (type): The class of the merged object.
+    """
+    statuses = ["Passed", "Failed", "Skipped"]
+    entries = [{"Requirement": f"{i % 4}_Req_{i % 3}", "Test Case": f"TC{i % 7}", "Duration": float(i % 5),
+                "Status": statuses[i % 3] if i < 20 else "Blocked"} for i in range(30)]
+    reference = data_class()
+    for cid, entry in enumerate(entries, start=1):
+        reference.append_entry(cid, dict(entry))
+
+    # The IDs of the parts are renumbered: consecutive, and not consecutive
+    parts = [Data(), ColumnarData(), data_class()]
+    part_ids = [range(1, 11), range(1, 11), range(200, 300, 10)]
+    for part, ids, first in zip(parts, part_ids, [0, 10, 20]):
+        for cid, entry in zip(ids, entries[first:first + 10]):
+            part.append_entry(cid, dict(entry))
+        part.build_index("Duration")
+        part.build_index("Requirement")
+    parts[1].build_index("Status")
+    parts[0].review_lines.append((5, "Empty field"))
+    parts[2].review_lines.append((2, "Invalid duration"))
+
+    merged = data_class.merged([("a.csv", parts[0]), ("b.csv", parts[1]), ("sub/c.csv", parts[2])])
+
+    assert type(merged) is data_class
+    assert dict(merged.data) == dict(reference.data)
+    assert {status: list(ids) for status, ids in merged.status_collections.items()} == \
+           {status: list(ids) for status, ids in reference.status_collections.items()}
+    assert [key for key in merged.INDEX_KEYS if merged.is_indexed(key)] == ["Requirement", "Duration"]
+    for key in merged.INDEX_KEYS:
+        assert list(merged.sorted_ids[key]) == list(reference.sorted_ids[key])
+        assert list(merged.sorted_values[key]) == list(reference.sorted_values[key])
+    assert merged.sources == [(1, "a.csv"), (11, "b.csv"), (21, "sub/c.csv")]
+    assert [merged.source_of(cid) for cid in (1, 10, 11, 30)] == ["a.csv", "a.csv", "b.csv", "sub/c.csv"]
+    assert reference.source_of(1) is None
+    assert merged.review_lines == [("a.csv:5", "Empty field"), ("sub/c.csv:2", "Invalid duration")]
@@ -0,0 +1,200 @@
+# tests/test_follower.py
+
+import gzip
+import pytest
+from test_statistic_read_write._follower import CSVFollower
+from test_statistic_read_write._csv_handler import CSVHandler
+from test_statistic_read_write._data import Data, ColumnarData
+from test_statistic_read_write._analyser import Analyser
+from test_statistic_read_write._exceptions import *
+
+@pytest.fixture
+def mock_logger(mocker):
+    """Fixture to mock the Logger class."""
+    mocker.patch('test_statistic_read_write._follower.Logger')
+    return mocker.patch('test_statistic_read_write._csv_handler.Logger').return_value
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_follow_appended_lines(tmp_path, mock_logger, monkeypatch, columnar):
+    """
+    Test-ID: D-T-FOL-INC-001
+    Verifies that every poll parses only the complete lines appended since the previous poll, also across
+    read blocks, that a header or line still being written is parsed once it is complete, that IDs and line
+    numbers continue across polls, and that `add_entry` keeps the built Duration index sorted.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        monkeypatch (pytest.MonkeyPatch): Fixture for patching attributes.
+        columnar (bool): Whether the data is stored in a ColumnarData object.
+    """
+    monkeypatch.setattr(CSVFollower, "BLOCK_SIZE", 16)
+    csv_file = tmp_path / "running.csv"
+    csv_file.write_bytes(b"Test case;Dura")
+    data = ColumnarData() if columnar else Data()
+    follower = CSVFollower(CSVHandler(str(csv_file)), data)
+
+    def append(text):
+        with open(csv_file, "ab") as f:
+            f.write(text.encode("utf-8"))
+        return follower.poll()
+
+    assert follower.poll() == 0
+    assert append("tion;Status\nR1\\TC1;3 sec;Passed\nR1\\TC2;1 s") == 1
+    data.build_index("Duration")
+    assert append("ec;Failed\nR2\\TC3;2 sec\nR2\\TC4;5 sec;Passed\n") == 2
+    assert append("") == 0
+    assert append("R3\\TC5;0.5 sec;Passed\r\nR3\\TC6") == 1
+    follower.close()
+
+    assert data.get_size() == 4
+    assert data.data[4] == {"Requirement": "R3", "Test Case": "TC5", "Duration": 0.5, "Status": "Passed"}
+    assert list(data.sorted_ids["Duration"]) == [4, 2, 1, 3]
+    assert [line_no for line_no, _ in data.review_lines] == [4]
+    assert (follower.lineno, follower.offset) == (6, csv_file.stat().st_size - len(b"R3\\TC6"))
+
+def test_follow_into_stream_and_errors(tmp_path, mock_logger):
+    """
+    Test-ID: D-T-FOL-ERR-001
+    Verifies that a target without `add_entry` (a StreamingAnalysis) receives the entries, that a truncated file
+    raises an InputFileNotFound exception, a compressed file an InvalidFollowMode exception and an invalid header
+    an InvalidHeaderFormat exception.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    csv_file = tmp_path / "running.csv"
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\nR1\\TC2;1 sec;Failed\n", encoding="utf-8")
+    stream = Analyser().create_stream(1)
+    follower = CSVFollower(CSVHandler(str(csv_file)), stream)
+    assert follower.poll() == 2
+    assert stream.result()["top_x_entries"] == [(1, {"Requirement": "R1", "Test Case": "TC1", "Duration": 3, "Status": "Passed"})]
+
+    csv_file.write_text("Test case;Duration;Status\n", encoding="utf-8")
+    with pytest.raises(InputFileNotFound):
+        follower.poll()
+    follower.close()
+
+    compressed = tmp_path / "running.csv.gz"
+    compressed.write_bytes(gzip.compress(b"Test case;Duration;Status\n"))
+    with pytest.raises(InvalidFollowMode):
+        CSVFollower(CSVHandler(str(compressed)), Data())
+
+    csv_file.write_text("Test case;Time;Status\n", encoding="utf-8")
+    follower = CSVFollower(CSVHandler(str(csv_file)), Data())
+    with pytest.raises(InvalidHeaderFormat):
+        follower.poll()
+    follower.close()
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_follow_interrupted_poll(tmp_path, mock_logger, monkeypatch, columnar):
+    """
+    Test-ID: D-T-FOL-INT-001
+    Verifies that a poll interrupted (Ctrl+C) in the middle of a read block keeps the position of the last parsed
+    line, so the next poll continues with the following line and the data and review lines equal those of an
+    uninterrupted read, without duplicates.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        monkeypatch (pytest.MonkeyPatch): Fixture for patching attributes.
+        columnar (bool): Whether the data is stored in a ColumnarData object.
+    """
+    csv_file = tmp_path / "running.csv"
+    lines = [f"R{i}\\TC{i};{i + 1} sec" + ("" if i % 5 == 2 else ";Passed") for i in range(40)]
+    csv_file.write_text("Test case;Duration;Status\n" + "\n".join(lines) + "\n", encoding="utf-8")
+
+    expected = ColumnarData() if columnar else Data()
+    follower = CSVFollower(CSVHandler(str(csv_file)), expected)
+    assert follower.poll() == 32
+    follower.close()
+
+    data = ColumnarData() if columnar else Data()
+    add_entry = data.add_entry
+    calls = []
+
+    def interrupted_add_entry(entry_id, entry):
+        calls.append(entry_id)
+        if len(calls) == 10:
+            raise KeyboardInterrupt
+        add_entry(entry_id, entry)
+    monkeypatch.setattr(data, "add_entry", interrupted_add_entry)
+
+    follower = CSVFollower(CSVHandler(str(csv_file)), data)
+    with pytest.raises(KeyboardInterrupt):
+        follower.poll()
+    assert follower.lineno == 12
+    assert follower.poll() == 23
+    follower.close()
+
+    assert data.get_size() == 32
+    assert dict(data.data) == dict(expected.data)
+    assert data.review_lines == expected.review_lines
+
+def test_follow_final_poll(tmp_path, mock_logger):
+    """
+    Test-ID: D-T-FOL-FIN-001
+    Verifies that a final poll also parses a last line without line ending, which a normal poll leaves for a
+    later poll, that the follow read then equals a normal read of the CSV, and that a final poll of a header
+    without line ending validates it.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    csv_file = tmp_path / "running.csv"
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\nR1\\TC2;1 sec;Failed", encoding="utf-8")
+    data = Data()
+    follower = CSVFollower(CSVHandler(str(csv_file)), data)
+
+    assert follower.poll() == 1
+    assert follower.poll(final=True) == 1
+    assert follower.poll(final=True) == 0
+    follower.close()
+
+    expected = Data()
+    CSVHandler(str(csv_file)).read_csv(expected)
+    assert dict(data.data) == dict(expected.data)
+    assert (follower.lineno, follower.offset) == (3, csv_file.stat().st_size)
+
+    csv_file.write_text("Test case;Duration;Status", encoding="utf-8")
+    follower = CSVFollower(CSVHandler(str(csv_file)), Data())
+    assert follower.poll(final=True) == 0
+    assert follower.lineno == 1
+    follower.close()
+
+    csv_file.write_text("Test case;Time;Status", encoding="utf-8")
+    follower = CSVFollower(CSVHandler(str(csv_file)), Data())
+    with pytest.raises(InvalidHeaderFormat):
+        follower.poll(final=True)
+    follower.close()
+
+def test_follow_cr_only_line_endings(tmp_path, mock_logger):
+    """
+    Test-ID: D-T-FOL-CRL-001
+    Verifies that a CSV with only '\\r' line endings (also after the header) is followed like it is read by the
+    CSVHandler, and that a '\\r' at the end of the appended bytes is only taken as line ending once the next
+    byte shows it is not the first half of a '\\r\\n'.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    csv_file = tmp_path / "running.csv"
+    csv_file.write_bytes(b"Test case;Duration;Status\rR1\\TC1;3 sec;Passed\rR1\\TC2;1 sec\rR2\\TC3;2 sec;Failed\r")
+    data = Data()
+    follower = CSVFollower(CSVHandler(str(csv_file)), data)
+
+    assert follower.poll() == 1
+    assert follower.lineno == 3
+    with open(csv_file, "ab") as f:
+        f.write(b"\nR2\\TC4;5 sec;Passed\r")
+    assert follower.poll() == 1
+    assert follower.poll(final=True) == 1
+    follower.close()
+
+    expected = CSVHandler(str(csv_file)).read_csv()
+    assert dict(data.data) == dict(expected.data)
+    assert data.review_lines == expected.review_lines == [(3, "2 columns instead of 3")]
+    assert follower.lineno == 5
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import MagicMock
 from test_statistic_read_write._logger import Logger
+from test_statistic_read_write._csv_handler import CSVHandler
 import logging
 from pathlib import Path
 
@@ -233,3 +234,205 @@ def test_log_warning(mock_logging):
 
 
 
+
+def test_is_enabled_for(mock_logging, tmp_path, mocker):
+    """
+    Test-ID: D-T-LOG-ENA-001
+    Tests the level check against the console and file handler levels.
+
+    Args:
+        mock_logging (pytest.fixture): Fixture to mock logging module components.
+        tmp_path (pytest.fixture): Fixture to provide a temporary path for testing.
+        mocker (pytest.fixture): Fixture to mock objects.
+        reset_logger_singleton (pytest.fixture): Fixture to reset the Logger singleton instance.
+    """
+    mock_logging['mock_logger'].hasHandlers.return_value = False
+    logger = Logger()
+
+    assert not logger.is_enabled_for(logging.ERROR)
+    assert logger.is_enabled_for(logging.CRITICAL)
+
+    logger.set_verbose(True)
+    assert logger.is_enabled_for(logging.INFO)
+    assert not logger.is_enabled_for(logging.DEBUG)
+
+    logger.set_verbose(False)
+    assert not logger.is_enabled_for(logging.WARNING)
+
+    mocker.patch('test_statistic_read_write._logger.logging.FileHandler')
+    logger.set_log_folder(str(tmp_path))
+    assert logger.is_enabled_for(logging.DEBUG)
+
+def test_is_enabled_for_other_handlers():
+    """
+    Test-ID: D-T-LOG-ENA-002
+    Tests that handlers attached to the underlying logging.Logger by other code are considered by the level check.
+
+    Args:
+        reset_logger_singleton (pytest.fixture): Fixture to reset the Logger singleton instance.
+    """
+    logger = Logger()
+    saved_handlers = logger.logger.handlers[:]
+    logger.logger.handlers = [logger.ch]
+    logger.logger.propagate = False
+    handler = logging.NullHandler()
+    handler.setLevel(logging.ERROR)
+    try:
+        logger.set_verbose(False)
+        assert not logger.is_enabled_for(logging.ERROR)
+
+        logger.logger.addHandler(handler)
+        assert logger.is_enabled_for(logging.ERROR)
+        assert not logger.is_enabled_for(logging.WARNING)
+
+        handler.setLevel(logging.WARNING)
+        assert logger.is_enabled_for(logging.WARNING)
+        logger.logger.setLevel(logging.ERROR)
+        assert not logger.is_enabled_for(logging.WARNING)
+    finally:
+        logger.logger.handlers = saved_handlers
+        logger.logger.propagate = True
+        logger.logger.setLevel(logging.DEBUG)
+
+def test_is_enabled_for_caplog(caplog):
+    """
+    Test-ID: D-T-LOG-ENA-003
+    Tests that the level check follows pytest's caplog, which attaches its handler and sets levels after the
+    Logger was created, so the skip warnings of the CSVHandler are captured.
+
+    Args:
+        caplog (pytest.LogCaptureFixture): Fixture capturing log records.
+        reset_logger_singleton (pytest.fixture): Fixture to reset the Logger singleton instance.
+    """
+    logger = Logger()
+    logger.set_verbose(False)
+    handler = CSVHandler("input.csv")
+    review_lines = []
+
+    with caplog.at_level(logging.ERROR, logger="TestStatisticReadWrite"):
+        assert not logger.is_enabled_for(logging.WARNING)
+        handler._skip(review_lines, 2, "Expected 3 columns", "CSVHandler: Line %d has %d columns.", 2, 2)
+    assert logger.is_enabled_for(logging.WARNING)
+    handler._skip(review_lines, 3, "Expected 3 columns", "CSVHandler: Line %d has %d columns.", 3, 2)
+
+    assert [record.getMessage() for record in caplog.records] == ["CSVHandler: Line 3 has 2 columns."]
+    assert [line_no for line_no, _ in review_lines] == [2, 3]
+
+def test_log_deferred_arguments(mock_logging):
+    """
+    Test-ID: D-T-LOG-ARG-001
+    Tests that %-style arguments are passed to the logging module unformatted.
+
+    Args:
+        mock_logging (pytest.fixture): Fixture to mock logging module components.
+        reset_logger_singleton (pytest.fixture): Fixture to reset the Logger singleton instance.
+    """
+    mock_logging['mock_logger'].hasHandlers.return_value = False
+    logger = Logger()
+
+    logger.log_warning("Line %d has %d columns.", 3, 4)
+    mock_logging['mock_logger'].warning.assert_called_once_with("Line %d has %d columns.", 3, 4)
+
+    logger.log_error("Invalid value '%s'.", "x")
+    mock_logging['mock_logger'].error.assert_called_once_with("Invalid value '%s'.", "x")
+
+    logger.log_info("Parsed %d lines.", 10)
+    mock_logging['mock_logger'].info.assert_called_once_with("Parsed %d lines.", 10)
+
+@pytest.fixture
+def isolated_logger():
+    """Provides a real Logger whose underlying logging.Logger only holds the console handler, restored afterwards."""
+    logger = Logger()
+    saved_handlers = logger.logger.handlers[:]
+    logger.logger.handlers = [logger.ch]
+    logger._handlers = [logger.ch]
+    logger.logger.propagate = False
+    yield logger
+    logger.set_async(False)
+    if logger.fh:
+        logger.fh.close()
+    logger.logger.handlers = saved_handlers
+    logger.logger.propagate = True
+
+def test_async_logging(isolated_logger, tmp_path):
+    """
+    Test-ID: D-T-LOG-ASY-001
+    Tests that in asynchronous mode records are passed through a queue to the file handler,
+    that flush writes all pending records and that disabling the mode restores the handlers.
+
+    Args:
+        isolated_logger (Logger): Fixture providing a real, isolated Logger.
+        tmp_path (pytest.fixture): Fixture to provide a temporary path for testing.
+        reset_logger_singleton (pytest.fixture): Fixture to reset the Logger singleton instance.
+    """
+    logger = isolated_logger
+    logger.set_log_folder(str(tmp_path))
+
+    logger.set_async(True)
+    assert logger._queue_handler in logger.logger.handlers
+    assert logger.ch not in logger.logger.handlers
+    assert logger.fh not in logger.logger.handlers
+    assert not logger.is_enabled_for(logging.DEBUG - 1)
+
+    for lineno in range(100):
+        logger.log_warning("Line %d skipped.", lineno)
+    logger.flush()
+
+    lines = (tmp_path / "test_statistic_read_wrte.log").read_text().splitlines()
+    assert len(lines) == 100
+    assert lines[-1].endswith("WARNING - Line 99 skipped.")
+
+    logger.set_async(False)
+    assert logger._queue_handler is None
+    assert logger.ch in logger.logger.handlers
+    assert logger.fh in logger.logger.handlers
+
+def test_async_logging_change_log_folder(isolated_logger, tmp_path):
+    """
+    Test-ID: D-T-LOG-ASY-002
+    Tests that changing the log folder in asynchronous mode writes the queued records to the
+    previous file before switching to the new one.
+
+    Args:
+        isolated_logger (Logger): Fixture providing a real, isolated Logger.
+        tmp_path (pytest.fixture): Fixture to provide a temporary path for testing.
+        reset_logger_singleton (pytest.fixture): Fixture to reset the Logger singleton instance.
+    """
+    logger = isolated_logger
+    folder1 = tmp_path / "logs1"
+    folder2 = tmp_path / "logs2"
+    folder1.mkdir()
+    folder2.mkdir()
+
+    logger.set_async(True)
+    logger.set_log_folder(str(folder1))
+    logger.log_error("first")
+    logger.set_log_folder(str(folder2))
+    logger.log_error("second")
+    logger.flush()
+
+    assert (folder1 / "test_statistic_read_wrte.log").read_text().splitlines()[0].endswith("ERROR - first")
+    assert (folder2 / "test_statistic_read_wrte.log").read_text().splitlines()[0].endswith("ERROR - second")
+
+def test_async_logging_forked_child(isolated_logger, tmp_path):
+    """
+    Test-ID: D-T-LOG-ASY-003
+    Tests that a forked child process switches back to synchronous handlers, as it has no listener thread.
+
+    Args:
+        isolated_logger (Logger): Fixture providing a real, isolated Logger.
+        tmp_path (pytest.fixture): Fixture to provide a temporary path for testing.
+        reset_logger_singleton (pytest.fixture): Fixture to reset the Logger singleton instance.
+    """
+    logger = isolated_logger
+    logger.set_log_folder(str(tmp_path))
+    logger.set_async(True)
+    listener = logger._listener
+
+    logger._disable_async_in_child()
+
+    assert logger._listener is None
+    assert logger.fh in logger.logger.handlers
+    logger.log_error("from child")
+    assert (tmp_path / "test_statistic_read_wrte.log").read_text().splitlines()[-1].endswith("ERROR - from child")
+    listener.stop()
@@ -0,0 +1,117 @@
+# tests/test_multi_csv_handler.py
+
+import gzip
+import os
+import pytest
+from test_statistic_read_write._multi_csv_handler import MultiCSVHandler, expand_input_paths
+from test_statistic_read_write._csv_handler import CSVHandler
+from test_statistic_read_write._analyser import Analyser
+from test_statistic_read_write._exceptions import *
+
+GOLDEN_INPUT = os.path.join(os.path.dirname(__file__), "golden", "input.csv")
+
+@pytest.fixture
+def mock_logger(mocker):
+    """Fixture to mock the Logger class."""
+    return mocker.patch('test_statistic_read_write._csv_handler.Logger').return_value
+
+@pytest.fixture
+def station_files(tmp_path):
+    """
+    Fixture splitting the golden input into three station files, the last one gzip compressed.
+
+    Returns:
+        List[str]: The paths of the station files in order.
+    """
+    with open(GOLDEN_INPUT, encoding="utf-8") as f:
+        header, *lines = f.readlines()
+    third = len(lines) // 3
+    (tmp_path / "station1").mkdir()
+    (tmp_path / "station2").mkdir()
+    paths = [tmp_path / "station1" / "results.csv", tmp_path / "station2" / "results.csv", tmp_path / "station3.csv.gz"]
+    paths[0].write_text(header + "".join(lines[:third]), encoding="utf-8")
+    paths[1].write_text(header + "".join(lines[third:2 * third]), encoding="utf-8")
+    paths[2].write_bytes(gzip.compress((header + "".join(lines[2 * third:])).encode("utf-8")))
+    return [str(path) for path in paths]
+
+def test_expand_input_paths(tmp_path):
+    """
+    Test-ID: D-T-MCS-EXP-001
+    Verifies that input paths are expanded from folders and glob patterns to the CSV files (also compressed)
+    in name order, skipping the snapshot, checkpoint and other files next to them, that other paths are kept
+    as given, and that duplicates are removed.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    for name in ["b.csv", "a.csv.gz", "notes.txt", "c.CSV", "d.gz", "b.csv.snapshot", "b.csv.checkpoint"]:
+        (tmp_path / name).write_text("", encoding="utf-8")
+    (tmp_path / "sub.csv").mkdir()
+    folder = str(tmp_path)
+
+    assert expand_input_paths(folder) == [os.path.join(folder, name) for name in ["a.csv.gz", "b.csv", "c.CSV"]]
+    assert expand_input_paths(os.path.join(folder, "*.csv*")) == [os.path.join(folder, "a.csv.gz"), os.path.join(folder, "b.csv")]
+    assert expand_input_paths(os.path.join(folder, "*")) == expand_input_paths(folder)
+    assert expand_input_paths([os.path.join(folder, "b.csv"), os.path.join(folder, "[ab].csv"), "missing.csv"]) == \
+           [os.path.join(folder, "b.csv"), "missing.csv"]
+    assert expand_input_paths(os.path.join(folder, "*.json")) == []
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_read_multiple_files(tmp_path, mock_logger, capsys, station_files, columnar, jobs):
+    """
+    Test-ID: D-T-MCS-RDC-001
+    Verifies that several files are read, serially or in worker processes, into the same entries, sorted indexes
+    and analysis as one CSV with all their lines, that skipped lines are reported and quarantined as 'file:line',
+    and that the exported file is named after the output name.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+        station_files (List[str]): Fixture providing the paths of the station files.
+        columnar (bool): Whether the data is stored in a ColumnarData object.
+        jobs (int): The number of worker processes.
+    """
+    quarantine = tmp_path / "skipped.csv"
+    handler = MultiCSVHandler(station_files, columnar=columnar, jobs=jobs, quarantine_path=str(quarantine),
+                              index_keys=["Duration", "Status"], output_name="nightly")
+    data = handler.read_csv()
+    expected = CSVHandler(GOLDEN_INPUT, columnar=columnar).read_csv()
+
+    assert type(data) is type(expected)
+    assert dict(data.data) == dict(expected.data)
+    assert [key for key in data.INDEX_KEYS if data.is_indexed(key)] == ["Duration", "Status"]
+    for key in data.INDEX_KEYS:
+        assert list(data.sorted_ids[key]) == list(expected.sorted_ids[key])
+    assert Analyser().analyze(data, 5, group_by="Requirement") == Analyser().analyze(expected, 5, group_by="Requirement")
+
+    assert [source for _, source in data.sources] == ["station1/results.csv", "station2/results.csv", "station3.csv.gz"]
+    assert len(data.review_lines) == len(expected.review_lines) == 1
+    assert data.review_lines[0][0] == "station2/results.csv:7"
+    assert "  - Line station2/results.csv:7 skipped: " in capsys.readouterr().out
+    assert quarantine.read_text(encoding="utf-8").splitlines()[1].startswith("station2/results.csv:7;Duration parse error")
+
+    handler.export_csv(data, str(tmp_path), "Duration")
+    assert os.path.isfile(tmp_path / "nightly_sorted_by_Duration.csv")
+
+def test_read_multiple_files_into_target(mock_logger, station_files):
+    """
+    Test-ID: D-T-MCS-STR-001
+    Verifies that a target (a StreamingAnalysis) receives the entries of all files with continuing IDs and
+    the skipped lines as 'file:line', and that an invalid file stops the read.
+
+    Args:
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+        station_files (List[str]): Fixture providing the paths of the station files.
+    """
+    stream = MultiCSVHandler(station_files).read_csv(Analyser().create_stream(5))
+    expected = Analyser().analyze(CSVHandler(GOLDEN_INPUT).read_csv(), 5)
+
+    assert stream.result() == expected
+    assert stream.review_lines[0][0] == "station2/results.csv:7"
+
+    with open(station_files[1], "w", encoding="utf-8") as f:
+        f.write("Test case;Duration\n")
+    with pytest.raises(InvalidHeaderColumns):
+        MultiCSVHandler(station_files, jobs=2).read_csv()
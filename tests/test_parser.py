@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
-from test_statistic_read_write._parser import TestCaseParser, DurationParser, StatusParser
+from test_statistic_read_write._parser import TestCaseParser, DurationParser, StatusParser, DurationFormatter
 
 @pytest.fixture
 def mock_logger(mocker):
@@ -143,7 +143,7 @@ def test_test_case_parser_empty_part(test_case_parser, mock_logger):
     """
     result = test_case_parser.parse("R1\\")
     assert result is None
-    mock_logger.log_error.assert_called_once_with("TestCaseParser: One side of the backslash is empty in 'R1\\'.")
+    mock_logger.log_error.assert_called_once_with("TestCaseParser: One side of the backslash is empty in '%s'.", "R1\\")
 
 def test_test_case_parser_invalid_format(test_case_parser, mock_logger):
     """
@@ -156,7 +156,7 @@ def test_test_case_parser_invalid_format(test_case_parser, mock_logger):
     """
     result = test_case_parser.parse("R1TC1")
     assert result is None
-    mock_logger.log_error.assert_called_once_with("TestCaseParser: Expected exactly one backslash in 'R1TC1'.")
+    mock_logger.log_error.assert_called_once_with("TestCaseParser: Expected exactly one backslash in '%s'.", "R1TC1")
 
 def test_test_case_parser_valid(test_case_parser):
     """
@@ -180,3 +180,144 @@ def test_test_case_parser_valid_spaces(test_case_parser):
     result = test_case_parser.parse(" R1 \\ TC1 ")
     assert result == {"Requirement": "R1", "Test Case": "TC1"}
 
+
+def test_duration_parser_cache_hit(duration_parser, mock_logger, mocker):
+    """
+    Test-ID: D-T-PAR-DPC-001
+    Verifies that a repeated duration string is answered from the cache, for successes and failures,
+    and that the log messages of the first parse are emitted again on a hit.
+
+    Args:
+        duration_parser (DurationParser): The DurationParser fixture.
+        mock_logger (MagicMock): The mocked Logger fixture.
+        mocker (pytest.mocker): The mocker fixture.
+    """
+    parse_spy = mocker.spy(duration_parser, "_parse_uncached")
+
+    assert duration_parser.parse("2 min 48 sec") == pytest.approx(168.0)
+    assert duration_parser.parse("2 min 48 sec") == pytest.approx(168.0)
+    assert duration_parser.parse("5 days") is None
+    assert duration_parser.parse("5 days") is None
+    assert duration_parser.parse("75 sec") == pytest.approx(75.0)
+    assert duration_parser.parse("75 sec") == pytest.approx(75.0)
+
+    assert parse_spy.call_count == 3
+    assert mock_logger.log_error.call_count == 2
+    mock_logger.log_error.assert_called_with("DurationParser: Unknown unit 'days' in '5 days'.")
+    assert mock_logger.log_warning.call_count == 2
+
+    info = duration_parser.cache_info()
+    assert info["hits"] == 3
+    assert info["misses"] == 3
+    assert info["size"] == 3
+    assert info["hit_rate"] == pytest.approx(0.5)
+
+@pytest.mark.parametrize("policy, cached", [
+    ("lru", ["1 sec", "3 sec"]),
+    ("fifo", ["2 sec", "3 sec"]),
+])
+def test_duration_parser_cache_eviction(mock_logger, policy, cached):
+    """
+    Test-ID: D-T-PAR-DPC-002
+    Verifies the eviction policies of the DurationParser cache. With 'lru' a hit keeps the entry,
+    with 'fifo' the oldest inserted entry is evicted regardless of hits.
+
+    Args:
+        mock_logger (MagicMock): The mocked Logger fixture.
+        policy (str): The eviction policy.
+        cached (list): The duration strings expected in the cache afterwards.
+    """
+    duration_parser = DurationParser(cache_size=2, cache_policy=policy)
+
+    duration_parser.parse("1 sec")
+    duration_parser.parse("2 sec")
+    duration_parser.parse("1 sec")
+    duration_parser.parse("3 sec")
+
+    assert sorted(duration_parser.cache._entries) == cached
+    assert duration_parser.cache_info()["maxsize"] == 2
+
+def test_duration_parser_cache_disabled(mock_logger):
+    """
+    Test-ID: D-T-PAR-DPC-003
+    Verifies that a cache size of 0 disables the cache and that an unknown policy is rejected.
+
+    Args:
+        mock_logger (MagicMock): The mocked Logger fixture.
+    """
+    duration_parser = DurationParser(cache_size=0)
+
+    assert duration_parser.parse("5 sec") == pytest.approx(5.0)
+    assert duration_parser.parse("5 sec") == pytest.approx(5.0)
+    assert duration_parser.cache_info()["hits"] == 0
+    assert duration_parser.cache_info()["size"] == 0
+
+    with pytest.raises(ValueError):
+        DurationParser(cache_policy="random")
+
+@pytest.mark.parametrize("input_str, expected, log_calls", [
+    ("5 sec10 min", 605.0, []),
+    ("75 sec 90 min", 5475.0, [
+        ("log_warning", "DurationParser: '75.0 sec' > '59' is unusual."),
+        ("log_warning", "DurationParser: '90.0 min' > '59' is unusual."),
+    ]),
+    ("75 sec 5 days", None, [
+        ("log_warning", "DurationParser: '75.0 sec' > '59' is unusual."),
+        ("log_error", "DurationParser: Unknown unit 'days' in '75 sec 5 days'."),
+    ]),
+    ("-5 sec 5 days", None, [
+        ("log_error", "DurationParser: Negative value '-5.0 sec' in '-5 sec 5 days'."),
+    ]),
+    ("5 days 5 sec extra", None, [
+        ("log_error", "DurationParser: Unrecognized components in '5 days 5 sec extra': 'extra'"),
+    ]),
+    ("5 sec 5 sec x", None, [
+        ("log_error", "DurationParser: Unrecognized components in '5 sec 5 sec x': 'x'"),
+    ]),
+    ("5 sec\t", None, [
+        ("log_error", "DurationParser: Unrecognized components in '5 sec\t': '\t'"),
+    ]),
+    ("  1 hr\t30 min  ", None, [
+        ("log_error", "DurationParser: Unrecognized components in '  1 hr\t30 min  ': '1hr\t30min'"),
+    ]),
+])
+def test_duration_parser_single_pass_order(mock_logger, input_str, expected, log_calls):
+    """
+    Test-ID: D-T-PAR-DPV-003
+    Verifies the order of checks of the single-pass DurationParser scan: format errors take
+    precedence over value errors anywhere in the string, only the first value error is reported,
+    and the warnings of the tokens before it are still logged.
+
+    Args:
+        mock_logger (MagicMock): The mocked Logger fixture.
+        input_str (str): The input time string to parse.
+        expected (float or None): The expected parsed duration in seconds, or None if an error is expected.
+        log_calls (list): The expected (method, message) calls on the Logger, in order.
+    """
+    duration_parser = DurationParser(cache_size=0)
+
+    result = duration_parser.parse(input_str)
+
+    if expected is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected)
+    assert [(name, args[0]) for name, args, _ in mock_logger.method_calls if name.startswith("log_")] == log_calls
+
+def test_duration_formatter():
+    """
+    Test-ID: D-T-PAR-DFM-001
+    Verifies that DurationFormatter formats durations with 9, 6 or 3 decimals depending on their magnitude,
+    without trailing zeros, that single and batch formatting agree with the uncached formatting, and that
+    the memo cache stays within its size limit.
+    """
+    formatter = DurationFormatter(cache_size=4)
+    expected = {
+        1e-9: "0.000000001", 9.99e-7: "0.000000999", 1e-6: "0.000001", 0.5: "0.5", 59.9999999: "60",
+        60.0: "60", 3600.001: "3600.001", 12.0: "12", 1.25: "1.25", 363599.0: "363599",
+    }
+
+    assert [formatter.format(duration) for duration in expected] == list(expected.values())
+    assert formatter.format_many(list(expected) * 2) == list(expected.values()) * 2
+    assert all(DurationFormatter.format_uncached(duration) == text for duration, text in expected.items())
+    assert len(formatter._cache) <= 4
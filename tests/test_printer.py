@@ -2,6 +2,7 @@
 
 import pytest
 from test_statistic_read_write._printer import Printer
+from test_statistic_read_write._aggregators import DurationSketch, GroupBy
 from typing import List, Tuple, Dict, Any
 import re
 
@@ -295,3 +296,74 @@ def test_get_width_with_longer_data_values(printer):
 
     assert widths == [expected_id_width, expected_req_width, expected_tc_width, expected_dur_width, expected_stat_width]
 
+
+def test_display_results_distribution(printer, capsys):
+    """
+    Test-ID: D-T-PRI-DDO-001
+    Tests the `display_results` method with duration sketches.
+
+    Verifies that the approximate percentiles are printed per group, and that the log-scale histogram
+    is printed as a table with one row per decade and one column per group (0 where a group has no
+    durations in a decade).
+
+    Args:
+        printer (Printer): The `Printer` fixture.
+        capsys (pytest.fixture): Fixture for capturing stdout and stderr.
+    """
+    overall = DurationSketch()
+    sketches = {"Pass": DurationSketch(), "Fail": DurationSketch()}
+    for duration, status in [(2.0, "Pass"), (30.0, "Fail"), (2.0, "Pass"), (30.0, "Fail")]:
+        overall.add(duration)
+        sketches[status].add(duration)
+    analysis = {
+        "total_duration": 64.0,
+        "top_x_entries": [],
+        "test_case_counts": (4, 4, 0),
+        "status_counts": {"Pass": 2, "Fail": 2},
+        "duration_sketch_overall": overall,
+        "duration_sketches": sketches,
+    }
+
+    printer.display_results(analysis)
+
+    lines = capsys.readouterr().out.splitlines()
+    start = lines.index("Duration Percentiles (Approx. +/-1%, Seconds):")
+    assert lines[start + 1] == "  All: p50 2.000, p90 30.000, p99 30.000"
+    assert lines[start + 2] == "  Pass: p50 2.000, p90 2.000, p99 2.000"
+    assert lines[start + 3] == "  Fail: p50 30.000, p90 30.000, p99 30.000"
+    assert lines[start + 4] == "Duration Histogram (Seconds, Log Scale):"
+    assert lines[start + 5].split() == ["Range", "All", "Pass", "Fail"]
+    assert lines[start + 6].split() == ["[1,", "10)", "2", "2", "0"]
+    assert lines[start + 7].split() == ["[10,", "100)", "2", "0", "2"]
+
+def test_display_results_groups(printer, capsys):
+    """
+    Test-ID: D-T-PRI-DGO-001
+    Tests the `display_results` method with the top groups of a group-by.
+
+    Verifies that a title with the number of groups and a table with the duration statistics and one
+    column per status (count and share of the group) is printed.
+
+    Args:
+        printer (Printer): The `Printer` fixture.
+        capsys (pytest.fixture): Fixture for capturing stdout and stderr.
+    """
+    groups = GroupBy("Requirement")
+    groups.add_all(["R1", "R2", "R1", "R3"], [2.0, 10.0, 4.0, 1.0], ["Passed", "Failed", "Failed", "Passed"])
+    analysis = {
+        "total_duration": 17.0,
+        "top_x_entries": [],
+        "test_case_counts": (4, 4, 0),
+        "status_counts": {"Passed": 2, "Failed": 2},
+        "groups": groups.result(2),
+    }
+
+    printer.display_results(analysis)
+
+    lines = capsys.readouterr().out.splitlines()
+    start = lines.index("Top 2 of 3 Requirement Groups (By Total Duration):")
+    assert lines[start + 1].split() == ["Requirement", "Count", "Total", "(sec)", "Mean", "(sec)", "Min", "(sec)",
+                                        "Max", "(sec)", "Failed", "Passed"]
+    assert set(lines[start + 2].strip()) == {"-"}
+    assert lines[start + 3].split() == ["R2", "1", "10.000", "10.000", "10.000", "10.000", "1", "(100.0%)", "0", "(0.0%)"]
+    assert lines[start + 4].split() == ["R1", "2", "6.000", "3.000", "2.000", "4.000", "1", "(50.0%)", "1", "(50.0%)"]
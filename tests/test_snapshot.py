@@ -0,0 +1,93 @@
+# tests/test_snapshot.py
+
+import os
+import pytest
+from test_statistic_read_write._snapshot import save_snapshot, load_snapshot, source_signature, snapshot_path_for, \
+    MAGIC, _HEADER_LENGTH
+from test_statistic_read_write._analyser import Analyser
+from test_statistic_read_write._data import Data, ColumnarData
+
+SOURCE = {"size": 1234, "mtime_ns": 42}
+
+def _fill(data):
+    """Appends 30 entries with repeated values and two review lines to `data`."""
+    statuses = ["Passed", "Failed", "Skipped"]
+    for cid in range(2, 32):
+        data.append_entry(cid, {"Requirement": f"{cid % 4}_Req_{cid % 3}", "Test Case": f"TC{cid % 7}",
+                                "Duration": float(cid % 5), "Status": statuses[cid % 3]})
+    data.review_lines.extend([(1, "Empty field"), (32, "Invalid duration")])
+    return data
+
+@pytest.mark.parametrize("data_class", [Data, ColumnarData])
+def test_snapshot_round_trip(tmp_path, data_class):
+    """
+    Test-ID: D-T-SNP-RTR-001
+    Verifies that a snapshot restores the entries, status collections, review lines and the built sorted indexes
+    of a Data or ColumnarData object, and that the restored data yields the same analysis and accepts new entries.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        data_class (type): The class of the saved data object.
+    """
+    data = _fill(data_class())
+    data.build_index("Duration")
+    data.build_index("Requirement")
+    path = str(tmp_path / "input.csv.snapshot")
+
+    save_snapshot(data, path, SOURCE)
+    restored = load_snapshot(path, SOURCE)
+
+    assert isinstance(restored, ColumnarData)
+    assert dict(restored.data) == dict(data.data)
+    assert {status: list(ids) for status, ids in restored.status_collections.items()} == \
+           {status: list(ids) for status, ids in data.status_collections.items()}
+    assert restored.review_lines == data.review_lines
+    assert [key for key in restored.INDEX_KEYS if restored.is_indexed(key)] == ["Requirement", "Duration"]
+    for key in data.INDEX_KEYS:
+        assert list(restored.sorted_ids[key]) == list(data.sorted_ids[key])
+        assert list(restored.sorted_values[key]) == list(data.sorted_values[key])
+    assert Analyser().analyze(restored, 5, percentiles=True, group_by="Requirement") == \
+           Analyser().analyze(data, 5, percentiles=True, group_by="Requirement")
+
+    entry = {"Requirement": "0_Req_0", "Test Case": "TC0", "Duration": 2.5, "Status": "Passed"}
+    data.add_entry(40, dict(entry))
+    restored.add_entry(40, dict(entry))
+    assert list(restored.sorted_ids["Duration"]) == list(data.sorted_ids["Duration"])
+    assert os.listdir(tmp_path) == ["input.csv.snapshot"]
+
+def test_snapshot_rejected(tmp_path):
+    """
+    Test-ID: D-T-SNP-INV-001
+    Verifies that loading a snapshot raises a ValueError if it belongs to another version of the source CSV,
+    or if the file is not a snapshot, was written by another format version, has a header without the required
+    keys, or is truncated.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\n", encoding="utf-8")
+    path = snapshot_path_for(str(csv_file))
+    source = source_signature(str(csv_file))
+    save_snapshot(_fill(Data()), path, source)
+    content = open(path, "rb").read()
+
+    assert path == str(csv_file) + ".snapshot"
+    assert load_snapshot(path, source).get_size() == 30
+
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;1 sec;Passed\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="stale"):
+        load_snapshot(path, source_signature(str(csv_file)))
+
+    corrupted = {
+        "not a snapshot": b"Test case;Duration;Status\n",
+        "unsupported snapshot version": content.replace(b'"version": 1', b'"version": 9', 1),
+        "corrupt snapshot header": MAGIC + _HEADER_LENGTH.pack(len(b'{"version": 1}')) + b'{"version": 1}',
+        "truncated": content[:-64],
+        "empty": b"",
+    }
+    for message, payload in corrupted.items():
+        with open(path, "wb") as f:
+            f.write(payload)
+        with pytest.raises(ValueError, match=message):
+            load_snapshot(path, source)
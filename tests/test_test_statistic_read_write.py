@@ -1,10 +1,15 @@
 # tests/test_test_statistic_read_write.py
 
+import gzip
+import lzma
 import pytest
 import os
 from unittest.mock import patch, MagicMock
 
 from test_statistic_read_write.test_statistic_read_write import TestStatisticReadWrite
+from test_statistic_read_write._csv_handler import CSVHandler
+from test_statistic_read_write._analyser import Analyser
+from test_statistic_read_write._data import Data
 from test_statistic_read_write._exceptions import *
 
 
@@ -230,3 +235,403 @@ def test_set_sort_key(mocker, mock_makedirs):
     assert orchestrator.sort_key == "Duration"
     orchestrator.sort_key = "Status"
     assert orchestrator.sort_key == "Status"
+
+def test_set_invalid_jobs(mocker, mock_makedirs):
+    """
+    Test-ID: D-T-ORC-JOB-001
+    Verifies that an InvalidJobCount exception is raised for a negative number of parsing processes.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_makedirs (pytest.fixture): Fixture providing a mocked `os.makedirs`.
+    """
+    mocker.patch("test_statistic_read_write.test_statistic_read_write.os.path.isfile", return_value=True)
+    orchestrator = TestStatisticReadWrite("some.csv", "out", 10, jobs=4)
+    assert orchestrator.jobs == 4
+    assert orchestrator.csv_handler.jobs == 4
+
+    with pytest.raises(InvalidJobCount):
+        orchestrator.jobs = -1
+
+def test_set_async_log(mocker, mock_makedirs, mock_logger):
+    """
+    Test-ID: D-T-ORC-ASY-001
+    Verifies that the async_log option switches the Logger to asynchronous mode and back.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_makedirs (pytest.fixture): Fixture providing a mocked `os.makedirs`.
+        mock_logger (MagicMock): Fixture providing a mocked Logger instance.
+    """
+    mocker.patch("test_statistic_read_write.test_statistic_read_write.os.path.isfile", return_value=True)
+    orchestrator = TestStatisticReadWrite("some.csv", "out", 10, async_log=True)
+    assert orchestrator.async_log is True
+    mock_logger.set_async.assert_called_once_with(True)
+
+    orchestrator.async_log = False
+    assert orchestrator.async_log is False
+    mock_logger.set_async.assert_called_with(False)
+
+def test_run_report_only(mock_is_file, mock_makedirs, mock_logger, mock_csv_handler, mock_analyser, mock_printer):
+    """
+    Test-ID: D-T-ORC-REP-001
+    Verifies that in report-only mode the CSV is read into a streaming analysis, its results are displayed,
+    and that neither a Data object is analyzed nor a CSV exported. No output folder is needed.
+
+    Args:
+        mock_is_file (pytest.fixture): Fixture providing a mocked `os.path.isfile`.
+        mock_makedirs (pytest.fixture): Fixture providing a mocked `os.makedirs`.
+        mock_logger (pytest.fixture): Fixture providing a mocked Logger instance.
+        mock_csv_handler (pytest.fixture): Fixture providing a mocked CSVHandler instance.
+        mock_analyser (pytest.fixture): Fixture providing a mocked Analyser instance.
+        mock_printer (pytest.fixture): Fixture providing a mocked Printer instance.
+    """
+    orchestrator = TestStatisticReadWrite("in.csv", None, 3, report_only=True)
+    assert orchestrator.output_folder is None
+    mock_makedirs.assert_not_called()
+
+    orchestrator.run()
+
+    mock_analyser.create_stream.assert_called_once_with(3, percentiles=False, group_by=None, top_groups=10)
+    mock_csv_handler.read_csv.assert_called_once_with(mock_analyser.create_stream.return_value)
+    mock_printer.display_results.assert_called_once_with(mock_csv_handler.read_csv.return_value.result.return_value)
+    mock_analyser.analyze.assert_not_called()
+    mock_csv_handler.export_csv.assert_not_called()
+
+def test_run_percentiles(mock_is_file, mock_makedirs, mock_logger, mock_csv_handler, mock_analyser, mock_printer):
+    """
+    Test-ID: D-T-ORC-PCT-001
+    Verifies that the percentiles option is passed to the Analyser and that its result is displayed.
+
+    Args:
+        mock_is_file (pytest.fixture): Fixture providing a mocked `os.path.isfile`.
+        mock_makedirs (pytest.fixture): Fixture providing a mocked `os.makedirs`.
+        mock_logger (pytest.fixture): Fixture providing a mocked Logger instance.
+        mock_csv_handler (pytest.fixture): Fixture providing a mocked CSVHandler instance.
+        mock_analyser (pytest.fixture): Fixture providing a mocked Analyser instance.
+        mock_printer (pytest.fixture): Fixture providing a mocked Printer instance.
+    """
+    orchestrator = TestStatisticReadWrite("in.csv", "out_dir", 3, percentiles=True)
+
+    orchestrator.run()
+
+    mock_analyser.analyze.assert_called_once_with(
+        mock_csv_handler.read_csv.return_value, 3, percentiles=True, group_by=None, top_groups=10
+    )
+    mock_printer.display_results.assert_called_once_with(mock_analyser.analyze.return_value)
+
+def test_run_group_by(mock_is_file, mock_makedirs, mock_logger, mock_csv_handler, mock_analyser, mock_printer):
+    """
+    Test-ID: D-T-ORC-GRP-001
+    Verifies that the group_by and top_groups options are passed to the Analyser, and that an invalid group key
+    raises an InvalidGroupKey exception before any file is read.
+
+    Args:
+        mock_is_file (pytest.fixture): Fixture providing a mocked `os.path.isfile`.
+        mock_makedirs (pytest.fixture): Fixture providing a mocked `os.makedirs`.
+        mock_logger (pytest.fixture): Fixture providing a mocked Logger instance.
+        mock_csv_handler (pytest.fixture): Fixture providing a mocked CSVHandler instance.
+        mock_analyser (pytest.fixture): Fixture providing a mocked Analyser instance.
+        mock_printer (pytest.fixture): Fixture providing a mocked Printer instance.
+    """
+    orchestrator = TestStatisticReadWrite("in.csv", "out_dir", 3, group_by="Requirement", top_groups=5)
+
+    orchestrator.run()
+
+    mock_analyser.analyze.assert_called_once_with(
+        mock_csv_handler.read_csv.return_value, 3, percentiles=False, group_by="Requirement", top_groups=5
+    )
+
+    with pytest.raises(InvalidGroupKey):
+        TestStatisticReadWrite("in.csv", "out_dir", 3, group_by="Status")
+    with pytest.raises(InvalidTopX):
+        TestStatisticReadWrite("in.csv", "out_dir", 3, group_by="Requirement", top_groups=-1)
+    mock_csv_handler.read_csv.assert_called_once()
+
+def test_snapshot_option(mocker, mock_is_file, mock_makedirs, mock_logger):
+    """
+    Test-ID: D-T-ORC-SNP-001
+    Verifies that the CSVHandler always gets the snapshot path next to the input CSV, so an existing snapshot
+    is loaded, and that the snapshot is only written if the snapshot option is set, also after a reset.
+
+    Args:
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        mock_is_file (pytest.fixture): Fixture providing a mocked `os.path.isfile`.
+        mock_makedirs (pytest.fixture): Fixture providing a mocked `os.makedirs`.
+        mock_logger (pytest.fixture): Fixture providing a mocked Logger instance.
+    """
+    mock_cls = mocker.patch('test_statistic_read_write.test_statistic_read_write.CSVHandler', autospec=True)
+
+    TestStatisticReadWrite("in.csv", "out_dir", 3)
+    assert mock_cls.call_args.kwargs["snapshot_path"] == "in.csv.snapshot"
+    assert mock_cls.call_args.kwargs["write_snapshot"] is False
+
+    orchestrator = TestStatisticReadWrite("in.csv", "out_dir", 3, snapshot=True)
+    orchestrator.reset()
+    assert mock_cls.call_count == 3
+    assert mock_cls.call_args.kwargs["snapshot_path"] == "in.csv.snapshot"
+    assert mock_cls.call_args.kwargs["write_snapshot"] is True
+
+def test_run_with_cache(tmp_path, mocker, capsys):
+    """
+    Test-ID: D-T-ORC-CAC-001
+    Verifies that the cached snapshot only gets the sorted index of the export sort key, that a second run on
+    the unchanged CSV neither parses nor analyzes, that other analysis options reuse the cached data, that a changed CSV is parsed again, that the cache respects its size limit,
+    and that an invalid size limit raises an InvalidCacheSize exception.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\nR2\\TC2;1 sec\nR2\\TC3;2 sec;Failed\n", encoding="utf-8")
+    cache_dir = str(tmp_path / "cache")
+
+    def run(**options):
+        orchestrator = TestStatisticReadWrite(str(csv_file), str(tmp_path / "out"), cache_dir=cache_dir, **options)
+        orchestrator.run()
+        return capsys.readouterr().out
+
+    build_index = mocker.spy(Data, "build_index")
+    first = run(top_x=2)
+    assert {call.args[1] for call in build_index.call_args_list} == {"Duration"}
+    read_serial = mocker.spy(CSVHandler, "_read_serial")
+    analyze = mocker.spy(Analyser, "analyze")
+
+    assert run(top_x=2) == first
+    read_serial.assert_not_called()
+    analyze.assert_not_called()
+    assert "1 lines were skipped." in first
+
+    run(top_x=1, sort_key="Requirement")
+    read_serial.assert_not_called()
+    analyze.assert_called_once()
+    assert len(os.listdir(cache_dir)) == 1
+    assert not os.path.exists(str(csv_file) + ".snapshot")
+
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\n", encoding="utf-8")
+    run(top_x=2, cache_size=0)
+    read_serial.assert_called_once()
+    assert os.listdir(cache_dir) == []
+
+    with pytest.raises(InvalidCacheSize):
+        TestStatisticReadWrite(str(csv_file), str(tmp_path / "out"), cache_dir=cache_dir, cache_size=-1)
+
+def test_multiple_sort_keys(mock_is_file, mock_makedirs, mock_logger, mock_csv_handler, mock_analyser, mock_printer):
+    """
+    Test-ID: D-T-ORC-MSK-001
+    Verifies that a list of sort keys is passed to the export as is, and that an empty list or a list with
+    an invalid key raises an InvalidSortingKey exception.
+
+    Args:
+        mock_is_file (pytest.fixture): Fixture providing a mocked `os.path.isfile`.
+        mock_makedirs (pytest.fixture): Fixture providing a mocked `os.makedirs`.
+        mock_logger (pytest.fixture): Fixture providing a mocked Logger instance.
+        mock_csv_handler (pytest.fixture): Fixture providing a mocked CSVHandler instance.
+        mock_analyser (pytest.fixture): Fixture providing a mocked Analyser instance.
+        mock_printer (pytest.fixture): Fixture providing a mocked Printer instance.
+    """
+    orchestrator = TestStatisticReadWrite("in.csv", "out_dir", 3, sort_key=["Duration", "Test Case", "none"])
+
+    orchestrator.run()
+
+    mock_csv_handler.read_csv.assert_called_once()
+    mock_csv_handler.export_csv.assert_called_once_with(
+        mock_csv_handler.read_csv.return_value, "out_dir", sort_key=["Duration", "Test Case", "none"],
+        compression=None, compression_level=None
+    )
+    with pytest.raises(InvalidSortingKey):
+        orchestrator.sort_key = []
+    with pytest.raises(InvalidSortingKey):
+        orchestrator.sort_key = ["Duration", "Priority"]
+    assert orchestrator.sort_key == ["Duration", "Test Case", "none"]
+
+def test_run_compressed(tmp_path, capsys):
+    """
+    Test-ID: D-T-ORC-CMP-001
+    Verifies that a run on a gzip compressed CSV exports an xz compressed CSV named after the uncompressed input,
+    and that an unsupported compression or an invalid compression level raises an InvalidCompression exception.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+    """
+    csv_file = tmp_path / "input.csv.gz"
+    csv_file.write_bytes(gzip.compress(b"Test case;Duration;Status\nR1\\TC1;3 sec;Passed\nR2\\TC2;1 sec;Failed\n"))
+
+    TestStatisticReadWrite(str(csv_file), str(tmp_path / "out"), compression="xz", compression_level=9).run()
+
+    assert os.listdir(tmp_path / "out") == ["input_sorted_by_Duration.csv.xz"]
+    assert lzma.decompress((tmp_path / "out" / "input_sorted_by_Duration.csv.xz").read_bytes()) == \
+           b"Requirement;Test Case;Duration;Status\nR2;TC2;1;Failed\nR1;TC1;3;Passed\n"
+    assert "Total Duration" in capsys.readouterr().out
+
+    for options in [{"compression": "zip"}, {"compression": "bz2", "compression_level": 0}, {"compression_level": 5}]:
+        with pytest.raises(InvalidCompression):
+            TestStatisticReadWrite(str(csv_file), str(tmp_path / "out"), **options)
+
+def test_run_multiple_files(tmp_path, mocker, capsys):
+    """
+    Test-ID: D-T-ORC-MUL-001
+    Verifies that a folder, a glob pattern or a list of files is read as merged input without using the cache,
+    that the export of a folder is named after it, and that an input without files raises an InputFileNotFound exception.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+    """
+    folder = tmp_path / "nightly"
+    folder.mkdir()
+    (folder / "station1.csv").write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\n", encoding="utf-8")
+    (folder / "station2.csv").write_text("Test case;Duration;Status\nR2\\TC2;1 sec;Failed\nR2\\TC3;2 sec\n", encoding="utf-8")
+    store_result = mocker.spy(TestStatisticReadWrite, "_store_result")
+
+    orchestrator = TestStatisticReadWrite(str(folder), str(tmp_path / "out"), sort_key=["Requirement", "none"],
+                                          cache_dir=str(tmp_path / "cache"))
+    orchestrator.run()
+
+    assert orchestrator.csv_paths == [str(folder / "station1.csv"), str(folder / "station2.csv")]
+    assert sorted(os.listdir(tmp_path / "out")) == ["nightly_.csv", "nightly_sorted_by_Requirement.csv"]
+    assert (tmp_path / "out" / "nightly_.csv").read_text(encoding="utf-8") == \
+           "Requirement;Test Case;Duration;Status\nR1;TC1;3;Passed\nR2;TC2;1;Failed\n"
+    assert "Line station2.csv:3 skipped" in capsys.readouterr().out
+    store_result.assert_not_called()
+    assert not os.path.exists(tmp_path / "cache")
+
+    for csv_path in [str(folder / "*.csv"), [str(folder / "station2.csv"), str(folder / "station1.csv")]]:
+        orchestrator = TestStatisticReadWrite(csv_path, str(tmp_path / "out"), report_only=True)
+        orchestrator.run()
+        assert "Total Duration" in capsys.readouterr().out
+    assert orchestrator.csv_paths == [str(folder / "station2.csv"), str(folder / "station1.csv")]
+
+    for csv_path in [str(tmp_path / "out" / "*.json"), [], str(tmp_path / "cache")]:
+        with pytest.raises(InputFileNotFound):
+            TestStatisticReadWrite(csv_path, str(tmp_path / "out"))
+
+@pytest.mark.parametrize("report_only", [False, True])
+def test_run_follow(tmp_path, mocker, capsys, report_only):
+    """
+    Test-ID: D-T-ORC-FOL-001
+    Verifies that in follow mode the results are displayed after the first read and again after lines were appended,
+    updated per entry without re-analyzing all entries, that the lines appended before Ctrl+C are read and the CSV is exported then (not in report-only mode), and that
+    several input files or an invalid refresh interval raise an InvalidFollowMode exception.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+        report_only (bool): Whether the run is report-only.
+    """
+    csv_file = tmp_path / "running.csv"
+    csv_file.write_text("Test case;Duration;Status\nR1\\TC1;3 sec;Passed\n", encoding="utf-8")
+    appended = ["R2\\TC2;1 sec;Failed\nR2\\TC3;2 sec\n", "", KeyboardInterrupt, "R3\\TC4;5 sec;Passed\n"]
+
+    def sleep(seconds):
+        assert seconds == 0.5
+        text = appended.pop(0)
+        with open(csv_file, "a", encoding="utf-8") as f:
+            f.write(appended.pop(0) if text is KeyboardInterrupt else text)
+        if text is KeyboardInterrupt:
+            raise KeyboardInterrupt
+    mocker.patch("test_statistic_read_write.test_statistic_read_write.time.sleep", side_effect=sleep)
+    cache_entry = mocker.spy(TestStatisticReadWrite, "_cache_entry")
+    analyze = mocker.spy(Analyser, "analyze")
+
+    TestStatisticReadWrite(str(csv_file), None if report_only else str(tmp_path / "out"), top_x=1, report_only=report_only,
+                           follow=True, refresh_interval=0.5, cache_dir=str(tmp_path / "cache")).run()
+
+    out = capsys.readouterr().out
+    assert out.count("Total Duration") == 3
+    assert out.index("Total Duration: 3.000") < out.index("Total Duration: 4.000") < out.index("Total Duration: 9.000")
+    assert "1 lines were skipped." in out
+    cache_entry.assert_not_called()
+    analyze.assert_not_called()
+    if report_only:
+        assert not os.path.exists(tmp_path / "out")
+    else:
+        assert (tmp_path / "out" / "running_sorted_by_Duration.csv").read_text(encoding="utf-8") == \
+               "Requirement;Test Case;Duration;Status\nR2;TC2;1;Failed\nR1;TC1;3;Passed\nR3;TC4;5;Passed\n"
+
+    (tmp_path / "other.csv").write_text("Test case;Duration;Status\n", encoding="utf-8")
+    for options in [{"csv_path": str(tmp_path / "*.csv")}, {"refresh_interval": 0}, {"refresh_interval": "5"}]:
+        with pytest.raises(InvalidFollowMode):
+            TestStatisticReadWrite(**{"csv_path": str(csv_file), "output_folder": str(tmp_path / "out"), "follow": True, **options})
+
+def test_run_follow_interrupted_while_reading(tmp_path, mocker, capsys):
+    """
+    Test-ID: D-T-ORC-FOL-002
+    Verifies that a Ctrl+C while the first read of the followed CSV is still parsing stops following without
+    waiting, that the remaining lines are read once (no duplicated entries or skipped lines), also the last line
+    without line ending, and that the results are displayed and the CSV is exported.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+    """
+    csv_file = tmp_path / "running.csv"
+    lines = [f"R{i}\\TC{i};{i + 1} sec" + ("" if i % 10 == 4 else ";Passed") for i in range(30)]
+    csv_file.write_text("Test case;Duration;Status\n" + "\n".join(lines), encoding="utf-8")
+    add_entry = Data.add_entry
+    calls = []
+
+    def interrupted_add_entry(self, key, entry):
+        calls.append(key)
+        if len(calls) == 8:
+            raise KeyboardInterrupt
+        add_entry(self, key, entry)
+    mocker.patch.object(Data, "add_entry", interrupted_add_entry)
+    sleep = mocker.patch("test_statistic_read_write.test_statistic_read_write.time.sleep")
+
+    TestStatisticReadWrite(str(csv_file), str(tmp_path / "out"), top_x=1, follow=True, refresh_interval=0.5).run()
+
+    sleep.assert_not_called()
+    out = capsys.readouterr().out
+    assert out.count("Total Duration") == 1
+    assert "3 lines were skipped." in out
+    exported = (tmp_path / "out" / "running_sorted_by_Duration.csv").read_text(encoding="utf-8").splitlines()
+    assert exported[1:] == [f"R{i};TC{i};{i + 1};Passed" for i in range(30) if i % 10 != 4]
+
+def test_run_checkpoint(tmp_path, mocker, capsys):
+    """
+    Test-ID: D-T-ORC-CKP-001
+    Verifies that with `checkpoint` the input CSV is parsed with checkpoints next to it (also with a cache folder),
+    that a run resumes from the checkpoint of an interrupted run and removes it, and that an invalid checkpoint
+    interval raises an InvalidCheckpointInterval exception.
+
+    Args:
+        tmp_path (pathlib.Path): Fixture providing a temporary directory.
+        mocker (pytest_mock.plugin.MockerFixture): Fixture for mocking objects.
+        capsys (pytest.CaptureFixture): Fixture capturing the console output.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Test case;Duration;Status\n" + "R1\\TC1;3 sec;Passed\nR2\\TC2;1 sec;Failed\n" * 20, encoding="utf-8")
+    mocker.patch.object(CSVHandler, "PARALLEL_CHUNK_SIZE", 64)
+    read_checkpointed = mocker.spy(CSVHandler, "_read_checkpointed")
+
+    handler = CSVHandler(str(csv_file), checkpoint_path=str(csv_file) + ".checkpoint", checkpoint_interval=200)
+    parse_fields = handler._parse_fields
+    calls = iter(range(1, 100))
+    def parse_fields_and_kill(*args):
+        if next(calls) == 26:
+            raise KeyboardInterrupt
+        return parse_fields(*args)
+    mocker.patch.object(handler, "_parse_fields", side_effect=parse_fields_and_kill)
+    with pytest.raises(KeyboardInterrupt):
+        handler.read_csv()
+    assert os.path.isfile(str(csv_file) + ".checkpoint")
+
+    TestStatisticReadWrite(str(csv_file), str(tmp_path / "out"), checkpoint=True, checkpoint_interval=200,
+                           cache_dir=str(tmp_path / "cache")).run()
+
+    assert read_checkpointed.call_count == 2
+    assert not os.path.exists(str(csv_file) + ".checkpoint")
+    assert (tmp_path / "out" / "input_sorted_by_Duration.csv").read_text(encoding="utf-8") == \
+           "Requirement;Test Case;Duration;Status\n" + "R2;TC2;1;Failed\n" * 20 + "R1;TC1;3;Passed\n" * 20
+    assert "Total Duration: 80.000" in capsys.readouterr().out
+
+    for checkpoint_interval in [0, "1"]:
+        with pytest.raises(InvalidCheckpointInterval):
+            TestStatisticReadWrite(str(csv_file), str(tmp_path / "out"), checkpoint=True, checkpoint_interval=checkpoint_interval)